@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Build the type-ahead term dictionary for the search box
+
+One sorted dictionary of completions: every search term (tokenized like
+search_index.py), every restored name from the Hebrew names lexicon as a
+phrase ("yahuah elohiym"), and the KJV wording each name replaced
+("lord god") as an alias pointing at the restored name. Entries carry
+their occurrence count in the corpus, so "yah" completes to "Yahuah",
+"Yahuah Elohiym", "Yahusha", ... in frequency order.
+
+Output (--out, next to the search index):
+  {"version": 1, "count": N, "block_size": 16,
+   "blocks": [["aaron", [4, "s"], [5, "ic"], ...], ...],   front-coded keys
+   "freq": [...],                  occurrences per entry, in key order
+   "names": [...],                 entry ids flagged as restored names
+   "display": {"id": "Yahuah Elohiym", ...},   casing for names/aliases
+   "alias": {"id": target_id, ...},            KJV wording -> restored name
+   "lexicon": {"id": "yahuah-elohiym", ...},   entry -> hebrew_names.json id
+   "top": {"y": [...], "ya": [...], ...}}      best ids for 1-2 char prefixes
+
+Within a block each key after the first is [shared prefix length, suffix].
+Keys are normalized terms joined by single spaces; the first key of every
+block is stored whole so a lookup binary-searches the block heads and
+decodes one or two blocks.
+
+Usage:
+  python autocomplete.py ../frontend/public/translations/
+  python autocomplete.py ../frontend/public/translations/ --suggest yah
+"""
+
+import argparse
+import bisect
+import io
+import json
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+from corpus import load_json, open_corpus
+from ordinals import iter_verses
+from search_index import iter_tokens, tokenize
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+AUTOCOMPLETE_FILE = "autocomplete.json"
+BLOCK_SIZE = 16
+TOP_PREFIX_LEN = 2
+TOP_COUNT = 10
+NAME_BOOST = 4
+
+
+def entry_key(text: str) -> str:
+    return " ".join(tokenize(text))
+
+
+def load_names(lexicon_path: str) -> Dict[str, dict]:
+    """{key: lexicon entry} for every name label in hebrew_names.json"""
+    names = {}
+    for entry in load_json(lexicon_path)["names"]:
+        key = entry_key(entry["label"])
+        if key:
+            names.setdefault(key, entry)
+    return names
+
+
+def load_aliases(config_path: str, name_tokens: set) -> Dict[str, Tuple[str, str]]:
+    """
+    {alias key: (display, target key)} from the restore_names.py rules whose
+    replacement is made of restored-name words ("LORD GOD" -> "Yahuah
+    Elohiym"). Earlier rules win, as they do when restoring.
+    """
+    aliases: Dict[str, Tuple[str, str]] = {}
+    if not config_path or not os.path.exists(config_path):
+        return aliases
+    for rule in load_json(config_path).get("rules", []):
+        target = entry_key(rule.get("replacement", ""))
+        if not target or not all(token in name_tokens for token in target.split()):
+            continue
+        display = re.sub(r"\s*\(.*\)$", "", rule.get("description", "")).strip()
+        display = re.sub(r"['’][sS]$", "", display)
+        key = entry_key(display)
+        if key and key != target:
+            aliases.setdefault(key, (display, target))
+    return aliases
+
+
+def count_entries(corpus, phrases: Sequence[str]) -> Dict[str, int]:
+    """Occurrences of every term and of each multi-word phrase, in one pass"""
+    counts: Dict[str, int] = defaultdict(int)
+    by_first: Dict[str, List[List[str]]] = defaultdict(list)
+    for phrase in phrases:
+        tokens = phrase.split()
+        if len(tokens) > 1:
+            by_first[tokens[0]].append(tokens)
+
+    for _ordinal, _book, _chapter, _verse, text in iter_verses(corpus):
+        tokens = tokenize(text)
+        for i, term in enumerate(tokens):
+            counts[term] += 1
+            for phrase in by_first.get(term, ()):
+                if tokens[i:i + len(phrase)] == phrase:
+                    counts[" ".join(phrase)] += 1
+    return counts
+
+
+def front_code(keys: List[str], block_size: int = BLOCK_SIZE) -> List[list]:
+    blocks = []
+    for start in range(0, len(keys), block_size):
+        block: list = [keys[start]]
+        previous = keys[start]
+        for key in keys[start + 1:start + block_size]:
+            shared = 0
+            limit = min(len(previous), len(key))
+            while shared < limit and previous[shared] == key[shared]:
+                shared += 1
+            block.append([shared, key[shared:]])
+            previous = key
+        blocks.append(block)
+    return blocks
+
+
+def rank(freq: int, is_name: bool) -> int:
+    return freq * NAME_BOOST if is_name else freq
+
+
+def build_autocomplete(corpus, names: Dict[str, dict], aliases: Dict[str, Tuple[str, str]],
+                       block_size: int = BLOCK_SIZE) -> dict:
+    counts = count_entries(corpus, list(names) + list(aliases))
+
+    entries: Dict[str, int] = {term: count for term, count in counts.items() if " " not in term}
+    for key in names:
+        entries[key] = counts.get(key, 0)
+    for key, (_display, target) in aliases.items():
+        # KJV wording no longer occurs in the restored text; rank it by its target
+        entries[key] = max(entries.get(key, 0), counts.get(target, 0))
+
+    keys = sorted(entries)
+    ids = {key: i for i, key in enumerate(keys)}
+    name_tokens = {token for key in names for token in key.split()}
+    flagged = sorted(ids[key] for key in keys if key in names or key in name_tokens)
+    flagged_set = set(flagged)
+
+    display = {}
+    lexicon = {}
+    for key, entry in names.items():
+        display[str(ids[key])] = entry["label"]
+        lexicon[str(ids[key])] = entry["id"]
+        # Words of a name ("Yahusha" in "Yahusha Ha'Mashiach") keep its casing;
+        # words that never occur in the corpus are not entries
+        for token, start, end in iter_tokens(entry["label"]):
+            if token in ids:
+                display.setdefault(str(ids[token]), entry["label"][start:end])
+    alias = {}
+    for key, (label, target) in aliases.items():
+        if target in ids:
+            display.setdefault(str(ids[key]), label)
+            alias[str(ids[key])] = ids[target]
+
+    by_prefix: Dict[str, List[int]] = defaultdict(list)
+    for i, key in enumerate(keys):
+        for n in range(1, TOP_PREFIX_LEN + 1):
+            if len(key) >= n:
+                by_prefix[key[:n]].append(i)
+    top = {}
+    for prefix, members in sorted(by_prefix.items()):
+        members.sort(key=lambda i: (-rank(entries[keys[i]], i in flagged_set), i))
+        top[prefix] = members[:TOP_COUNT]
+
+    return {
+        "version": 1,
+        "count": len(keys),
+        "block_size": block_size,
+        "blocks": front_code(keys, block_size),
+        "freq": [entries[key] for key in keys],
+        "names": flagged,
+        "display": display,
+        "alias": alias,
+        "lexicon": lexicon,
+        "top": top,
+    }
+
+
+class Autocomplete:
+    """Reference lookup over an autocomplete.json dictionary"""
+
+    def __init__(self, data: dict):
+        self.data = data
+        self.block_size: int = data["block_size"]
+        self.blocks: List[list] = data["blocks"]
+        self.heads: List[str] = [block[0] for block in self.blocks]
+        self.freq: List[int] = data["freq"]
+        self.names = set(data["names"])
+        self.display: Dict[str, str] = data["display"]
+        self.alias: Dict[str, int] = data["alias"]
+        self.top: Dict[str, List[int]] = data["top"]
+
+    @classmethod
+    def load(cls, path: str) -> "Autocomplete":
+        with io.open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _block_keys(self, block_idx: int) -> List[str]:
+        block = self.blocks[block_idx]
+        keys = [block[0]]
+        for shared, suffix in block[1:]:
+            keys.append(keys[-1][:shared] + suffix)
+        return keys
+
+    def key(self, entry_id: int) -> str:
+        return self._block_keys(entry_id // self.block_size)[entry_id % self.block_size]
+
+    def prefix_range(self, prefix: str) -> List[int]:
+        """Entry ids whose key starts with prefix, in key order"""
+        block_idx = max(0, bisect.bisect_right(self.heads, prefix) - 1)
+        matches = []
+        while block_idx < len(self.blocks):
+            for offset, key in enumerate(self._block_keys(block_idx)):
+                if key.startswith(prefix):
+                    matches.append(block_idx * self.block_size + offset)
+                elif key > prefix:
+                    return matches
+            block_idx += 1
+        return matches
+
+    def _entry(self, entry_id: int) -> dict:
+        key = self.key(entry_id)
+        entry = {
+            "text": self.display.get(str(entry_id), key),
+            "key": key,
+            "freq": self.freq[entry_id],
+            "name": entry_id in self.names,
+        }
+        target = self.alias.get(str(entry_id))
+        if target is not None:
+            entry["alias_of"] = self.display.get(str(target), self.key(target))
+        return entry
+
+    def suggest(self, text: str, limit: int = 8) -> List[dict]:
+        """
+        Completions for what the user has typed so far, best first:
+        [{"text", "key", "freq", "name", "alias_of"?}, ...]
+        """
+        prefix = entry_key(text)
+        if not prefix:
+            return []
+        if text[-1:].isspace():
+            prefix += " "
+        if prefix in self.top:
+            ids = self.top[prefix][:limit]
+        else:
+            ids = sorted(
+                self.prefix_range(prefix),
+                key=lambda i: (-rank(self.freq[i], i in self.names), i),
+            )[:limit]
+        return [self._entry(i) for i in ids]
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the type-ahead term dictionary")
+    parser.add_argument("corpus", help="Translation directory or full-Bible JSON")
+    parser.add_argument("--lexicon", default="../frontend/public/lexicons/hebrew_names.json", help="Hebrew names lexicon")
+    parser.add_argument("--config", default="config/restored_names_config.json", help="Restoration rules (alias source)")
+    parser.add_argument("--out", default=f"../frontend/public/translations/index/{AUTOCOMPLETE_FILE}", help="Output path")
+    parser.add_argument("--suggest", action="append", default=[], help="Print completions for this input after building")
+    args = parser.parse_args(argv)
+
+    for path in (args.corpus, args.lexicon):
+        if not os.path.exists(path):
+            print(f"Error: {path} not found!")
+            return 1
+
+    start = time.perf_counter()
+    names = load_names(args.lexicon)
+    name_tokens = {token for key in names for token in key.split()}
+    aliases = load_aliases(args.config, name_tokens)
+    data = build_autocomplete(open_corpus(args.corpus), names, aliases)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with io.open(args.out, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    print(f"✓ Autocomplete: {data['count']} entries ({len(names)} names, {len(data['alias'])} aliases), "
+          f"{os.path.getsize(args.out) / 1024:.0f} KB in {time.perf_counter() - start:.2f}s")
+
+    if args.suggest:
+        autocomplete = Autocomplete(data)
+        for text in args.suggest:
+            start = time.perf_counter()
+            suggestions = autocomplete.suggest(text)
+            elapsed = (time.perf_counter() - start) * 1000
+            formatted = ", ".join(
+                s["text"] + (f" → {s['alias_of']}" if "alias_of" in s else "") for s in suggestions
+            )
+            print(f"  '{text}' ({elapsed:.3f} ms): {formatted}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
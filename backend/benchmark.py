@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for build artifacts and backend data paths
+
+Usage:
+  python benchmark.py schema ../frontend/public/translations/
+  python benchmark.py fuzzy ../frontend/public/translations/ ../frontend/public/translations/index/
+  python benchmark.py search ../frontend/public/translations/index/
+  python benchmark.py emphasis ../frontend/public/translations/
+  python benchmark.py headers ../frontend/public/translations/ --books Genesis
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from typing import Callable, List, Sequence
+
+from corpus import open_corpus, to_array_book
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    """Best wall time of fn() over repeat runs, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def print_table(headers: Sequence[str], rows: List[Sequence[object]]) -> None:
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(c).rjust(w) if i else str(c).ljust(w) for i, (c, w) in enumerate(zip(row, widths))))
+
+
+def bench_schema(args: argparse.Namespace) -> int:
+    """Payload size and parse time of the object vs array chapter schema"""
+    corpus = open_corpus(args.corpus)
+    full = {book: chapters for book, chapters in corpus.items()}
+    arrays = {book: to_array_book(chapters) for book, chapters in full.items()}
+
+    variants = [
+        ("object (indent=2)", json.dumps(full, indent=2, ensure_ascii=False)),
+        ("object (compact)", json.dumps(full, ensure_ascii=False, separators=(",", ":"))),
+        ("array (compact)", json.dumps(arrays, ensure_ascii=False, separators=(",", ":"))),
+    ]
+
+    rows = []
+    for label, payload in variants:
+        raw = payload.encode("utf-8")
+        parse = best_of(lambda: json.loads(payload), args.repeat)
+        rows.append((
+            label,
+            f"{len(raw) / 1024:.0f} KB",
+            f"{len(gzip.compress(raw, 9)) / 1024:.0f} KB",
+            f"{parse * 1000:.1f} ms",
+        ))
+
+    # Consumers of the object schema re-sort keys by int; arrays are already ordered
+    def walk_object():
+        for chapters in full.values():
+            for ch in sorted(chapters, key=int):
+                for _ in sorted(chapters[ch], key=int):
+                    pass
+
+    def walk_array():
+        for book in arrays.values():
+            for chapter in book:
+                for _ in chapter or ():
+                    pass
+
+    print(f"Corpus: {args.corpus} ({len(full)} books, best of {args.repeat})\n")
+    print_table(("schema", "size", "gzip -9", "json parse"), rows)
+    print(f"\nOrdered verse walk: object {best_of(walk_object, args.repeat) * 1000:.1f} ms, "
+          f"array {best_of(walk_array, args.repeat) * 1000:.1f} ms")
+    return 0
+
+
+FUZZY_QUERIES = ["Yahushua", "Elohim", "Yahuah", "Mashiak", "beginnig", "Qodesh", "rightousness", "Yahusha Mashiach"]
+
+
+def fuse_default_match(text: str, pattern: str, threshold: float = 0.3, distance: int = 100) -> bool:
+    """
+    Approximate Search.tsx's Fuse options (threshold 0.3, default location 0
+    and distance 100): bitap with up to threshold × len errors, scored as
+    errors/len + location/distance. Like Fuse, only the start of the text
+    that can still score under the threshold is scanned.
+    """
+    m = len(pattern)
+    if m == 0 or m > 31:
+        return False
+    max_errors = int(threshold * m)
+    masks: dict = {}
+    for i, ch in enumerate(pattern):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    goal = 1 << (m - 1)
+    rows = [0] * (max_errors + 1)
+    scan_to = min(len(text), m + int(threshold * distance))
+    for j in range(scan_to):
+        char_mask = masks.get(text[j], 0)
+        previous = rows[0]
+        rows[0] = ((rows[0] << 1) | 1) & char_mask
+        for e in range(1, max_errors + 1):
+            current = rows[e]
+            rows[e] = (((current << 1) | 1) & char_mask) | ((previous | rows[e - 1]) << 1) | 1 | previous
+            previous = current
+        for e in range(max_errors + 1):
+            if rows[e] & goal:
+                location = max(0, j - m + 1)
+                if e / m + location / distance <= threshold:
+                    return True
+                break
+    return False
+
+
+def bench_fuzzy(args: argparse.Namespace) -> int:
+    """Trigram candidate terms + exact postings vs a Fuse-style scan of every verse"""
+    from fuzzy_index import TRIGRAMS_FILE, TrigramIndex, fuzzy_search
+    from ordinals import iter_verses
+    from search_index import ShardedIndex
+
+    index = ShardedIndex(args.index_dir)
+    start = time.perf_counter()
+    trigram_index = TrigramIndex.load(os.path.join(args.index_dir, TRIGRAMS_FILE))
+    load_ms = (time.perf_counter() - start) * 1000
+    verses = [(ordinal, text.lower()) for ordinal, _b, _c, _v, text in iter_verses(open_corpus(args.corpus))]
+
+    rows = []
+    for query in args.queries or FUZZY_QUERIES:
+        pattern = query.lower()
+        start = time.perf_counter()
+        fuse_hits = {ordinal for ordinal, text in verses if fuse_default_match(text, pattern)}
+        fuse_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        trigram_hits = set(fuzzy_search(index, trigram_index, query))
+        trigram_ms = (time.perf_counter() - start) * 1000
+
+        covered = len(fuse_hits & trigram_hits) / len(fuse_hits) if fuse_hits else 1.0
+        rows.append((query, len(fuse_hits), f"{fuse_ms:.1f} ms", len(trigram_hits),
+                     f"{trigram_ms:.2f} ms", f"{covered:.0%}"))
+
+    print(f"Corpus: {args.corpus}, {len(verses)} verses; trigram index loaded in {load_ms:.1f} ms\n")
+    print_table(("query", "fuse-style hits", "scan", "trigram hits", "trigram", "fuse hits covered"), rows)
+    print("\nFuse-style = bitap over each verse with Search.tsx options (threshold 0.3, location 0, distance 100).")
+    return 0
+
+
+SEARCH_QUERIES = [
+    ("Yahuah", {}), ("Yahuah Elohiym", {}), ("faith hope charity", {}), ("in the beginning", {}),
+    ("love one another", {}), ("Ruach Ha'Qodesh", {}), ("light", {"scope": "chapter", "book": "Genesis", "chapter": "1"}),
+    ("shepherd", {"scope": "book", "book": "Psalms"}), ("covenant", {"category": "old-testament"}),
+    ("grace", {"category": "new-testament"}), ("spirit", {"category": "names"}),
+    ("blessed are the meek", {}), ("the lord is my shepherd", {}), ("and", {}),
+]
+
+
+def bench_search(args: argparse.Namespace) -> int:
+    """
+    BM25 query latency of the search package; fails when over budget.
+
+    The budget applies to cold queries: the engine's postings LRU is
+    cleared before every timed run, so each query decodes and scores its
+    terms from the mapped shards as a first search would. Warm (cached)
+    times are reported alongside.
+    """
+    from search import SearchEngine
+
+    start = time.perf_counter()
+    engine = SearchEngine(args.index_dir)
+    engine.norms
+    engine.name_verses()
+    engine.index.load_shards()
+    load_ms = (time.perf_counter() - start) * 1000
+
+    rows = []
+    cold_times = []
+    for query, filters in SEARCH_QUERIES:
+        runs = []
+        for _ in range(args.repeat):
+            engine.clear_cache()
+            start = time.perf_counter()
+            hits = engine.search(query, **filters)
+            runs.append((time.perf_counter() - start) * 1000)
+        cold_times.extend(runs)
+        warm = best_of(lambda: engine.search(query, **filters), args.repeat) * 1000
+        label = query + (f" ({', '.join(f'{k}={v}' for k, v in filters.items())})" if filters else "")
+        rows.append((label, len(hits), f"{sorted(runs)[len(runs) // 2]:.2f} ms", f"{max(runs):.2f} ms", f"{warm:.2f} ms"))
+
+    cold_times.sort()
+    p95 = cold_times[min(len(cold_times) - 1, int(len(cold_times) * 0.95))]
+    print(f"Index: {args.index_dir}, {engine.documents} verses; loaded in {load_ms:.1f} ms "
+          f"({args.repeat} cold runs per query)\n")
+    print_table(("query", "results", "cold median", "cold max", "warm"), rows)
+    print(f"\nCold query p95: {p95:.2f} ms (budget {args.budget_ms:g} ms), slowest {cold_times[-1]:.2f} ms")
+    if p95 > args.budget_ms:
+        print("✗ Over budget")
+        return 1
+    return 0
+
+
+def legacy_bold_names(text: str, names: Sequence[str]) -> str:
+    """generate_pdf's former per-name str.replace chain (nests <b> inside longer names)"""
+    for name in names:
+        text = text.replace(name, f"<b>{name}</b>")
+    return text
+
+
+def legacy_name_runs(text: str, names: Sequence[str]) -> List[tuple]:
+    """generate_docx's former find-every-name loop, as (text, is_name) runs"""
+    runs = []
+    while text:
+        earliest_pos, earliest_name = len(text), None
+        for name in names:
+            pos = text.find(name)
+            if pos != -1 and pos < earliest_pos:
+                earliest_pos, earliest_name = pos, name
+        if earliest_name is None:
+            runs.append((text, False))
+            break
+        if earliest_pos:
+            runs.append((text[:earliest_pos], False))
+        runs.append((earliest_name, True))
+        text = text[earliest_pos + len(earliest_name):]
+    return runs
+
+
+def bench_emphasis(args: argparse.Namespace) -> int:
+    """Name emphasis for the PDF and DOCX renderers over every verse"""
+    from name_emphasis import EMPHASIS_NAMES, bold_names, name_segments
+    from ordinals import iter_verses
+
+    verses = [text for _o, _b, _c, _v, text in iter_verses(open_corpus(args.corpus))]
+    variants = [
+        ("PDF markup", lambda: [legacy_bold_names(t, EMPHASIS_NAMES) for t in verses],
+         lambda: [bold_names(t) for t in verses]),
+        ("DOCX runs", lambda: [legacy_name_runs(t, EMPHASIS_NAMES) for t in verses],
+         lambda: [list(name_segments(t)) for t in verses]),
+    ]
+    rows = []
+    for label, legacy, single_pass in variants:
+        before = best_of(legacy, args.repeat)
+        after = best_of(single_pass, args.repeat)
+        rows.append((label, f"{before * 1000:.1f} ms", f"{after * 1000:.1f} ms", f"{before / after:.1f}x"))
+
+    nested = sum("<b><b>" in legacy_bold_names(t, EMPHASIS_NAMES) or "</b></b>" in legacy_bold_names(t, EMPHASIS_NAMES)
+                 for t in verses)
+    print(f"Corpus: {args.corpus}, {len(verses)} verses (best of {args.repeat})\n")
+    print_table(("renderer", "per-name passes", "single pass", "speedup"), rows)
+    print(f"\nLegacy PDF markup nested <b> tags in {nested} verses; the single pass emits one tag per name.")
+    return 0
+
+
+def bench_headers(args: argparse.Namespace) -> int:
+    """PDF layout cost of running headers: heading hooks vs a marker flowable per verse"""
+    from reportlab.platypus import Flowable, PageBreak
+    from generate_pdf import PageRecorder, book_flowables, draw_running_header, pdf_document, pdf_styles
+    from references import select_corpus
+
+    books = args.books or ["Genesis"]
+    bible_data = select_corpus(open_corpus(args.corpus), books)
+    styles = pdf_styles()
+
+    class VerseMark(Flowable):
+        """Zero-size flowable noting the book and chapter of the verse after it"""
+
+        def __init__(self, state, book, chapter):
+            Flowable.__init__(self)
+            self.state, self.book, self.chapter = state, book, chapter
+
+        def wrap(self, available_width, available_height):
+            return 0, 0
+
+        def draw(self):
+            self.state[:] = [self.book, self.chapter]
+
+    def flowables(marks=None):
+        elements = []
+        for book_name, chapters in bible_data.items():
+            if elements:
+                elements.append(PageBreak())
+            chapter = None
+            for flowable in book_flowables(book_name, chapters, styles):
+                chapter = getattr(flowable, 'bible_chapter', chapter)
+                if marks is not None:
+                    elements.append(VerseMark(marks, book_name, chapter))
+                elements.append(flowable)
+        return elements
+
+    def layout(variant):
+        """Seconds spent in doc.build (flowables are made beforehand) and the page count"""
+        state = [None, None]
+        elements = flowables(state if variant == "marks" else None)
+        doc = pdf_document(os.devnull)
+        if variant == "record":
+            PageRecorder(doc)
+        elif variant == "hooks":
+            PageRecorder(doc, on_page=draw_running_header)
+        elif variant == "marks":
+            def after_page():
+                doc.canv.saveState()
+                draw_running_header(doc.canv, state[0], state[1])
+                doc.canv.restoreState()
+            doc.afterPage = after_page
+        start = time.perf_counter()
+        doc.build(elements)
+        return time.perf_counter() - start, doc.page
+
+    variants = [
+        ("no running header", "none"),
+        ("heading hooks, recording only", "record"),
+        ("heading hooks (PageRecorder)", "hooks"),
+        ("marker flowable per verse", "marks"),
+    ]
+    # Variants take turns so drift in machine load hits them alike
+    best = {variant: float("inf") for _label, variant in variants}
+    pages = {}
+    for _ in range(args.repeat):
+        for _label, variant in variants:
+            seconds, pages[variant] = layout(variant)
+            best[variant] = min(best[variant], seconds)
+    baseline = best["none"]
+    rows = [
+        (label, f"{best[variant]:.2f} s", f"{(best[variant] / baseline - 1) * 100:+.1f}%", pages[variant])
+        for label, variant in variants
+    ]
+
+    verses = sum(len(verses) for chapters in bible_data.values() for verses in chapters.values())
+    print(f"Corpus: {args.corpus}, {', '.join(books)}: {verses} verses (best of {args.repeat})\n")
+    print_table(("running header", "layout", "overhead", "pages"), rows)
+    return 0
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks for build artifacts")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is reported)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_schema = sub.add_parser("schema", help="Object vs array chapter schema")
+    p_schema.add_argument("corpus", help="Translation directory or full-Bible JSON")
+    p_schema.set_defaults(func=bench_schema)
+
+    p_fuzzy = sub.add_parser("fuzzy", help="Trigram fuzzy search vs Fuse-style verse scan")
+    p_fuzzy.add_argument("corpus", help="Translation directory or full-Bible JSON")
+    p_fuzzy.add_argument("index_dir", help="search_index.py directory with trigrams.json")
+    p_fuzzy.add_argument("queries", nargs="*", help="Queries (default: common restored-name misspellings)")
+    p_fuzzy.set_defaults(func=bench_fuzzy)
+
+    p_search = sub.add_parser("search", help="BM25 query latency against a time budget")
+    p_search.add_argument("index_dir", help="search_index.py directory")
+    p_search.add_argument("--budget-ms", type=float, default=5.0, help="Cold query p95 budget (default: 5)")
+    p_search.set_defaults(func=bench_search)
+
+    p_emphasis = sub.add_parser("emphasis", help="Single-pass name emphasis vs per-name replace/find")
+    p_emphasis.add_argument("corpus", help="Translation directory or full-Bible JSON")
+    p_emphasis.set_defaults(func=bench_emphasis)
+
+    p_headers = sub.add_parser("headers", help="PDF running-header overhead: heading hooks vs per-verse markers")
+    p_headers.add_argument("corpus", help="Translation directory or full-Bible JSON")
+    p_headers.add_argument("--books", action="append", default=None, help="Books or ranges to lay out (default: Genesis)")
+    p_headers.set_defaults(func=bench_headers)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Build precomputed concordance tables for the Concordance route
+
+For every word form: total occurrences, counts per testament and per book,
+and the verses it occurs in. A lookup becomes one small fetch of the word's
+shard (words sharing their first --prefix-len characters) instead of a
+RegExp scan over every verse.
+
+Word forms come from the search tokenizer (search_index.iter_tokens), which
+matches the route's case-insensitive \\bword\\b semantics: "Yahuah's" counts
+for "yahuah" and "Ha'Mashiach" for "mashiach".
+
+Output (in --out_dir):
+  index.json      prefix_len, shards with word counts, corpus totals
+  verses.json     ordinal <-> book/chapter/verse map (see ordinals.py)
+  <prefix>.json   {word: {"total", "ot", "nt", "extras", "books", "verses", "counts"}}
+
+"verses" holds delta-encoded verse ordinals (first value absolute) and
+"counts" the occurrences per listed verse, omitted when every verse has one.
+
+Usage:
+  python concordance.py ../frontend/public/translations/ --out_dir ../frontend/public/translations/concordance/
+  python concordance.py ../frontend/public/translations/ --prefix-len 3 --lookup Yahuah
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Sequence
+
+from corpus import open_corpus
+from ordinals import VerseMap, book_entry, testament_of
+from search_index import iter_tokens, normalize_word, shard_key
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+# Two characters keep the shards of common initials ("t", "s", "a") small
+DEFAULT_PREFIX_LEN = 2
+
+
+class WordStats:
+    __slots__ = ("total", "testaments", "books", "verses", "counts")
+
+    def __init__(self):
+        self.total = 0
+        self.testaments: Dict[str, int] = defaultdict(int)
+        self.books: Dict[str, int] = {}
+        self.verses: List[int] = []
+        self.counts: List[int] = []
+
+    def add(self, ordinal: int, book: str, testament: str, count: int) -> None:
+        self.total += count
+        self.testaments[testament] += count
+        self.books[book] = self.books.get(book, 0) + count
+        self.verses.append(ordinal)
+        self.counts.append(count)
+
+    def to_json(self) -> dict:
+        deltas = []
+        previous = 0
+        for ordinal in self.verses:
+            deltas.append(ordinal - previous)
+            previous = ordinal
+        entry = {
+            "total": self.total,
+            "ot": self.testaments.get("ot", 0),
+            "nt": self.testaments.get("nt", 0),
+            "extras": self.testaments.get("extras", 0),
+            "books": self.books,
+            "verses": deltas,
+        }
+        if any(count != 1 for count in self.counts):
+            entry["counts"] = self.counts
+        return entry
+
+
+def build_concordance(corpus):
+    """One pass over the corpus: word statistics plus the verse map"""
+    words: Dict[str, WordStats] = defaultdict(WordStats)
+    books: List[dict] = []
+    ordinal = 0
+
+    for book, chapters in corpus.items():
+        testament = testament_of(book)
+        entry = book_entry(book, chapters, ordinal)
+        books.append(entry)
+        for chapter_num in sorted(chapters.keys(), key=int):
+            verses = chapters[chapter_num]
+            for verse_num in sorted(verses.keys(), key=int):
+                counts: Dict[str, int] = {}
+                for term, _start, _end in iter_tokens(verses[verse_num]):
+                    counts[term] = counts.get(term, 0) + 1
+                for term, count in counts.items():
+                    words[term].add(ordinal, book, testament, count)
+                ordinal += 1
+
+    return words, VerseMap(books)
+
+
+def write_concordance(words: Dict[str, WordStats], verse_map: VerseMap, out_dir: str,
+                      prefix_len: int = DEFAULT_PREFIX_LEN) -> dict:
+    os.makedirs(out_dir, exist_ok=True)
+
+    shards: Dict[str, Dict[str, dict]] = defaultdict(dict)
+    for word in sorted(words):
+        shards[shard_key(word, prefix_len)][word] = words[word].to_json()
+
+    shard_info = {}
+    for key, entries in sorted(shards.items()):
+        path = os.path.join(out_dir, f"{key}.json")
+        with io.open(path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, separators=(",", ":"))
+        shard_info[key] = {"words": len(entries), "bytes": os.path.getsize(path)}
+
+    verse_map.save(os.path.join(out_dir, "verses.json"))
+
+    manifest = {
+        "version": 1,
+        "prefix_len": prefix_len,
+        "words": len(words),
+        "occurrences": sum(stats.total for stats in words.values()),
+        "verses": verse_map.total,
+        "shards": shard_info,
+    }
+    with io.open(os.path.join(out_dir, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+
+def lookup(out_dir: str, word: str) -> dict:
+    """Reference lookup: load the word's shard and expand its verse ordinals"""
+    word = normalize_word(word)
+    with io.open(os.path.join(out_dir, "index.json"), "r", encoding="utf-8") as f:
+        # Tables built before prefix_len was recorded are sharded by first letter
+        prefix_len = json.load(f).get("prefix_len", 1)
+    path = os.path.join(out_dir, f"{shard_key(word, prefix_len)}.json")
+    if not os.path.exists(path):
+        return {}
+    with io.open(path, "r", encoding="utf-8") as f:
+        entry = json.load(f).get(word)
+    if entry is None:
+        return {}
+    ordinals = []
+    current = 0
+    for delta in entry["verses"]:
+        current += delta
+        ordinals.append(current)
+    return dict(entry, verses=ordinals)
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build precomputed concordance tables")
+    parser.add_argument("corpus", help="Translation directory or full-Bible JSON")
+    parser.add_argument("--out_dir", default="../frontend/public/translations/concordance/", help="Output directory")
+    parser.add_argument("--prefix-len", type=int, default=DEFAULT_PREFIX_LEN, help="Word prefix length per shard (default: 2)")
+    parser.add_argument("--lookup", help="Print the entry for a word after building")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.corpus):
+        print(f"Error: {args.corpus} not found!")
+        return 1
+
+    start = time.perf_counter()
+    words, verse_map = build_concordance(open_corpus(args.corpus))
+    manifest = write_concordance(words, verse_map, args.out_dir, args.prefix_len)
+    elapsed = time.perf_counter() - start
+
+    size = sum(info["bytes"] for info in manifest["shards"].values())
+    print(f"✓ Concordance: {manifest['words']} words, {manifest['occurrences']} occurrences "
+          f"in {len(manifest['shards'])} shards ({size / 1024:.0f} KB) in {elapsed:.2f}s")
+
+    if args.lookup:
+        entry = lookup(args.out_dir, args.lookup)
+        if not entry:
+            print(f"  '{args.lookup}' not found")
+        else:
+            first = ", ".join(verse_map.ref_string(o) for o in entry["verses"][:5])
+            print(f"  {args.lookup}: {entry['total']} occurrences in {len(entry['verses'])} verses "
+                  f"(OT {entry['ot']}, NT {entry['nt']}, extras {entry['extras']}); first: {first}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
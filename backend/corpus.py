@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Lazy per-book access to a Bible corpus
+
+Opens either a translation directory of per-book files (the layout written
+by split_bible.py) or a single full-Bible JSON file. Directory corpora parse
+books on demand and keep only a bounded number of them in memory. Books in
+the array schema (split_bible.py --schema array) are read transparently.
+
+Usage:
+  python corpus.py ../frontend/public/translations/ Genesis Matthew
+"""
+
+import io
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+BOOKS_ORDER = [
+    "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy",
+    "Joshua", "Judges", "Ruth", "1 Samuel", "2 Samuel", "1 Kings", "2 Kings",
+    "1 Chronicles", "2 Chronicles", "Ezra", "Nehemiah", "Esther",
+    "Job", "Psalms", "Proverbs", "Ecclesiastes", "Song of Solomon",
+    "Isaiah", "Jeremiah", "Lamentations", "Ezekiel", "Daniel",
+    "Hosea", "Joel", "Amos", "Obadiah", "Jonah", "Micah", "Nahum",
+    "Habakkuk", "Zephaniah", "Haggai", "Zechariah", "Malachi",
+    "Matthew", "Mark", "Luke", "John", "Acts", "Romans", "1 Corinthians",
+    "2 Corinthians", "Galatians", "Ephesians", "Philippians", "Colossians",
+    "1 Thessalonians", "2 Thessalonians", "1 Timothy", "2 Timothy", "Titus",
+    "Philemon", "Hebrews", "James", "1 Peter", "2 Peter", "1 John", "2 John",
+    "3 John", "Jude", "Revelation",
+]
+
+OT_BOOKS = BOOKS_ORDER[:BOOKS_ORDER.index("Malachi") + 1]
+NT_BOOKS = BOOKS_ORDER[len(OT_BOOKS):]
+
+DEFAULT_CACHE_SIZE = 8
+
+# Declared book order and extras registry written by merge_extras.py
+BOOKS_MANIFEST = "books.json"
+
+
+def load_json(path: str) -> dict:
+    with io.open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def to_array_book(chapters: dict) -> list:
+    """
+    Convert {chapter: {verse: text}} to the array schema.
+
+    A book becomes a list of chapters and a chapter a list of verse strings,
+    where index i holds verse i + 1. Missing verses and chapters are encoded
+    as null so numbering is preserved (e.g. the padded Enoch chapters).
+    """
+    book: list = []
+    for chapter_num in sorted(chapters.keys(), key=int):
+        index = int(chapter_num) - 1
+        book.extend([None] * (index - len(book)))
+        book.append(to_array_chapter(chapters[chapter_num]))
+    return book
+
+
+def to_array_chapter(verses: dict) -> list:
+    """Convert {verse: text} to a list of verse strings with null gaps"""
+    chapter: list = []
+    for verse_num in sorted(verses.keys(), key=int):
+        index = int(verse_num) - 1
+        chapter.extend([None] * (index - len(chapter)))
+        chapter.append(verses[verse_num])
+    return chapter
+
+
+def from_array_book(book: list) -> dict:
+    """Convert an array-schema book back to {chapter: {verse: text}}"""
+    chapters = {}
+    for chapter_idx, chapter in enumerate(book, 1):
+        if chapter is None:
+            continue
+        chapters[str(chapter_idx)] = {
+            str(verse_idx): text
+            for verse_idx, text in enumerate(chapter, 1)
+            if text is not None
+        }
+    return chapters
+
+
+def normalize_book(book) -> dict:
+    """Accept a book in either schema and return the object schema"""
+    return from_array_book(book) if isinstance(book, list) else book
+
+
+def ordered_books(names, declared: bool = False) -> List[str]:
+    """
+    Canonical books first, then any extra books alphabetically (as in
+    orderedBooksFrom), or in the order given when declared is set.
+    """
+    names = list(names)
+    present = set(names)
+    canonical = [b for b in BOOKS_ORDER if b in present]
+    extras = [b for b in names if b not in BOOKS_ORDER]
+    return canonical + (extras if declared else sorted(extras))
+
+
+class BibleCorpus(Mapping):
+    """
+    Read-only {book: {chapter: {verse: text}}} mapping backed by disk.
+
+    Iteration follows the declared order of the directory's books.json when
+    present, otherwise canonical book order followed by extra books in the
+    order a full-Bible JSON declares them, so a corpus can be passed
+    anywhere a loaded Bible dict is expected (generate_pdf, modernize_bible).
+    """
+
+    def __init__(self, path: str, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.path = path
+        self.cache_size = max(1, cache_size)
+        self._cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._full: Optional[dict] = None
+        self._files: Dict[str, str] = {}
+
+        self.manifest: Optional[dict] = None
+
+        if os.path.isdir(path):
+            manifest_path = os.path.join(path, BOOKS_MANIFEST)
+            if os.path.isfile(manifest_path):
+                self.manifest = load_json(manifest_path)
+            self._files = self._discover_books(path, self.manifest)
+        else:
+            self._full = {
+                name: normalize_book(book)
+                for name, book in load_json(path).items()
+            }
+
+        if self.manifest is not None:
+            self._order = [b for b in self.manifest.get("books", []) if b in self._files]
+        else:
+            names = self._files.keys() if self._full is None else self._full.keys()
+            self._order = ordered_books(names, declared=self._full is not None)
+
+    @staticmethod
+    def _discover_books(directory: str, manifest: Optional[dict] = None) -> Dict[str, str]:
+        candidates = manifest.get("books", []) if manifest is not None else BOOKS_ORDER
+        files = {}
+        for book in candidates:
+            book_path = os.path.join(directory, f"{book}.json")
+            if os.path.isfile(book_path):
+                files[book] = book_path
+        return files
+
+    def extras_books(self) -> List[str]:
+        """Books registered as extras in the directory manifest, if any"""
+        if self.manifest is None:
+            return []
+        return [entry["book"] for entry in self.manifest.get("extras", [])]
+
+    def is_lazy(self) -> bool:
+        return self._full is None
+
+    def book_names(self) -> List[str]:
+        return list(self._order)
+
+    def book_files(self) -> Dict[str, str]:
+        """Per-book file of each book in order (empty for a full-Bible JSON)"""
+        return {name: self._files[name] for name in self._order if name in self._files}
+
+    def get_book(self, name: str) -> dict:
+        if self._full is not None:
+            return self._full[name]
+
+        if name in self._cache:
+            self._cache.move_to_end(name)
+            return self._cache[name]
+
+        if name not in self._files:
+            raise KeyError(name)
+
+        book = normalize_book(load_json(self._files[name]))
+        self._cache[name] = book
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return book
+
+    def iter_books(self, names: Optional[List[str]] = None) -> Iterator[Tuple[str, dict]]:
+        """Yield (book, chapters) in canonical order, optionally limited to names"""
+        wanted = set(names) if names is not None else None
+        for name in self._order:
+            if wanted is None or name in wanted:
+                yield name, self.get_book(name)
+
+    def __getitem__(self, name: str) -> dict:
+        return self.get_book(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, name) -> bool:
+        return name in self._order
+
+
+# (chapter, verse) bounds of a selected span, inclusive
+Span = Tuple[Tuple[int, int], Tuple[int, int]]
+
+
+class CorpusSlice(Mapping):
+    """
+    Read-only view of selected books, chapters and verses of a corpus.
+
+    spans maps each selected book to None (the whole book) or a list of
+    inclusive ((chapter, verse), (chapter, verse)) bounds. Only selected
+    books are ever read from the underlying corpus.
+    """
+
+    def __init__(self, corpus: Mapping, spans: Dict[str, Optional[List[Span]]]):
+        self.corpus = corpus
+        self.spans = spans
+        self._order = [name for name in corpus if name in spans]
+        self._books: Dict[str, dict] = {}
+
+    def get_book(self, name: str) -> dict:
+        if name not in self._books:
+            if name not in self.spans or name not in self.corpus:
+                raise KeyError(name)
+            book = self.corpus[name]
+            spans = self.spans[name]
+            if spans is not None:
+                book = self._select(book, spans)
+            self._books[name] = book
+        return self._books[name]
+
+    @staticmethod
+    def _select(book: dict, spans: List[Span]) -> dict:
+        selected = {}
+        for chapter, verses in book.items():
+            c = int(chapter)
+            covering = [(first, last) for first, last in spans if first[0] <= c <= last[0]]
+            if not covering:
+                continue
+            picked = {
+                verse: text for verse, text in verses.items()
+                if any(first <= (c, int(verse)) <= last for first, last in covering)
+            }
+            if picked:
+                selected[chapter] = picked
+        return selected
+
+    def __getitem__(self, name: str) -> dict:
+        return self.get_book(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, name) -> bool:
+        return name in self._order
+
+
+def open_corpus(path: str, cache_size: int = DEFAULT_CACHE_SIZE) -> BibleCorpus:
+    """Open a translation directory or full-Bible JSON file"""
+    return BibleCorpus(path, cache_size=cache_size)
+
+
+def main() -> int:
+    if len(sys.argv) < 2:
+        print("Usage: python corpus.py <translation_dir|bible.json> [book ...]")
+        print("Example: python corpus.py ../frontend/public/translations/ Genesis Matthew")
+        return 2
+
+    path = sys.argv[1]
+    if not os.path.exists(path):
+        print(f"Error: {path} not found!")
+        return 1
+
+    start = time.perf_counter()
+    corpus = open_corpus(path)
+    opened = time.perf_counter() - start
+    mode = "lazy directory" if corpus.is_lazy() else "full file"
+    print(f"Opened {path} ({mode}) in {opened * 1000:.1f} ms: {len(corpus)} books")
+
+    names = sys.argv[2:] or None
+    total_verses = 0
+    for book, chapters in corpus.iter_books(names):
+        book_verses = sum(len(verses) for verses in chapters.values())
+        total_verses += book_verses
+        print(f"  ✓ {book}: {len(chapters)} chapters, {book_verses} verses")
+
+    elapsed = time.perf_counter() - start
+    print(f"\nTotal verses: {total_verses} ({elapsed * 1000:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
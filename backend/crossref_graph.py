@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Compile cross references and topic tags into a verse graph
+
+crossReferences.json and topicTags.json key verses by free-form strings
+("Psalm 33:6" where the corpus says "Psalms"), and CrossRefPanel can only
+follow a link from the verse it is listed under. This compiler resolves
+every reference to verse ordinals (parsed with references.py), checks that
+the verses exist in the corpus, and writes links in both directions plus
+topic postings.
+
+Output (in --out_dir):
+  verses.json   ordinal <-> book/chapter/verse map (see ordinals.py)
+  graph.json
+    {"version": 1, "verses": N,
+     "relationships": ["parallel", ...],
+     "links":     {"<ordinal>": [[target, relationship], ...]},
+     "backlinks": {"<ordinal>": [[source, relationship], ...]},
+     "topics": [{"id", "name", "description", "icon", "color"}, ...],
+     "topic_verses": {"<topic id>": [ordinal, ...]},
+     "verse_topics": {"<ordinal>": [topic index, ...]}}
+
+relationship is an index into "relationships". A reference to a verse
+range ("Romans 8:28-30") links to every verse in it. The graph is sparse,
+so adjacency is keyed by ordinal rather than stored as full-corpus arrays.
+
+Usage:
+  python crossref_graph.py ../frontend/public/translations/ --out_dir ../frontend/public/translations/graph/
+  python crossref_graph.py ../frontend/public/translations/ --strict
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from corpus import load_json, open_corpus
+from ordinals import VerseMap
+from references import ReferenceParser
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+CROSS_REFERENCES = "../frontend/src/data/crossReferences.json"
+TOPIC_TAGS = "../frontend/src/data/topicTags.json"
+
+def resolve_ref(ref: str, parser: ReferenceParser) -> Tuple[Optional[Tuple[int, int]], str]:
+    """
+    Half-open ordinal range of a reference ("Psalm 33:6", "Romans 8:28-30",
+    "Isaiah 9"), and an error message ("" on success).
+    """
+    parsed = parser.parse(ref)
+    if parsed is None:
+        if parser.match_book(ref.strip())[0] is None:
+            return None, f"unknown book in '{ref}'"
+        return None, f"unparseable reference '{ref}'"
+    span = parser.resolve(parsed)
+    if span is None:
+        return None, f"'{ref}' is not in the corpus"
+    return span, ""
+
+
+def compile_graph(cross_refs: dict, topics: List[dict], verse_map: VerseMap) -> Tuple[dict, List[str]]:
+    """The graph.json structure and a list of validation errors"""
+    parser = ReferenceParser.from_verse_map(verse_map)
+    errors: List[str] = []
+    relationships: List[str] = []
+    relationship_ids: Dict[str, int] = {}
+    links: Dict[int, List[List[int]]] = defaultdict(list)
+    backlinks: Dict[int, List[List[int]]] = defaultdict(list)
+
+    for source_ref, targets in cross_refs.items():
+        source, error = resolve_ref(source_ref, parser)
+        if error:
+            errors.append(f"crossReferences: {error}")
+            continue
+        for target in targets:
+            span, error = resolve_ref(target["ref"], parser)
+            if error:
+                errors.append(f"crossReferences[{source_ref}]: {error}")
+                continue
+            relationship = target.get("relationship", "")
+            if relationship not in relationship_ids:
+                relationship_ids[relationship] = len(relationships)
+                relationships.append(relationship)
+            rel = relationship_ids[relationship]
+            for src in range(*source):
+                for dst in range(*span):
+                    if [dst, rel] not in links[src]:
+                        links[src].append([dst, rel])
+                        backlinks[dst].append([src, rel])
+
+    topic_meta = []
+    topic_verses: Dict[str, List[int]] = {}
+    verse_topics: Dict[int, List[int]] = defaultdict(list)
+    for topic_idx, topic in enumerate(topics):
+        topic_meta.append({key: value for key, value in topic.items() if key != "verses"})
+        ordinals = set()
+        for entry in topic.get("verses", []):
+            span, error = resolve_ref(entry["ref"], parser)
+            if error:
+                errors.append(f"topicTags[{topic.get('id')}]: {error}")
+                continue
+            ordinals.update(range(*span))
+        topic_verses[topic["id"]] = sorted(ordinals)
+        for ordinal in ordinals:
+            verse_topics[ordinal].append(topic_idx)
+
+    graph = {
+        "version": 1,
+        "verses": verse_map.total,
+        "relationships": relationships,
+        "links": {str(o): sorted(v) for o, v in sorted(links.items())},
+        "backlinks": {str(o): sorted(v) for o, v in sorted(backlinks.items())},
+        "topics": topic_meta,
+        "topic_verses": topic_verses,
+        "verse_topics": {str(o): sorted(v) for o, v in sorted(verse_topics.items())},
+    }
+    return graph, errors
+
+
+class VerseGraph:
+    """Reference lookups over a compiled graph.json"""
+
+    def __init__(self, graph: dict):
+        self.graph = graph
+        self.relationships: List[str] = graph["relationships"]
+        self.topics: List[dict] = graph["topics"]
+
+    @classmethod
+    def load(cls, path: str) -> "VerseGraph":
+        with io.open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def links(self, ordinal: int) -> List[Tuple[int, str]]:
+        return [(dst, self.relationships[rel]) for dst, rel in self.graph["links"].get(str(ordinal), ())]
+
+    def backlinks(self, ordinal: int) -> List[Tuple[int, str]]:
+        return [(src, self.relationships[rel]) for src, rel in self.graph["backlinks"].get(str(ordinal), ())]
+
+    def topics_of(self, ordinal: int) -> List[str]:
+        return [self.topics[i]["id"] for i in self.graph["verse_topics"].get(str(ordinal), ())]
+
+    def verses_of(self, topic_id: str) -> List[int]:
+        return self.graph["topic_verses"].get(topic_id, [])
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile cross references and topics into a verse graph")
+    parser.add_argument("corpus", help="Translation directory or full-Bible JSON (for validation and ordinals)")
+    parser.add_argument("--cross-refs", default=CROSS_REFERENCES, help="crossReferences.json")
+    parser.add_argument("--topics", default=TOPIC_TAGS, help="topicTags.json")
+    parser.add_argument("--out_dir", default="../frontend/public/translations/graph/", help="Output directory")
+    parser.add_argument("--strict", action="store_true", help="Fail when any reference does not resolve")
+    args = parser.parse_args(argv)
+
+    for path in (args.corpus, args.cross_refs, args.topics):
+        if not os.path.exists(path):
+            print(f"Error: {path} not found!")
+            return 1
+
+    start = time.perf_counter()
+    verse_map = VerseMap.from_corpus(open_corpus(args.corpus))
+    graph, errors = compile_graph(
+        load_json(args.cross_refs).get("crossReferences", {}),
+        load_json(args.topics).get("topics", []),
+        verse_map,
+    )
+
+    for error in errors:
+        print(f"  ✗ {error}")
+    if errors and args.strict:
+        print(f"Error: {len(errors)} unresolved references")
+        return 1
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    out_path = os.path.join(args.out_dir, "graph.json")
+    with io.open(out_path, "w", encoding="utf-8") as f:
+        json.dump(graph, f, ensure_ascii=False, separators=(",", ":"))
+    verse_map.save(os.path.join(args.out_dir, "verses.json"))
+
+    link_count = sum(len(v) for v in graph["links"].values())
+    print(f"✓ Verse graph: {link_count} links from {len(graph['links'])} verses, "
+          f"{len(graph['topics'])} topics over {len(graph['verse_topics'])} verses, "
+          f"{len(errors)} unresolved ({os.path.getsize(out_path) / 1024:.1f} KB) "
+          f"in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
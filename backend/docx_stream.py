@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Streaming DOCX writer for the Restored Names Bible
+
+generate_docx builds a python-docx object for every paragraph and run,
+about a quarter of a million for the full Bible, before saving anything.
+This writer streams word/document.xml straight into the zip, one chapter
+at a time, from fixed XML templates, so memory does not grow with the
+text and nothing but the standard library is needed.
+
+The document matches generate_docx: Title / Heading 1 / Heading 2 / List
+Bullet styles, a title page, an optional table of contents, one section
+per book with the book name in its header, a PAGE field in every footer,
+superscript verse numbers and bold, dark blue restored names.
+
+Usage:
+  python docx_stream.py --input ../frontend/public/translations/ --output build/restored_kjv_bible.docx
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import time
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, List, Sequence
+from xml.sax.saxutils import escape
+
+from corpus import OT_BOOKS, open_corpus
+from name_emphasis import name_segments
+from render_cache import RenderCache, book_fingerprint, fingerprint, generator_fingerprint
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+W_NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+R_NS = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+CONTENT_TYPES = XML_HEADER + (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '<Override PartName="/word/numbering.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>'
+    '<Override PartName="/word/settings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>'
+    '<Override PartName="/word/footer1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.footer+xml"/>'
+    '{headers}'
+    '<Override PartName="/docProps/core.xml" '
+    'ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>'
+    '</Types>'
+)
+HEADER_CONTENT_TYPE = (
+    '<Override PartName="/word/header{n}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml"/>'
+)
+
+PACKAGE_RELS = XML_HEADER + (
+    f'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{REL_NS}/officeDocument" Target="word/document.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" '
+    'Target="docProps/core.xml"/>'
+    '</Relationships>'
+)
+
+CORE_PROPERTIES = XML_HEADER + (
+    '<cp:coreProperties '
+    'xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+    'xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:dcterms="http://purl.org/dc/terms/" '
+    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+    '<dc:title>The Holy Bible</dc:title>'
+    '<dcterms:created xsi:type="dcterms:W3CDTF">{created}</dcterms:created>'
+    '</cp:coreProperties>'
+)
+
+SETTINGS = XML_HEADER + f'<w:settings {W_NS}><w:defaultTabStop w:val="720"/></w:settings>'
+
+# The python-docx default template's styles, with the theme fonts spelled out
+STYLES = XML_HEADER + (
+    f'<w:styles {W_NS}>'
+    '<w:docDefaults>'
+    '<w:rPrDefault><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri" w:eastAsia="Calibri" w:cs="Times New Roman"/>'
+    '<w:sz w:val="22"/><w:szCs w:val="22"/><w:lang w:val="en-US" w:eastAsia="en-US" w:bidi="ar-SA"/></w:rPr></w:rPrDefault>'
+    '<w:pPrDefault><w:pPr><w:spacing w:after="200" w:line="276" w:lineRule="auto"/></w:pPr></w:pPrDefault>'
+    '</w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:qFormat/></w:style>'
+    '<w:style w:type="character" w:default="1" w:styleId="DefaultParagraphFont">'
+    '<w:name w:val="Default Paragraph Font"/><w:uiPriority w:val="1"/><w:semiHidden/><w:unhideWhenUsed/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Title"><w:name w:val="Title"/><w:basedOn w:val="Normal"/>'
+    '<w:next w:val="Normal"/><w:uiPriority w:val="10"/><w:qFormat/>'
+    '<w:pPr><w:pBdr><w:bottom w:val="single" w:sz="8" w:space="4" w:color="4F81BD"/></w:pBdr>'
+    '<w:spacing w:after="300" w:line="240" w:lineRule="auto"/><w:contextualSpacing/></w:pPr>'
+    '<w:rPr><w:rFonts w:ascii="Cambria" w:hAnsi="Cambria" w:eastAsia="Cambria" w:cs="Times New Roman"/>'
+    '<w:color w:val="17365D"/><w:spacing w:val="5"/><w:kern w:val="28"/><w:sz w:val="52"/><w:szCs w:val="52"/></w:rPr>'
+    '</w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:basedOn w:val="Normal"/>'
+    '<w:next w:val="Normal"/><w:uiPriority w:val="9"/><w:qFormat/>'
+    '<w:pPr><w:keepNext/><w:keepLines/><w:spacing w:before="480" w:after="0"/><w:outlineLvl w:val="0"/></w:pPr>'
+    '<w:rPr><w:rFonts w:ascii="Cambria" w:hAnsi="Cambria" w:eastAsia="Cambria" w:cs="Times New Roman"/>'
+    '<w:b/><w:bCs/><w:color w:val="365F91"/><w:sz w:val="28"/><w:szCs w:val="28"/></w:rPr>'
+    '</w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading2"><w:name w:val="heading 2"/><w:basedOn w:val="Normal"/>'
+    '<w:next w:val="Normal"/><w:uiPriority w:val="9"/><w:unhideWhenUsed/><w:qFormat/>'
+    '<w:pPr><w:keepNext/><w:keepLines/><w:spacing w:before="200" w:after="0"/><w:outlineLvl w:val="1"/></w:pPr>'
+    '<w:rPr><w:rFonts w:ascii="Cambria" w:hAnsi="Cambria" w:eastAsia="Cambria" w:cs="Times New Roman"/>'
+    '<w:b/><w:bCs/><w:color w:val="4F81BD"/><w:sz w:val="26"/><w:szCs w:val="26"/></w:rPr>'
+    '</w:style>'
+    '<w:style w:type="paragraph" w:styleId="ListBullet"><w:name w:val="List Bullet"/><w:basedOn w:val="Normal"/>'
+    '<w:uiPriority w:val="99"/><w:unhideWhenUsed/>'
+    '<w:pPr><w:numPr><w:numId w:val="1"/></w:numPr><w:contextualSpacing/></w:pPr>'
+    '</w:style>'
+    '<w:style w:type="paragraph" w:styleId="Header"><w:name w:val="header"/><w:basedOn w:val="Normal"/>'
+    '<w:uiPriority w:val="99"/><w:unhideWhenUsed/>'
+    '<w:pPr><w:tabs><w:tab w:val="center" w:pos="4320"/><w:tab w:val="right" w:pos="8640"/></w:tabs>'
+    '<w:spacing w:after="0" w:line="240" w:lineRule="auto"/></w:pPr>'
+    '</w:style>'
+    '<w:style w:type="paragraph" w:styleId="Footer"><w:name w:val="footer"/><w:basedOn w:val="Normal"/>'
+    '<w:uiPriority w:val="99"/><w:unhideWhenUsed/>'
+    '<w:pPr><w:tabs><w:tab w:val="center" w:pos="4320"/><w:tab w:val="right" w:pos="8640"/></w:tabs>'
+    '<w:spacing w:after="0" w:line="240" w:lineRule="auto"/></w:pPr>'
+    '</w:style>'
+    '</w:styles>'
+)
+
+NUMBERING = XML_HEADER + (
+    f'<w:numbering {W_NS}>'
+    '<w:abstractNum w:abstractNumId="0"><w:multiLevelType w:val="singleLevel"/>'
+    '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="bullet"/><w:lvlText w:val="•"/>'
+    '<w:lvlJc w:val="left"/><w:pPr><w:tabs><w:tab w:val="num" w:pos="360"/></w:tabs>'
+    '<w:ind w:left="360" w:hanging="360"/></w:pPr></w:lvl>'
+    '</w:abstractNum>'
+    '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+    '</w:numbering>'
+)
+
+HEADER = XML_HEADER + (
+    f'<w:hdr {W_NS} {R_NS}><w:p><w:pPr><w:pStyle w:val="Header"/><w:jc w:val="left"/></w:pPr>'
+    '<w:r><w:rPr><w:i/><w:color w:val="718096"/><w:sz w:val="20"/></w:rPr>'
+    '<w:t xml:space="preserve">{book}</w:t></w:r></w:p></w:hdr>'
+)
+
+FOOTER = XML_HEADER + (
+    f'<w:ftr {W_NS} {R_NS}><w:p><w:pPr><w:pStyle w:val="Footer"/><w:jc w:val="center"/></w:pPr>'
+    '<w:r><w:rPr><w:color w:val="718096"/><w:sz w:val="18"/></w:rPr><w:fldChar w:fldCharType="begin"/></w:r>'
+    '<w:r><w:rPr><w:color w:val="718096"/><w:sz w:val="18"/></w:rPr><w:instrText xml:space="preserve"> PAGE </w:instrText></w:r>'
+    '<w:r><w:rPr><w:color w:val="718096"/><w:sz w:val="18"/></w:rPr><w:fldChar w:fldCharType="separate"/></w:r>'
+    '<w:r><w:rPr><w:color w:val="718096"/><w:sz w:val="18"/></w:rPr><w:t>1</w:t></w:r>'
+    '<w:r><w:rPr><w:color w:val="718096"/><w:sz w:val="18"/></w:rPr><w:fldChar w:fldCharType="end"/></w:r>'
+    '</w:p></w:ftr>'
+)
+
+DOCUMENT_START = XML_HEADER + f'<w:document {W_NS} {R_NS}><w:body>'
+DOCUMENT_END = '</w:body></w:document>'
+
+# Letter paper, 1" margins
+SECTION = (
+    '<w:sectPr>{header}<w:footerReference w:type="default" r:id="rIdFooter1"/>'
+    '<w:pgSz w:w="12240" w:h="15840"/>'
+    '<w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440" w:header="720" w:footer="720" w:gutter="0"/>'
+    '<w:cols w:space="720"/></w:sectPr>'
+)
+HEADER_REFERENCE = '<w:headerReference w:type="default" r:id="rIdHeader{n}"/>'
+
+PAGE_BREAK = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+VERSE_NUMBER = (
+    '<w:r><w:rPr><w:b/><w:color w:val="718096"/><w:sz w:val="18"/><w:vertAlign w:val="superscript"/></w:rPr>'
+    '<w:t>{}</w:t></w:r><w:r><w:t xml:space="preserve"> </w:t></w:r>'
+)
+TEXT_RUN = '<w:r><w:rPr><w:sz w:val="22"/></w:rPr><w:t xml:space="preserve">{}</w:t></w:r>'
+NAME_RUN = '<w:r><w:rPr><w:b/><w:color w:val="1A365D"/><w:sz w:val="22"/></w:rPr><w:t xml:space="preserve">{}</w:t></w:r>'
+
+
+def paragraph(text: str = "", style: str = None, align: str = None, run_props: str = "") -> str:
+    """One paragraph with a single run"""
+    props = ""
+    if style or align:
+        props = "<w:pPr>" + (f'<w:pStyle w:val="{style}"/>' if style else "") + \
+                (f'<w:jc w:val="{align}"/>' if align else "") + "</w:pPr>"
+    run = ""
+    if text:
+        rpr = f"<w:rPr>{run_props}</w:rPr>" if run_props else ""
+        run = f'<w:r>{rpr}<w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+    return f"<w:p>{props}{run}</w:p>"
+
+
+def section_break(header_id: int = None) -> str:
+    """Empty paragraph closing a section (page break before the next one)"""
+    header = HEADER_REFERENCE.format(n=header_id) if header_id else ""
+    return f"<w:p><w:pPr>{SECTION.format(header=header)}</w:pPr></w:p>"
+
+
+def verse_paragraph(verse_num: str, verse_text: str) -> str:
+    runs = [VERSE_NUMBER.format(escape(verse_num))]
+    for piece, is_name in name_segments(verse_text):
+        runs.append((NAME_RUN if is_name else TEXT_RUN).format(escape(piece)))
+    return "<w:p>" + "".join(runs) + "</w:p>"
+
+
+def front_matter(chapter_counts: dict, include_toc: bool = True, subtitle_text: str = None) -> Iterator[str]:
+    """Title page and table of contents, as in generate_docx"""
+    yield paragraph("The Holy Bible", "Title", "center")
+    yield paragraph("King James Version", align="center", run_props='<w:color w:val="2D3748"/><w:sz w:val="32"/>')
+    subtitle_props = '<w:color w:val="2D3748"/><w:sz w:val="28"/>'
+    if subtitle_text:
+        yield paragraph(subtitle_text, align="center", run_props=subtitle_props)
+    else:
+        yield paragraph("with Restored Hebrew Names", align="center", run_props=subtitle_props)
+        yield paragraph()
+        yield paragraph("Yahuah • Elohiym • Yahusha • Mashiach", align="center", run_props='<w:i/><w:sz w:val="24"/>')
+
+    if include_toc:
+        yield PAGE_BREAK
+        yield paragraph("Table of Contents", "Heading1", "center")
+        yield paragraph("Old Testament", "Heading2")
+        for book in OT_BOOKS:
+            if book in chapter_counts:
+                yield paragraph(f"{book} — {chapter_counts[book]} chapters", "ListBullet")
+        yield paragraph("New Testament", "Heading2")
+        for book, count in chapter_counts.items():
+            if book not in OT_BOOKS:
+                yield paragraph(f"{book} — {count} chapters", "ListBullet")
+
+
+def book_body(book_name: str, chapters: dict) -> Iterator[str]:
+    """Book heading, then one string per chapter (heading and verses)"""
+    yield paragraph(book_name, "Heading1", "center")
+    for chapter_num in sorted(chapters.keys(), key=int):
+        verses = chapters[chapter_num]
+        parts = [paragraph(f"Chapter {chapter_num}", "Heading2")]
+        parts.extend(verse_paragraph(verse_num, verses[verse_num]) for verse_num in sorted(verses.keys(), key=int))
+        yield "".join(parts)
+
+
+def document_rels(header_count: int) -> str:
+    rels = [
+        f'<Relationship Id="rIdStyles" Type="{REL_NS}/styles" Target="styles.xml"/>',
+        f'<Relationship Id="rIdNumbering" Type="{REL_NS}/numbering" Target="numbering.xml"/>',
+        f'<Relationship Id="rIdSettings" Type="{REL_NS}/settings" Target="settings.xml"/>',
+        f'<Relationship Id="rIdFooter1" Type="{REL_NS}/footer" Target="footer1.xml"/>',
+    ]
+    rels.extend(f'<Relationship Id="rIdHeader{n}" Type="{REL_NS}/header" Target="header{n}.xml"/>'
+                for n in range(1, header_count + 1))
+    return XML_HEADER + ('<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                         + "".join(rels) + "</Relationships>")
+
+
+def write_book(out, book_name: str, chapters: dict, cache: RenderCache = None) -> None:
+    """
+    Stream one book's paragraphs to out. With a RenderCache the book's XML
+    is kept under its fingerprint and copied instead of rendered next time.
+    """
+    if cache is None:
+        for chunk in book_body(book_name, chapters):
+            out.write(chunk.encode("utf-8"))
+        return
+    key = fingerprint("docx-book", generator_fingerprint(), book_name, book_fingerprint(chapters))
+    path = cache.fragment_path("docx", key, ".xml")
+    if not path.exists():
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            for chunk in book_body(book_name, chapters):
+                f.write(chunk.encode("utf-8"))
+        os.replace(tmp_path, path)
+    with open(path, "rb") as f:
+        shutil.copyfileobj(f, out)
+
+
+def write_docx(bible_data, output_path, include_toc: bool = True, subtitle_text: str = None,
+               compresslevel: int = 6, cache: RenderCache = None) -> bool:
+    """
+    Write the DOCX for bible_data (book -> chapter -> verse -> text) to
+    output_path. Books are read one at a time, so a lazy corpus stays lazy.
+    """
+    print(f"Generating DOCX: {output_path}")
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    books: List[str] = list(bible_data.keys())
+
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zf:
+        with zf.open("word/document.xml", "w") as out:
+            out.write(DOCUMENT_START.encode("utf-8"))
+            chapter_counts = {book: len(bible_data[book]) for book in books} if include_toc else {}
+            for chunk in front_matter(chapter_counts, include_toc, subtitle_text):
+                out.write(chunk.encode("utf-8"))
+
+            # Each section ends with the paragraph that carries its sectPr:
+            # the front matter has no running header, each book has its own.
+            header_id = None
+            for header_id, book_name in enumerate(books, start=1):
+                out.write(section_break(header_id - 1 or None).encode("utf-8"))
+                print(f"  Processing: {book_name}")
+                write_book(out, book_name, bible_data[book_name], cache)
+            out.write(SECTION.format(header=HEADER_REFERENCE.format(n=header_id) if header_id else "").encode("utf-8"))
+            out.write(DOCUMENT_END.encode("utf-8"))
+
+        print("Saving DOCX document...")
+        zf.writestr("[Content_Types].xml", CONTENT_TYPES.replace(
+            "{headers}", "".join(HEADER_CONTENT_TYPE.format(n=n) for n in range(1, len(books) + 1))))
+        zf.writestr("_rels/.rels", PACKAGE_RELS)
+        zf.writestr("docProps/core.xml", CORE_PROPERTIES.replace(
+            "{created}", datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")))
+        for header_id, book_name in enumerate(books, start=1):
+            zf.writestr(f"word/header{header_id}.xml", HEADER.replace("{book}", escape(book_name)))
+        zf.writestr("word/_rels/document.xml.rels", document_rels(len(books)))
+        zf.writestr("word/styles.xml", STYLES)
+        zf.writestr("word/numbering.xml", NUMBERING)
+        zf.writestr("word/settings.xml", SETTINGS)
+        zf.writestr("word/footer1.xml", FOOTER)
+
+    print(f"✓ DOCX generated: {output_path}")
+    return True
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Stream the Restored Names Bible to DOCX")
+    parser.add_argument("--input", default="build/restored_kjv.json", help="Input JSON file or per-book translation directory")
+    parser.add_argument("--output", default="build/restored_kjv_bible.docx", help="Output DOCX path")
+    parser.add_argument("--no-toc", action="store_true", help="Skip table of contents")
+    parser.add_argument("--subtitle", help="Title page subtitle")
+    args = parser.parse_args(argv)
+
+    if not Path(args.input).exists():
+        print(f"Error: {args.input} not found!")
+        return 1
+    start = time.perf_counter()
+    write_docx(open_corpus(args.input), args.output, not args.no_toc, args.subtitle)
+    print(f"  {Path(args.output).stat().st_size / 1024 / 1024:.1f} MB in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
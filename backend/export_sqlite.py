@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Export the restored corpus to a SQLite database for analysis and review
+
+Tables:
+  books         id, name, testament ('ot', 'nt', 'extras'), chapters
+  chapters      book_id, chapter, first_ordinal, verses
+  verses        ordinal (see ordinals.py), book_id, chapter, verse,
+                restored text, original KJV text (NULL for extras)
+  verses_fts    FTS5 index over verses.restored and verses.original
+  rules         restore_names.py rules in application order, with the
+                count from the replacements report and the per-verse total
+  replacements  ordinal, rule_id, count: which rules fired in which verse
+  meta          key/value build information
+
+Per-verse hits come from running the configured rules over each original
+verse in order, as restore_names.py does; the report only has totals.
+Everything is inserted in batches inside a single transaction.
+
+Example: verses where Yahuah appears and the KJV had LORD
+
+  SELECT b.name, v.chapter, v.verse, v.restored
+  FROM replacements r
+  JOIN rules u ON u.id = r.rule_id AND u.description = 'LORD'
+  JOIN verses v ON v.ordinal = r.ordinal
+  JOIN books b ON b.id = v.book_id
+  WHERE v.ordinal IN (SELECT rowid FROM verses_fts WHERE verses_fts MATCH 'restored:yahuah');
+
+Usage:
+  python export_sqlite.py ../frontend/public/translations/ --original data/kjv.json --out build/restored_kjv.sqlite
+  python export_sqlite.py --out build/restored_kjv.sqlite --example yahuah-for-lord
+  python export_sqlite.py --out build/restored_kjv.sqlite --sql "SELECT COUNT(*) FROM verses"
+"""
+
+import argparse
+import csv
+import io
+import os
+import re
+import sqlite3
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from corpus import load_json, open_corpus
+from ordinals import VerseMap, iter_verses, testament_of
+from restore_names import apply_rules, compile_rules
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+SCHEMA_VERSION = 1
+BATCH_SIZE = 5000
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE books (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    testament TEXT NOT NULL,
+    chapters INTEGER NOT NULL
+);
+CREATE TABLE chapters (
+    book_id INTEGER NOT NULL REFERENCES books(id),
+    chapter INTEGER NOT NULL,
+    first_ordinal INTEGER NOT NULL,
+    verses INTEGER NOT NULL,
+    PRIMARY KEY (book_id, chapter)
+) WITHOUT ROWID;
+CREATE TABLE verses (
+    ordinal INTEGER PRIMARY KEY,
+    book_id INTEGER NOT NULL REFERENCES books(id),
+    chapter INTEGER NOT NULL,
+    verse INTEGER NOT NULL,
+    restored TEXT NOT NULL,
+    original TEXT
+);
+CREATE TABLE rules (
+    id INTEGER PRIMARY KEY,
+    description TEXT NOT NULL,
+    pattern TEXT NOT NULL,
+    replacement TEXT NOT NULL,
+    report_count INTEGER,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE replacements (
+    ordinal INTEGER NOT NULL REFERENCES verses(ordinal),
+    rule_id INTEGER NOT NULL REFERENCES rules(id),
+    count INTEGER NOT NULL,
+    PRIMARY KEY (ordinal, rule_id)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE verses_fts USING fts5(
+    restored, original,
+    content='verses', content_rowid='ordinal',
+    tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+# Created after the bulk load, which is faster than maintaining them per row
+INDEXES = [
+    "CREATE UNIQUE INDEX verses_ref ON verses(book_id, chapter, verse)",
+    "CREATE INDEX replacements_rule ON replacements(rule_id, ordinal)",
+]
+
+EXAMPLES = {
+    "yahuah-for-lord": (
+        "Verses where Yahuah appears and the KJV had LORD",
+        """
+        SELECT b.name || ' ' || v.chapter || ':' || v.verse, v.restored
+        FROM replacements r
+        JOIN rules u ON u.id = r.rule_id AND u.description = 'LORD'
+        JOIN verses v ON v.ordinal = r.ordinal
+        JOIN books b ON b.id = v.book_id
+        WHERE v.ordinal IN (SELECT rowid FROM verses_fts WHERE verses_fts MATCH 'restored:yahuah')
+        ORDER BY v.ordinal
+        """,
+    ),
+    "rule-hits": (
+        "Replacements per rule, report count next to the per-verse total",
+        "SELECT description, replacement, report_count, hits FROM rules ORDER BY id",
+    ),
+    "hits-per-book": (
+        "Replacements per book",
+        """
+        SELECT b.name, SUM(r.count) AS replacements
+        FROM replacements r
+        JOIN verses v ON v.ordinal = r.ordinal
+        JOIN books b ON b.id = v.book_id
+        GROUP BY b.id ORDER BY b.id
+        """,
+    ),
+    "unchanged-names": (
+        "Verses whose restored text still reads LORD or GOD",
+        """
+        SELECT b.name || ' ' || v.chapter || ':' || v.verse, v.restored
+        FROM verses v JOIN books b ON b.id = v.book_id
+        WHERE v.ordinal IN (SELECT rowid FROM verses_fts WHERE verses_fts MATCH 'restored:(lord OR god)')
+          AND (v.restored GLOB '*LORD*' OR v.restored GLOB '*GOD*')
+        ORDER BY v.ordinal
+        """,
+    ),
+}
+
+
+def read_report(report_path: Optional[str]) -> Dict[str, int]:
+    """{rule description: count} from a restore_names.py replacements report"""
+    if not report_path or not os.path.exists(report_path):
+        return {}
+    with io.open(report_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        return {row[0]: int(row[1]) for row in reader if len(row) >= 2}
+
+
+def batched(rows: Iterable[tuple], size: int = BATCH_SIZE) -> Iterable[List[tuple]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def export_sqlite(corpus, out_path: str, original=None, cfg_json: Optional[dict] = None,
+                  report: Optional[Dict[str, int]] = None, translation: str = "") -> dict:
+    """Write the database to out_path (replacing it) and return row counts"""
+    verse_map = VerseMap.from_corpus(corpus)
+    rules = compile_rules(cfg_json or {})
+    rule_specs = (cfg_json or {}).get("rules", [])
+    report = report or {}
+
+    tmp_path = out_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.executescript(SCHEMA)
+
+    counts = {"books": 0, "chapters": 0, "verses": 0, "replacements": 0}
+    rule_hits = [0] * len(rules)
+    book_ids = {entry["name"]: i + 1 for i, entry in enumerate(verse_map.books)}
+
+    def verse_rows():
+        for ordinal, book, chapter, verse, text in iter_verses(corpus):
+            original_text = None
+            if original is not None and book in original:
+                original_text = original[book].get(chapter, {}).get(verse)
+            yield ordinal, book_ids[book], int(chapter), int(verse), text, original_text
+
+    # Rules apply in sequence, but a verse none of them matches is left unchanged
+    any_rule = re.compile("|".join(f"(?:{pat.pattern})" for pat, _repl, _desc in rules)) if rules else None
+
+    def replacement_rows(rows):
+        for ordinal, _book_id, _chapter, _verse, _text, original_text in rows:
+            if original_text is None or any_rule is None or not any_rule.search(original_text):
+                continue
+            _restored, hits = apply_rules(original_text, rules)
+            for rule_idx, (_desc, count) in enumerate(hits):
+                if count:
+                    rule_hits[rule_idx] += count
+                    yield ordinal, rule_idx + 1, count
+
+    with conn:
+        conn.execute("BEGIN")
+        for entry in verse_map.books:
+            name = entry["name"]
+            conn.execute("INSERT INTO books VALUES (?, ?, ?, ?)",
+                         (book_ids[name], name, testament_of(name), verse_map.chapter_count(name)))
+            counts["books"] += 1
+            for chapter in range(1, verse_map.chapter_count(name) + 1):
+                first, end = verse_map.chapter_range(name, chapter)
+                conn.execute("INSERT INTO chapters VALUES (?, ?, ?, ?)", (book_ids[name], chapter, first, end - first))
+                counts["chapters"] += 1
+
+        for batch in batched(verse_rows()):
+            conn.executemany("INSERT INTO verses VALUES (?, ?, ?, ?, ?, ?)", batch)
+            counts["verses"] += len(batch)
+            hits = list(replacement_rows(batch))
+            conn.executemany("INSERT INTO replacements VALUES (?, ?, ?)", hits)
+            counts["replacements"] += len(hits)
+
+        conn.executemany(
+            "INSERT INTO rules VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (i + 1, desc or pat.pattern, spec["pattern"], repl, report.get(desc or pat.pattern), rule_hits[i])
+                for i, ((pat, repl, desc), spec) in enumerate(zip(rules, rule_specs))
+            ],
+        )
+        conn.execute("INSERT INTO verses_fts(verses_fts) VALUES ('rebuild')")
+        for statement in INDEXES:
+            conn.execute(statement)
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ("schema_version", str(SCHEMA_VERSION)),
+            ("translation", translation),
+            ("built_at", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())),
+            ("has_original", "1" if original is not None else "0"),
+        ])
+
+    conn.execute("PRAGMA optimize")
+    conn.close()
+    os.replace(tmp_path, out_path)
+    return counts
+
+
+def run_query(db_path: str, sql: str, limit: int) -> None:
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    start = time.perf_counter()
+    rows = conn.execute(sql).fetchall()
+    elapsed = (time.perf_counter() - start) * 1000
+    conn.close()
+    print(f"{len(rows)} rows ({elapsed:.2f} ms)")
+    for row in rows[:limit]:
+        print("  " + " | ".join("" if value is None else str(value) for value in row))
+    if len(rows) > limit:
+        print(f"  ... {len(rows) - limit} more")
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export the restored corpus to SQLite with FTS5")
+    parser.add_argument("corpus", nargs="?", help="Restored translation directory or full-Bible JSON")
+    parser.add_argument("--original", default="data/kjv.json", help="Original KJV JSON (fetch_kjv.py output)")
+    parser.add_argument("--config", default="config/restored_names_config.json", help="Restoration rules")
+    parser.add_argument("--report", default="build/replacements_report.csv", help="restore_names.py replacements report")
+    parser.add_argument("--translation", default="restored_kjv", help="Translation id recorded in meta")
+    parser.add_argument("--out", default="build/restored_kjv.sqlite", help="Database path")
+    parser.add_argument("--example", choices=sorted(EXAMPLES), help="Run a named example query")
+    parser.add_argument("--sql", help="Run a SQL query against the database")
+    parser.add_argument("--limit", type=int, default=10, help="Rows to print (default: 10)")
+    args = parser.parse_args(argv)
+
+    if args.corpus:
+        if not os.path.exists(args.corpus):
+            print(f"Error: {args.corpus} not found!")
+            return 1
+        original = None
+        if args.original and os.path.exists(args.original):
+            original = open_corpus(args.original)
+        else:
+            print(f"Warning: {args.original} not found, exporting without original text")
+        cfg_json = load_json(args.config) if os.path.exists(args.config) else {}
+
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        start = time.perf_counter()
+        counts = export_sqlite(open_corpus(args.corpus), args.out, original, cfg_json,
+                               read_report(args.report), args.translation)
+        print(f"✓ SQLite export: {counts['books']} books, {counts['chapters']} chapters, "
+              f"{counts['verses']} verses, {counts['replacements']} replacement rows "
+              f"({os.path.getsize(args.out) / 1024 / 1024:.1f} MB) in {time.perf_counter() - start:.2f}s")
+
+    if args.example or args.sql:
+        if not os.path.exists(args.out):
+            print(f"Error: {args.out} not found! Export the corpus first.")
+            return 1
+        if args.example:
+            title, sql = EXAMPLES[args.example]
+            print(f"\n{title}:")
+            run_query(args.out, sql, args.limit)
+        if args.sql:
+            run_query(args.out, args.sql, args.limit)
+
+    if not args.corpus and not args.example and not args.sql:
+        parser.print_usage()
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
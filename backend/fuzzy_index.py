@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Trigram index over the term dictionary for typo-tolerant search
+
+Users misspell the restored names ("Yahushua", "Elohim" for "Elohiym").
+Instead of fuzzy-scoring every verse per keystroke, a fuzzy query first
+picks candidate terms that share trigrams with the input, keeps those
+within a small edit distance, and only then reads the exact postings of
+those terms from the search index.
+
+Output (--out, next to the search index):
+  {"version": 1, "terms": [...sorted terms], "df": [...],
+   "trigrams": {"$ya": [term id deltas...], ...}}
+
+Terms are padded with "$" on both sides, so "yah" yields "$ya", "yah",
+"ah$". Term id lists are sorted and delta-encoded.
+
+Usage:
+  python fuzzy_index.py ../frontend/public/translations/index/
+  python fuzzy_index.py ../frontend/public/translations/index/ --query "Yahushua Elohim"
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from search_index import ShardedIndex, read_shard_terms, tokenize
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+TRIGRAMS_FILE = "trigrams.json"
+PAD = "$"
+MIN_OVERLAP = 0.4
+
+
+def trigrams(term: str) -> List[str]:
+    padded = f"{PAD}{term}{PAD}"
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def max_edits(term: str) -> int:
+    """Allowed edit distance for a query word: 0 up to 3 chars, 1 up to 5, else 2"""
+    if len(term) <= 3:
+        return 0
+    if len(term) <= 5:
+        return 1
+    return 2
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, returning limit + 1 as soon as it must exceed limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            cost = previous[j - 1] + (ca != cb)
+            cost = min(cost, previous[j] + 1, current[j - 1] + 1)
+            current.append(cost)
+            row_min = min(row_min, cost)
+        if row_min > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def index_terms(index_dir: str) -> Dict[str, int]:
+    """{term: df} for every term in a search_index.py directory"""
+    index = ShardedIndex(index_dir)
+    terms: Dict[str, int] = {}
+    for key in index.manifest["shards"]:
+        with open(os.path.join(index_dir, f"{key}.idx"), "rb") as f:
+            shard_terms, _base = read_shard_terms(f.read())
+        for term, (_offset, df) in shard_terms.items():
+            terms[term] = df
+    return terms
+
+
+def build_trigram_index(terms: Dict[str, int]) -> dict:
+    ordered = sorted(terms)
+    grams: Dict[str, List[int]] = defaultdict(list)
+    for term_id, term in enumerate(ordered):
+        for gram in sorted(set(trigrams(term))):
+            grams[gram].append(term_id)
+
+    encoded = {}
+    for gram in sorted(grams):
+        previous = 0
+        deltas = []
+        for term_id in grams[gram]:
+            deltas.append(term_id - previous)
+            previous = term_id
+        encoded[gram] = deltas
+
+    return {
+        "version": 1,
+        "terms": ordered,
+        "df": [terms[term] for term in ordered],
+        "trigrams": encoded,
+    }
+
+
+class TrigramIndex:
+    """Reference implementation of the fuzzy term lookup"""
+
+    def __init__(self, data: dict):
+        self.terms: List[str] = data["terms"]
+        self.df: List[int] = data["df"]
+        self._term_ids = {term: i for i, term in enumerate(self.terms)}
+        self._grams: Dict[str, List[int]] = {}
+        for gram, deltas in data["trigrams"].items():
+            ids = []
+            current = 0
+            for delta in deltas:
+                current += delta
+                ids.append(current)
+            self._grams[gram] = ids
+
+    @classmethod
+    def load(cls, path: str) -> "TrigramIndex":
+        with io.open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def candidates(self, word: str, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Terms within the edit budget of word, as [(term, distance), ...]
+        sorted by distance and then by descending document frequency.
+        """
+        limit = max_edits(word) if limit is None else limit
+        if word in self._term_ids and limit == 0:
+            return [(word, 0)]
+
+        query_grams = set(trigrams(word))
+        overlap: Dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for term_id in self._grams.get(gram, ()):
+                overlap[term_id] += 1
+
+        # Each edit destroys at most 3 trigrams; also require a share of them
+        needed = max(1, min(len(query_grams) - 3 * limit, int(len(query_grams) * MIN_OVERLAP)))
+        matches = []
+        for term_id, shared in overlap.items():
+            if shared < needed:
+                continue
+            term = self.terms[term_id]
+            distance = edit_distance(word, term, limit)
+            if distance <= limit:
+                matches.append((term, distance, -self.df[term_id]))
+
+        matches.sort(key=lambda m: (m[1], m[2], m[0]))
+        return [(term, distance) for term, distance, _df in matches]
+
+
+def fuzzy_search(index: ShardedIndex, trigram_index: TrigramIndex, query: str) -> List[int]:
+    """
+    Verse ordinals matching every query word, where each word matches any
+    term within its edit budget (OR within a word, AND across words).
+    """
+    result: Optional[Set[int]] = None
+    for word in dict.fromkeys(tokenize(query)):
+        ordinals: Set[int] = set()
+        for term, _distance in trigram_index.candidates(word):
+            ordinals.update(index.ordinals(term))
+        result = ordinals if result is None else result & ordinals
+        if not result:
+            return []
+    return sorted(result or ())
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build or query the trigram term index")
+    parser.add_argument("index_dir", help="search_index.py output directory")
+    parser.add_argument("--out", help=f"Output path (default: <index_dir>/{TRIGRAMS_FILE})")
+    parser.add_argument("--query", help="Fuzzy query to run after building")
+    parser.add_argument("--limit", type=int, default=10, help="Results to print (default: 10)")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.index_dir):
+        print(f"Error: {args.index_dir} not found! Run search_index.py first.")
+        return 1
+
+    out_path = args.out or os.path.join(args.index_dir, TRIGRAMS_FILE)
+    start = time.perf_counter()
+    data = build_trigram_index(index_terms(args.index_dir))
+    with io.open(out_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    print(f"✓ Trigram index: {len(data['terms'])} terms, {len(data['trigrams'])} trigrams, "
+          f"{os.path.getsize(out_path) / 1024:.0f} KB in {time.perf_counter() - start:.2f}s")
+
+    if args.query:
+        index = ShardedIndex(args.index_dir)
+        trigram_index = TrigramIndex(data)
+        for word in tokenize(args.query):
+            print(f"  {word} -> {trigram_index.candidates(word)[:5]}")
+        start = time.perf_counter()
+        hits = fuzzy_search(index, trigram_index, args.query)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"'{args.query}': {len(hits)} verses ({elapsed:.2f} ms)")
+        for ordinal in hits[:args.limit]:
+            print(f"  {index.verse_map.ref_string(ordinal)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 """
 Generate PDF or DOCX version of the Restored Names Bible
-Requires: pip install reportlab python-docx
+Requires: pip install reportlab pypdf python-docx
 """
 
 import json
 import argparse
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import sys
 import os
+import tempfile
+import time
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -19,88 +23,21 @@ except ImportError:
     print("Warning: Could not import modernize_language module")
     modernize_bible = None
 
-def bold_hebrew_names(text):
-    """Replace Hebrew names with bold versions for PDF"""
-    hebrew_names = [
-        'Yahuah', 'Elohiym', 'Yahusha', 'Mashiach', 'Ruach',
-        'Qodesh', 'Shaddai', 'Elyon', 'Adonai', 'El',
-        'Yahweh', 'YHWH', 'Yah', "Ha'Qodesh", "Ha'Mashiach"
-    ]
-    
-    result = text
-    for name in hebrew_names:
-        # Case-sensitive replacement with bold tags
-        result = result.replace(name, f'<b>{name}</b>')
-    
-    return result
+from corpus import OT_BOOKS, open_corpus
+from docx_stream import write_docx
+from name_emphasis import bold_names, name_segments
+from references import select_corpus
+from render_cache import DEFAULT_CACHE_DIR, RenderCache, book_fingerprint, fingerprint, generator_fingerprint
 
 
-def generate_pdf(bible_data, output_path, include_toc=True, two_column=False, subtitle=None):
-    """Generate a PDF version of the Bible"""
-    try:
-        from reportlab.lib.pagesizes import letter, A4
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
-        from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER
-        from reportlab.lib import colors
-    except ImportError:
-        print("Error: reportlab not installed. Run: pip install reportlab")
-        return False
+def pdf_styles():
+    """Paragraph styles of the printed edition (requires reportlab)"""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER
+    from reportlab.lib import colors
 
-    print(f"Generating PDF: {output_path}")
-    
-    # Variable to track current book and chapter for headers
-    current_book = [None]
-    current_chapter = [None]
-    
-    def add_header_footer(canvas, doc):
-        """Add running header with book/chapter and page number"""
-        canvas.saveState()
-        
-        # Header - Running head with book and chapter (only on content pages)
-        if current_book[0] and doc.page > 2:  # Skip first few pages (title, TOC)
-            canvas.setFont('Helvetica-Oblique', 9)
-            canvas.setFillColor(colors.HexColor('#4a5568'))
-            
-            # Left side: Book name
-            canvas.drawString(0.75*inch, letter[1] - 0.5*inch, current_book[0])
-            
-            # Right side: Chapter number
-            if current_chapter[0]:
-                chapter_text = f"Chapter {current_chapter[0]}"
-                canvas.drawRightString(letter[0] - 0.75*inch, letter[1] - 0.5*inch, chapter_text)
-            
-            # Draw a subtle line under header
-            canvas.setStrokeColor(colors.HexColor('#e2e8f0'))
-            canvas.setLineWidth(0.5)
-            canvas.line(0.75*inch, letter[1] - 0.55*inch, letter[0] - 0.75*inch, letter[1] - 0.55*inch)
-        
-        # Footer - Page number (on all pages except title)
-        if doc.page > 1:
-            canvas.setFont('Helvetica', 9)
-            canvas.setFillColor(colors.HexColor('#718096'))
-            page_num = f"{doc.page - 1}"  # Just the number
-            canvas.drawCentredString(letter[0]/2, 0.5*inch, page_num)
-        
-        canvas.restoreState()
-    
-    # Create PDF document
-    doc = SimpleDocTemplate(
-        str(output_path),
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=1*inch,  # Increased for header
-        bottomMargin=0.75*inch,
-    )
-    
-    # Container for the 'Flowable' objects
-    elements = []
-    
-    # Define styles
     styles = getSampleStyleSheet()
-    
+
     # Title page style
     title_style = ParagraphStyle(
         'CustomTitle',
@@ -112,7 +49,7 @@ def generate_pdf(bible_data, output_path, include_toc=True, two_column=False, su
         fontName='Times-Bold',
         leading=42
     )
-    
+
     subtitle_style = ParagraphStyle(
         'Subtitle',
         parent=styles['Normal'],
@@ -123,7 +60,7 @@ def generate_pdf(bible_data, output_path, include_toc=True, two_column=False, su
         fontName='Times-Italic',
         leading=20
     )
-    
+
     hebrew_names_style = ParagraphStyle(
         'HebrewNames',
         parent=styles['Normal'],
@@ -134,7 +71,7 @@ def generate_pdf(bible_data, output_path, include_toc=True, two_column=False, su
         fontName='Times-Bold',
         leading=18
     )
-    
+
     # Book title style - elegant and prominent
     book_style = ParagraphStyle(
         'BookTitle',
@@ -147,7 +84,7 @@ def generate_pdf(bible_data, output_path, include_toc=True, two_column=False, su
         fontName='Times-Bold',
         leading=28
     )
-    
+
     # Chapter style - subtle and elegant
     chapter_style = ParagraphStyle(
         'ChapterTitle',
@@ -159,7 +96,7 @@ def generate_pdf(bible_data, output_path, include_toc=True, two_column=False, su
         fontName='Times-Bold',
         leading=20
     )
-    
+
     # Verse style - optimized for readability
     verse_style = ParagraphStyle(
         'VerseText',
@@ -173,7 +110,7 @@ def generate_pdf(bible_data, output_path, include_toc=True, two_column=False, su
         leftIndent=0,
         rightIndent=0
     )
-    
+
     # First verse style with drop cap effect (simulated)
     first_verse_style = ParagraphStyle(
         'FirstVerseText',
@@ -181,135 +118,519 @@ def generate_pdf(bible_data, output_path, include_toc=True, two_column=False, su
         spaceBefore=6,
         spaceAfter=4
     )
-    
-    verse_number_style = ParagraphStyle(
-        'VerseNumber',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.HexColor('#718096'),
-        fontName='Helvetica-Bold'
+
+    return {
+        'title': title_style,
+        'subtitle': subtitle_style,
+        'hebrew_names': hebrew_names_style,
+        'book': book_style,
+        'chapter': chapter_style,
+        'verse': verse_style,
+        'first_verse': first_verse_style,
+        'testament': styles['Heading3'],
+    }
+
+
+def pdf_document(output_path):
+    """Letter-size document with room for the running header"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate
+
+    return SimpleDocTemplate(
+        str(output_path),
+        pagesize=letter,
+        rightMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        topMargin=1*inch,  # Increased for header
+        bottomMargin=0.75*inch,
     )
-    
+
+
+def draw_running_header(canvas, book, chapter=None):
+    """Book name (left), chapter (right) and a rule across the top of a page"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+
+    canvas.setFont('Helvetica-Oblique', 9)
+    canvas.setFillColor(colors.HexColor('#4a5568'))
+
+    # Left side: Book name
+    canvas.drawString(0.75*inch, letter[1] - 0.5*inch, book)
+
+    # Right side: Chapter number
+    if chapter:
+        chapter_text = f"Chapter {chapter}"
+        canvas.drawRightString(letter[0] - 0.75*inch, letter[1] - 0.5*inch, chapter_text)
+
+    # Draw a subtle line under header
+    canvas.setStrokeColor(colors.HexColor('#e2e8f0'))
+    canvas.setLineWidth(0.5)
+    canvas.line(0.75*inch, letter[1] - 0.55*inch, letter[0] - 0.75*inch, letter[1] - 0.55*inch)
+
+
+def draw_page_number(canvas, number):
+    """Page number centered in the footer"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+
+    canvas.setFont('Helvetica', 9)
+    canvas.setFillColor(colors.HexColor('#718096'))
+    canvas.drawCentredString(letter[0]/2, 0.5*inch, str(number))
+
+
+def front_matter_flowables(chapter_counts, styles, include_toc=True, subtitle=None, book_pages=None):
+    """
+    Title page and table of contents; chapter_counts maps book -> chapters
+    in print order, book_pages (optional) maps book -> printed page number.
+    """
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, Spacer, PageBreak, Table, TableStyle, HRFlowable
+    from reportlab.lib import colors
+
+    elements = []
+
     # Title page - elegant design
     elements.append(Spacer(1, 1.5*inch))
-    
+
     # Decorative line centered
-    from reportlab.platypus import HRFlowable
-    hr_style = HRFlowable(width="30%", thickness=1, color=colors.HexColor('#2c5282'), 
+    hr_style = HRFlowable(width="30%", thickness=1, color=colors.HexColor('#2c5282'),
                           spaceAfter=30, spaceBefore=0, hAlign='CENTER')
     elements.append(hr_style)
-    
-    elements.append(Paragraph("The Holy Bible", title_style))
+
+    elements.append(Paragraph("The Holy Bible", styles['title']))
     elements.append(Spacer(1, 0.1*inch))
-    elements.append(Paragraph("King James Version", subtitle_style))
-    
+    elements.append(Paragraph("King James Version", styles['subtitle']))
+
     if subtitle:
-        elements.append(Paragraph(subtitle, subtitle_style))
+        elements.append(Paragraph(subtitle, styles['subtitle']))
     else:
-        elements.append(Paragraph("with Restored Hebrew Names", subtitle_style))
+        elements.append(Paragraph("with Restored Hebrew Names", styles['subtitle']))
         elements.append(Spacer(1, 0.4*inch))
-        elements.append(Paragraph("יהוה • אלהים • ישוע • משיח", hebrew_names_style))
+        elements.append(Paragraph("יהוה • אלהים • ישוע • משיח", styles['hebrew_names']))
         elements.append(Spacer(1, 0.1*inch))
-        elements.append(Paragraph("Yahuah • Elohiym • Yahusha • Mashiach", hebrew_names_style))
-    
+        elements.append(Paragraph("Yahuah • Elohiym • Yahusha • Mashiach", styles['hebrew_names']))
+
     elements.append(Spacer(1, 0.3*inch))
     # Decorative line
-    hr_style2 = HRFlowable(width="30%", thickness=1, color=colors.HexColor('#2c5282'), 
+    hr_style2 = HRFlowable(width="30%", thickness=1, color=colors.HexColor('#2c5282'),
                            spaceAfter=0, spaceBefore=30, hAlign='CENTER')
     elements.append(hr_style2)
-    
+
     elements.append(PageBreak())
-    
+
     # Table of Contents (optional)
     if include_toc:
-        elements.append(Paragraph("Table of Contents", book_style))
+        elements.append(Paragraph("Table of Contents", styles['book']))
         elements.append(Spacer(1, 0.3*inch))
-        
-        toc_data = []
-        for book_name in bible_data.keys():
-            chapter_count = len(bible_data[book_name])
-            toc_data.append([book_name, f"{chapter_count} chapters"])
-        
-        # Split into Old and New Testament
-        ot_books = [
-            "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy",
-            "Joshua", "Judges", "Ruth", "1 Samuel", "2 Samuel", "1 Kings", "2 Kings",
-            "1 Chronicles", "2 Chronicles", "Ezra", "Nehemiah", "Esther",
-            "Job", "Psalms", "Proverbs", "Ecclesiastes", "Song of Solomon",
-            "Isaiah", "Jeremiah", "Lamentations", "Ezekiel", "Daniel",
-            "Hosea", "Joel", "Amos", "Obadiah", "Jonah", "Micah", "Nahum",
-            "Habakkuk", "Zephaniah", "Haggai", "Zechariah", "Malachi"
-        ]
-        
-        elements.append(Paragraph("<b>Old Testament</b>", styles['Heading3']))
-        ot_toc = [[book, f"{len(bible_data[book])} chapters"] for book in ot_books if book in bible_data]
-        if ot_toc:
-            toc_table = Table(ot_toc, colWidths=[3*inch, 1.5*inch])
-            toc_table.setStyle(TableStyle([
+
+        def toc_row(book):
+            row = [book, f"{chapter_counts[book]} chapters"]
+            if book_pages is not None:
+                row.append(str(book_pages.get(book, '')))
+            return row
+
+        def toc_table(books):
+            col_widths = [3*inch, 1.5*inch] + ([1*inch] if book_pages is not None else [])
+            table = Table([toc_row(book) for book in books], colWidths=col_widths)
+            table.setStyle(TableStyle([
                 ('FONT', (0, 0), (-1, -1), 'Helvetica', 10),
                 ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+                ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
             ]))
-            elements.append(toc_table)
-        
+            return table
+
+        # Split into Old and New Testament
+        elements.append(Paragraph("<b>Old Testament</b>", styles['testament']))
+        ot_books = [book for book in OT_BOOKS if book in chapter_counts]
+        if ot_books:
+            elements.append(toc_table(ot_books))
+
         elements.append(Spacer(1, 0.2*inch))
-        elements.append(Paragraph("<b>New Testament</b>", styles['Heading3']))
-        nt_toc = [[book, f"{len(bible_data[book])} chapters"] for book in bible_data.keys() if book not in ot_books]
-        if nt_toc:
-            toc_table = Table(nt_toc, colWidths=[3*inch, 1.5*inch])
-            toc_table.setStyle(TableStyle([
-                ('FONT', (0, 0), (-1, -1), 'Helvetica', 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ]))
-            elements.append(toc_table)
-        
+        elements.append(Paragraph("<b>New Testament</b>", styles['testament']))
+        nt_books = [book for book in chapter_counts if book not in OT_BOOKS]
+        if nt_books:
+            elements.append(toc_table(nt_books))
+
         elements.append(PageBreak())
-    
+
+    return elements
+
+
+def book_flowables(book_name, chapters, styles):
+    """
+    Book title, chapter headings and verses. The book title carries a
+    bible_book attribute and chapter headings a bible_chapter attribute, so
+    layout hooks (PageRecorder) can tell where books and chapters land.
+    """
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, Spacer
+
+    elements = []
+
+    # Book title
+    book_title = Paragraph(book_name, styles['book'])
+    book_title.bible_book = book_name
+    elements.append(book_title)
+    elements.append(Spacer(1, 0.2*inch))
+
+    for chapter_num in sorted(chapters.keys(), key=int):
+        verses = chapters[chapter_num]
+
+        # Chapter heading with decorative styling
+        chapter_heading = Paragraph(f'<font size="16"><b>Chapter {chapter_num}</b></font>', styles['chapter'])
+        chapter_heading.bible_chapter = chapter_num
+        elements.append(chapter_heading)
+
+        # Add subtle separator after chapter heading
+        elements.append(Spacer(1, 0.05*inch))
+
+        # Verses
+        verse_nums = sorted(verses.keys(), key=int)
+        for idx, verse_num in enumerate(verse_nums):
+            verse_text = verses[verse_num]
+
+            # Bold Hebrew names (escaped paragraph markup, one <b> per name)
+            verse_text_formatted = bold_names(verse_text)
+
+            # Use special style for first verse of chapter (slight emphasis)
+            style_to_use = styles['first_verse'] if idx == 0 else styles['verse']
+
+            # Format verse with number (smaller, superscript)
+            verse_html = f'<super><font size="7" color="#9ca3af">{verse_num}</font></super> {verse_text_formatted}'
+            elements.append(Paragraph(verse_html, style_to_use))
+
+    return elements
+
+
+class PageRecorder:
+    """
+    Layout hooks that note where books and chapters land during the one
+    layout pass of a document, using the bible_book/bible_chapter attributes
+    of the existing heading paragraphs (no marker flowables).
+
+    marks: (book, chapter, page index) per book title (chapter None) and
+    chapter heading. heads: (book, chapter) in effect at the top of each
+    page; on_page(canvas, book, chapter), if given, draws it on the page.
+    """
+
+    def __init__(self, doc, book=None, on_page=None):
+        from reportlab.platypus.doctemplate import ActionFlowable
+        from reportlab.platypus.flowables import NullDraw
+
+        self.doc = doc
+        self.book = book
+        self.chapter = None
+        self.on_page = on_page
+        self.marks = []
+        self.heads = []
+        self._top = None
+        # Page breaks and the page-begin actions reportlab queues draw nothing
+        self._no_content = (ActionFlowable, NullDraw)
+        doc.afterFlowable = self.after_flowable
+        doc.afterPage = self.after_page
+
+    def after_flowable(self, flowable):
+        book = getattr(flowable, 'bible_book', None)
+        if book is not None:
+            self.book, self.chapter = book, None
+            self.marks.append((book, None, self.doc.page - 1))
+        chapter = getattr(flowable, 'bible_chapter', None)
+        if chapter is not None:
+            self.chapter = chapter
+            self.marks.append((self.book, chapter, self.doc.page - 1))
+        if self._top is None and not isinstance(flowable, self._no_content):
+            self._top = (self.book, self.chapter)
+
+    def after_page(self):
+        # A page opening with a book title is headed by its first chapter
+        top = self._top
+        if top is None or top[1] is None:
+            top = (self.book, self.chapter)
+        self.heads.append(top)
+        self._top = None
+        if self.on_page is not None and top[0]:
+            canvas = self.doc.canv
+            canvas.saveState()
+            self.on_page(canvas, *top)
+            canvas.restoreState()
+
+
+def render_front_matter(path, chapter_counts, include_toc=True, subtitle=None, book_pages=None):
+    """Title page and table of contents as their own PDF; returns its page count"""
+    from reportlab.platypus import PageBreak
+
+    doc = pdf_document(path)
+    elements = front_matter_flowables(chapter_counts, pdf_styles(), include_toc, subtitle, book_pages)
+    # A trailing page break would leave a blank last page in a part file
+    while elements and isinstance(elements[-1], PageBreak):
+        elements.pop()
+    doc.build(elements)
+    return doc.page
+
+
+def page_map_path(output_path):
+    """Page map written next to a PDF: build/restored_kjv_bible.pages.json"""
+    return Path(output_path).with_suffix('.pages.json')
+
+
+def assemble_pdf(output_path, body_parts, chapter_counts, include_toc=True, subtitle=None):
+    """
+    Finish a PDF whose body has been laid out once: render the front matter
+    last, with the TOC page numbers the body parts recorded, and merge it in
+    front; stamp global page numbers (the title page is unnumbered, so a
+    page's number is its index); add an outline entry per book with its
+    chapters beneath it; and write the page map (page -> book/chapter).
+
+    body_parts is [(path, pages, marks, heads)] in print order, marks and
+    heads as recorded by PageRecorder. Returns the page count.
+    """
+    from reportlab.pdfgen import canvas as pdf_canvas
+    from reportlab.lib.pagesizes import letter
+    from pypdf import PdfReader, PdfWriter
+
+    # Marks and heads with page indexes counted from the first body page
+    marks = []
+    heads = []
+    offset = 0
+    for path, pages, part_marks, part_heads in body_parts:
+        marks.extend((book, chapter, offset + idx) for book, chapter, idx in part_marks)
+        heads.extend(part_heads)
+        offset += pages
+
+    with tempfile.TemporaryDirectory(prefix='bible_pdf_') as tmp_dir:
+        # The TOC has one row per book whatever the numbers are, so a wrong
+        # first guess of its length is settled by one more (small) render
+        front_path = os.path.join(tmp_dir, 'front.pdf')
+        front_pages = 2 if include_toc else 1
+        while True:
+            book_pages = {book: front_pages + idx for book, chapter, idx in marks if chapter is None}
+            rendered = render_front_matter(front_path, chapter_counts, include_toc, subtitle,
+                                           book_pages if include_toc else None)
+            if rendered == front_pages:
+                break
+            front_pages = rendered
+
+        print("Assembling PDF (front matter, page numbers, outline)...")
+        writer = PdfWriter()
+        for path in [front_path] + [part[0] for part in body_parts]:
+            for page in PdfReader(path).pages:
+                writer.add_page(page)
+
+        # Global page numbers, drawn once into a stamp document
+        total = len(writer.pages)
+        stamp_path = os.path.join(tmp_dir, 'numbers.pdf')
+        stamp = pdf_canvas.Canvas(stamp_path, pagesize=letter)
+        for page_idx in range(total):
+            if page_idx > 0:
+                draw_page_number(stamp, page_idx)
+            stamp.showPage()
+        stamp.save()
+        numbers = PdfReader(stamp_path)
+        for page_idx in range(1, total):
+            writer.pages[page_idx].merge_page(numbers.pages[page_idx])
+
+        parent = None
+        for book, chapter, idx in marks:
+            if chapter is None:
+                parent = writer.add_outline_item(book, front_pages + idx)
+            else:
+                writer.add_outline_item(f"Chapter {chapter}", front_pages + idx, parent=parent)
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'wb') as f:
+            writer.write(f)
+
+    page_map = {
+        'pages': total,
+        'front_matter': front_pages,
+        'books': {book: front_pages + idx for book, chapter, idx in marks if chapter is None},
+        'chapters': [[book, chapter, front_pages + idx] for book, chapter, idx in marks if chapter is not None],
+        'page_map': [
+            {'page': front_pages + idx, 'book': book, 'chapter': chapter}
+            for idx, (book, chapter) in enumerate(heads)
+        ],
+    }
+    with open(page_map_path(output_path), 'w', encoding='utf-8') as f:
+        json.dump(page_map, f, ensure_ascii=False, indent=1)
+    return total
+
+
+def generate_pdf(bible_data, output_path, include_toc=True, two_column=False, subtitle=None):
+    """
+    Generate a PDF version of the Bible. The books are laid out once, as one
+    document, while PageRecorder notes where books and chapters land and
+    heads each page with the book and chapter at its top; the front matter
+    is rendered afterwards with real TOC page numbers and merged in front
+    (assemble_pdf).
+    """
+    try:
+        from reportlab.platypus import PageBreak
+    except ImportError:
+        print("Error: reportlab not installed. Run: pip install reportlab")
+        return False
+    try:
+        import pypdf  # noqa: F401  (used by assemble_pdf)
+    except ImportError:
+        print("Error: pypdf not installed. Run: pip install pypdf")
+        return False
+
+    print(f"Generating PDF: {output_path}")
+    start = time.perf_counter()
+
+    styles = pdf_styles()
+    chapter_counts = {book_name: len(bible_data[book_name]) for book_name in bible_data.keys()}
+
+    # Container for the 'Flowable' objects
+    elements = []
+
     # Generate content
     for book_name, chapters in bible_data.items():
         print(f"  Processing: {book_name}")
-        
-        # Update current book for header
-        current_book[0] = book_name
-        
-        # Book title
-        elements.append(Paragraph(book_name, book_style))
-        elements.append(Spacer(1, 0.2*inch))
-        
-        for chapter_num in sorted(chapters.keys(), key=int):
-            verses = chapters[chapter_num]
-            
-            # Update current chapter for header
-            current_chapter[0] = chapter_num
-            
-            # Chapter heading with decorative styling
-            chapter_heading = f'<font size="16"><b>Chapter {chapter_num}</b></font>'
-            elements.append(Paragraph(chapter_heading, chapter_style))
-            
-            # Add subtle separator after chapter heading
-            elements.append(Spacer(1, 0.05*inch))
-            
-            # Verses
-            verse_nums = sorted(verses.keys(), key=int)
-            for idx, verse_num in enumerate(verse_nums):
-                verse_text = verses[verse_num]
-                
-                # Bold Hebrew names
-                verse_text_formatted = bold_hebrew_names(verse_text)
-                
-                # Use special style for first verse of chapter (slight emphasis)
-                style_to_use = first_verse_style if idx == 0 else verse_style
-                
-                # Format verse with number (smaller, superscript)
-                verse_html = f'<super><font size="7" color="#9ca3af">{verse_num}</font></super> {verse_text_formatted}'
-                elements.append(Paragraph(verse_html, style_to_use))
-        
-        # Page break after each book
-        elements.append(PageBreak())
-    
-    # Build PDF with header/footer
-    print("Building PDF document...")
-    doc.build(elements, onFirstPage=add_header_footer, onLaterPages=add_header_footer)
-    print(f"✓ PDF generated: {output_path}")
+
+        # Page break between books
+        if elements:
+            elements.append(PageBreak())
+        elements.extend(book_flowables(book_name, chapters, styles))
+
+    with tempfile.TemporaryDirectory(prefix='bible_pdf_') as tmp_dir:
+        body_path = os.path.join(tmp_dir, 'body.pdf')
+        doc = pdf_document(body_path)
+        # Running headers follow the headings as they are laid out
+        recorder = PageRecorder(doc, on_page=draw_running_header)
+
+        print("Building PDF document...")
+        doc.build(elements)
+        total = assemble_pdf(output_path, [(body_path, doc.page, recorder.marks, recorder.heads)],
+                             chapter_counts, include_toc, subtitle)
+
+    print(f"✓ PDF generated: {output_path} ({total} pages in {time.perf_counter() - start:.1f}s)")
+    return True
+
+
+# Corpus each generate_pdf_parallel worker process reads its books from
+_part_corpus = {}
+
+
+def part_chapters(book_name, source, selection):
+    """
+    A book's chapters for render_pdf_part: source is a corpus path, opened
+    once per worker process and limited to selection, or the chapters.
+    """
+    if not isinstance(source, str):
+        return source
+    key = (source, tuple(selection or ()))
+    if key not in _part_corpus:
+        _part_corpus.clear()
+        _part_corpus[key] = open_bible(source, selection)
+    return _part_corpus[key][book_name]
+
+
+def render_pdf_part(task):
+    """
+    Process-pool worker: render one book to its own PDF, with running
+    headers but without page numbers. Returns (book, path, page count,
+    marks, heads) as recorded by PageRecorder.
+    """
+    book_name, source, selection, path = task
+    chapters = part_chapters(book_name, source, selection)
+
+    doc = pdf_document(path)
+    recorder = PageRecorder(doc, book_name, on_page=draw_running_header)
+    doc.build(book_flowables(book_name, chapters, pdf_styles()))
+    return book_name, path, doc.page, recorder.marks, recorder.heads
+
+
+def pdf_style_fingerprint():
+    """Fingerprint of every attribute of the printed-edition paragraph styles"""
+    return fingerprint({
+        name: [(key, repr(getattr(style, key))) for key in sorted(style.defaults)]
+        for name, style in pdf_styles().items()
+    })
+
+
+def generate_pdf_parallel(bible_data, output_path, include_toc=True, subtitle=None, workers=None, cache=None,
+                          corpus_path=None, selection=None):
+    """
+    Generate the PDF by rendering each book as a separate document in a
+    process pool, then assembling them behind the front matter
+    (assemble_pdf).
+
+    Each worker lays out one book at a time, so peak memory is one book per
+    worker. When bible_data was opened from corpus_path (with selection),
+    workers are sent book names and read the books from the corpus
+    themselves instead of receiving pickled chapters. Page numbers are
+    stamped over the merged pages, so numbering is global, as in
+    generate_pdf.
+
+    With a RenderCache, book parts are kept under their fingerprints and
+    only books that changed are rendered.
+    """
+    try:
+        import reportlab  # noqa: F401
+    except ImportError:
+        print("Error: reportlab not installed. Run: pip install reportlab")
+        return False
+    try:
+        import pypdf  # noqa: F401
+    except ImportError:
+        print("Error: pypdf not installed. Run: pip install pypdf")
+        return False
+
+    workers = workers or os.cpu_count() or 1
+    print(f"Generating PDF: {output_path} ({workers} workers)")
+    start = time.perf_counter()
+
+    with tempfile.TemporaryDirectory(prefix='bible_pdf_') as tmp_dir:
+        books = list(bible_data.keys())
+        chapter_counts = {}
+        verse_counts = {}
+        for book_name in books:
+            chapters = bible_data[book_name]
+            chapter_counts[book_name] = len(chapters)
+            verse_counts[book_name] = sum(len(verses) for verses in chapters.values())
+
+        # Part fingerprints; without a cache, parts go to the temporary directory
+        part_keys = {}
+        if cache is not None:
+            base = (generator_fingerprint(), pdf_style_fingerprint())
+            for book_name in books:
+                part_keys[book_name] = fingerprint('pdf-book', base, book_name, book_fingerprint(bible_data[book_name]))
+
+        parts = {}
+        pending = []
+        for idx, book_name in enumerate(books):
+            if cache is None:
+                pending.append((book_name, os.path.join(tmp_dir, f'{idx:03d}.pdf')))
+                continue
+            path = cache.fragment_path('pdf', part_keys[book_name], '.pdf')
+            meta = cache.load_meta('pdf', part_keys[book_name])
+            if meta is not None and path.exists():
+                parts[book_name] = (str(path), meta['pages'], meta['marks'], meta['heads'])
+            else:
+                pending.append((book_name, str(path)))
+        if cache is not None:
+            print(f"  {len(parts)} cached parts, {len(pending)} to render")
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = []
+            # Longest books first so a long book does not start last
+            for book_name, path in sorted(pending, key=lambda item: -verse_counts[item[0]]):
+                source = corpus_path if corpus_path is not None else bible_data[book_name]
+                futures.append(pool.submit(render_pdf_part, (book_name, source, selection, path)))
+            for future in as_completed(futures):
+                book_name, path, pages, marks, heads = future.result()
+                parts[book_name] = (path, pages, marks, heads)
+                if cache is not None:
+                    cache.store_meta('pdf', part_keys[book_name], {'pages': pages, 'marks': marks, 'heads': heads})
+                print(f"  Rendered: {book_name} ({pages} pages)")
+
+        total = assemble_pdf(output_path, [parts[book_name] for book_name in books],
+                             chapter_counts, include_toc, subtitle)
+
+    print(f"✓ PDF generated: {output_path} ({total} pages in {time.perf_counter() - start:.1f}s)")
     return True
 
 
@@ -325,44 +646,12 @@ def generate_docx(bible_data, output_path, include_toc=True, subtitle_text=None)
     
     def add_verse_with_bold_names(paragraph, verse_text):
         """Add verse text to paragraph with Hebrew names in bold"""
-        hebrew_names = [
-            'Yahuah', 'Elohiym', 'Yahusha', 'Mashiach', 'Ruach',
-            'Qodesh', 'Shaddai', 'Elyon', 'Adonai', 'El',
-            'Yahweh', 'YHWH', 'Yah', "Ha'Qodesh", "Ha'Mashiach"
-        ]
-        
-        remaining_text = verse_text
-        
-        while remaining_text:
-            # Find the earliest occurrence of any Hebrew name
-            earliest_pos = len(remaining_text)
-            earliest_name = None
-            
-            for name in hebrew_names:
-                pos = remaining_text.find(name)
-                if pos != -1 and pos < earliest_pos:
-                    earliest_pos = pos
-                    earliest_name = name
-            
-            if earliest_name is None:
-                # No more names, add remaining text
-                run = paragraph.add_run(remaining_text)
-                run.font.size = Pt(11)
-                break
-            else:
-                # Add text before the name
-                if earliest_pos > 0:
-                    run = paragraph.add_run(remaining_text[:earliest_pos])
-                    run.font.size = Pt(11)
-                
-                # Add the name in bold
-                run_bold = paragraph.add_run(earliest_name)
-                run_bold.font.size = Pt(11)
-                run_bold.font.bold = True
-                run_bold.font.color.rgb = RGBColor(26, 54, 93)  # Dark blue for emphasis
-                
-                # Continue with remaining text
-                remaining_text = remaining_text[earliest_pos + len(earliest_name):]
+        for piece, is_name in name_segments(verse_text):
+            run = paragraph.add_run(piece)
+            run.font.size = Pt(11)
+            if is_name:
+                run.font.bold = True
+                run.font.color.rgb = RGBColor(26, 54, 93)  # Dark blue for emphasis
     
     print(f"Generating DOCX: {output_path}")
     
@@ -524,6 +813,170 @@ def generate_docx(bible_data, output_path, include_toc=True, subtitle_text=None)
     return True
 
 
+MODERNIZE_REPLACEMENTS = {
+    " thee ": " you ", " thou ": " you ", " thy ": " your ", " thine ": " your ",
+    " ye ": " you ", " art ": " are ", " hast ": " have ", " hadst ": " had ",
+    " doest ": " do ", " didst ": " did ", " wilt ": " will ", " shalt ": " shall ",
+    " shouldst ": " should ", " wouldst ": " would ", " mayest ": " may ",
+    " mightest ": " might ", " canst ": " can ", " couldst ": " could ",
+    " knowest ": " know ", " sayest ": " say ", " saith ": " says ",
+    " doth ": " does ", " hath ": " has ", " spake ": " spoke ",
+    " shew ": " show ", " shewed ": " showed ", " betwixt ": " between ",
+    " unto ": " to ",
+}
+
+
+def open_bible(input_path, selection=None):
+    """Lazy corpus for input_path, limited to the --books/--range selection if any"""
+    bible_data = open_corpus(str(input_path))
+    return select_corpus(bible_data, selection) if selection else bible_data
+
+
+def selection_slug(selection):
+    """File name suffix for a selection: ["Genesis 1-3"] -> "_genesis-1-3" """
+    slug = re.sub(r'[^a-z0-9]+', '-', ' '.join(selection).lower()).strip('-')
+    return f'_{slug}' if slug else ''
+
+
+def render_fingerprint(cache, fmt, bible_data, subtitle, options, modernized=False):
+    """
+    Artifact fingerprint of a render. A modernized artifact is fingerprinted
+    from the original text and the replacement table, so its freshness is
+    known before the text is modernized.
+    """
+    styles = ''
+    if fmt == 'pdf':
+        try:
+            styles = pdf_style_fingerprint()
+        except ImportError:
+            pass
+    render_options = {
+        'include_toc': options['include_toc'],
+        'subtitle': subtitle,
+        'engine': ('parallel' if options['parallel'] else 'single') if fmt == 'pdf' else options['docx_engine'],
+    }
+    if modernized:
+        render_options['modernize'] = MODERNIZE_REPLACEMENTS
+    return cache.artifact_fingerprint(fmt, bible_data, render_options, styles)
+
+
+def render_artifact(task):
+    """
+    Render one artifact; also the process-pool worker of run_render_graph.
+    source is a corpus path (reopened lazily in the worker, limited to
+    options['selection']) or Bible data. artifact_fp is the precomputed
+    fingerprint of a modernized artifact, None to fingerprint source.
+    Returns (ok, seconds, up to date), skipping the render when the cache
+    says the existing output came from the same inputs.
+    """
+    fmt, source, output_path, subtitle, options, artifact_fp = task
+    start = time.perf_counter()
+    bible_data = open_bible(source, options.get('selection')) if isinstance(source, str) else source
+
+    cache = RenderCache(options['cache_dir']) if options.get('cache_dir') else None
+    if cache is not None:
+        if artifact_fp is None:
+            artifact_fp = render_fingerprint(cache, fmt, bible_data, subtitle, options)
+        if cache.is_fresh(output_path, artifact_fp):
+            print(f"✓ Up to date: {output_path}")
+            return True, time.perf_counter() - start, True
+
+    if fmt == 'pdf' and options['parallel']:
+        corpus_path = source if isinstance(source, str) else None
+        ok = generate_pdf_parallel(bible_data, output_path, include_toc=options['include_toc'],
+                                   subtitle=subtitle, workers=options['workers'], cache=cache,
+                                   corpus_path=corpus_path, selection=options.get('selection'))
+    elif fmt == 'pdf':
+        ok = generate_pdf(bible_data, output_path, include_toc=options['include_toc'], subtitle=subtitle)
+    elif options['docx_engine'] == 'stream':
+        ok = write_docx(bible_data, output_path, include_toc=options['include_toc'], subtitle_text=subtitle,
+                        cache=cache)
+    else:
+        ok = generate_docx(bible_data, output_path, include_toc=options['include_toc'], subtitle_text=subtitle)
+
+    if ok and cache is not None:
+        cache.record(output_path, artifact_fp)
+    return ok, time.perf_counter() - start, False
+
+
+def artifact_label(version, fmt, fresh=False):
+    return f"{version} {fmt.upper()}" + (" (up to date)" if fresh else "")
+
+
+def run_render_graph(input_path, bible_data, artifacts, options, jobs=1):
+    """
+    Render artifacts [(version, format, output path, subtitle), ...].
+
+    Modernization runs once and feeds every modernized artifact, and is
+    skipped when the cache says every modernized artifact is up to date.
+    With jobs > 1 the renders run in a process pool: original-text renders
+    start right away and modernized ones as soon as the modernized text is
+    ready, so the build takes about as long as its slowest artifact. After
+    a successful build, cached fragments no artifact uses are pruned.
+    Returns [(label, output path, seconds, ok), ...] in artifact order.
+    """
+    results = {}
+    modernized = None
+
+    cache = RenderCache(options['cache_dir']) if options.get('cache_dir') else None
+    modernized_fps = {}
+    for idx, (version, fmt, output_path, subtitle) in enumerate(artifacts):
+        if version == 'modernized' and cache is not None:
+            started = time.perf_counter()
+            artifact_fp = render_fingerprint(cache, fmt, bible_data, subtitle, options, modernized=True)
+            if cache.is_fresh(output_path, artifact_fp):
+                print(f"✓ Up to date: {output_path}")
+                results[idx] = (artifact_label(version, fmt, True), output_path, time.perf_counter() - started, True)
+            else:
+                modernized_fps[idx] = artifact_fp
+    pending = [idx for idx in range(len(artifacts)) if idx not in results]
+
+    def modernize():
+        print("\nApplying language modernization...")
+        started = time.perf_counter()
+        data = modernize_bible(bible_data, MODERNIZE_REPLACEMENTS)
+        results['modernize'] = ('modernize (shared)', '', time.perf_counter() - started, True)
+        return data
+
+    if jobs <= 1:
+        for idx in pending:
+            version, fmt, output_path, subtitle = artifacts[idx]
+            if version == 'modernized' and modernized is None:
+                modernized = modernize()
+            # Original renders read the corpus from input_path, as in the pool
+            source = modernized if version == 'modernized' else input_path
+            task = (fmt, source, output_path, subtitle, options, modernized_fps.get(idx))
+            ok, seconds, fresh = render_artifact(task)
+            results[idx] = (artifact_label(version, fmt, fresh), output_path, seconds, ok)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {}
+            # Original renders reopen the corpus in the worker instead of pickling it
+            for idx in pending:
+                version, fmt, output_path, subtitle = artifacts[idx]
+                if version != 'modernized':
+                    futures[pool.submit(render_artifact, (fmt, input_path, output_path, subtitle, options, None))] = idx
+            # Modernize in this process while the pool renders
+            if any(artifacts[idx][0] == 'modernized' for idx in pending):
+                modernized = modernize()
+                for idx in pending:
+                    version, fmt, output_path, subtitle = artifacts[idx]
+                    if version == 'modernized':
+                        task = (fmt, modernized, output_path, subtitle, options, modernized_fps.get(idx))
+                        futures[pool.submit(render_artifact, task)] = idx
+            for future in as_completed(futures):
+                idx = futures[future]
+                version, fmt, output_path, _subtitle = artifacts[idx]
+                ok, seconds, fresh = future.result()
+                results[idx] = (artifact_label(version, fmt, fresh), output_path, seconds, ok)
+
+    rendered = [results[idx] for idx in range(len(artifacts))]
+    if cache is not None and all(ok for _label, _path, _seconds, ok in rendered):
+        cache.prune()
+    ordered = [results['modernize']] if 'modernize' in results else []
+    return ordered + rendered
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate PDF or DOCX version of the Restored Names Bible'
@@ -531,7 +984,7 @@ def main():
     parser.add_argument(
         '--input',
         default='build/restored_kjv.json',
-        help='Input JSON file (default: build/restored_kjv.json)'
+        help='Input JSON file or per-book translation directory (default: build/restored_kjv.json)'
     )
     parser.add_argument(
         '--output',
@@ -559,6 +1012,49 @@ def main():
         help='Generate both original and modernized versions'
     )
     
+    parser.add_argument(
+        '--docx-engine',
+        choices=['stream', 'python-docx'],
+        default='stream',
+        help='DOCX writer: stream word/document.xml directly (default) or build it with python-docx'
+    )
+    parser.add_argument(
+        '--books',
+        action='append',
+        help='Render only these books or groups, comma-separated (e.g. "Genesis,Psalms" or "NT")'
+    )
+    parser.add_argument(
+        '--range',
+        action='append',
+        help='Render only this range, e.g. "Genesis 1-3" or "John 3:16-21" (repeatable)'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Artifacts (version × format) to render at once in worker processes (default: 1)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=DEFAULT_CACHE_DIR,
+        help=f'Render cache: skip unchanged outputs and reuse unchanged books (default: {DEFAULT_CACHE_DIR})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always render everything, without reading or writing the cache'
+    )
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Render the PDF one book per process and concatenate (requires pypdf)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Processes for --parallel (default: CPU count)'
+    )
+    
     args = parser.parse_args()
     
     # Load Bible data
@@ -567,14 +1063,24 @@ def main():
         print(f"Error: Input file not found: {input_path}")
         return 1
     
+    start = time.perf_counter()
+    selection = [spec for spec in (args.books or []) + (args.range or [])]
     print(f"Loading Bible data from: {input_path}")
-    with open(input_path, 'r', encoding='utf-8') as f:
-        bible_data = json.load(f)
+    try:
+        bible_data = open_bible(input_path, selection)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    if not len(bible_data):
+        print(f"Error: nothing in {input_path} matches {', '.join(selection)}")
+        return 1
     
-    print(f"Loaded {len(bible_data)} books")
+    if selection:
+        print(f"Selected {', '.join(selection)}: {len(bible_data)} books")
+    else:
+        print(f"Loaded {len(bible_data)} books")
     
     include_toc = not args.no_toc
-    success = True
     
     # Prepare versions to generate
     versions = []
@@ -589,47 +1095,41 @@ def main():
     else:
         versions = [('original', bible_data, None)]
     
-    # Process each version
+    # Artifacts to render: (version, format, output path, subtitle)
+    artifacts = []
     for version_name, version_data, subtitle in versions:
-        # Apply modernization if needed
-        if version_data is None:
-            if modernize_bible is None:
-                print("Error: modernize_language module not available")
-                return 1
-            
-            print(f"\nApplying language modernization...")
-            replacements = {
-                " thee ": " you ", " thou ": " you ", " thy ": " your ", " thine ": " your ",
-                " ye ": " you ", " art ": " are ", " hast ": " have ", " hadst ": " had ",
-                " doest ": " do ", " didst ": " did ", " wilt ": " will ", " shalt ": " shall ",
-                " shouldst ": " should ", " wouldst ": " would ", " mayest ": " may ",
-                " mightest ": " might ", " canst ": " can ", " couldst ": " could ",
-                " knowest ": " know ", " sayest ": " say ", " saith ": " says ",
-                " doth ": " does ", " hath ": " has ", " spake ": " spoke ",
-                " shew ": " show ", " shewed ": " showed ", " betwixt ": " between ",
-                " unto ": " to ",
-            }
-            version_data = modernize_bible(bible_data, replacements)
-        
-        # Generate PDF
-        if args.format in ['pdf', 'both']:
-            if args.output:
+        suffix = selection_slug(selection) + ('_modernized' if version_name == 'modernized' else '')
+        for fmt in ('pdf', 'docx'):
+            if args.format not in (fmt, 'both'):
+                continue
+            if args.output and (fmt == 'pdf' or args.format != 'both'):
                 output_path = Path(args.output)
+                if len(versions) > 1 and version_name == 'modernized':
+                    output_path = output_path.with_name(output_path.stem + '_modernized' + output_path.suffix)
             else:
-                suffix = '_modernized' if version_name == 'modernized' else ''
-                output_path = Path(f'build/restored_kjv_bible{suffix}.pdf')
-            
-            success = generate_pdf(version_data, output_path, include_toc=include_toc, subtitle=subtitle) and success
-        
-        # Generate DOCX
-        if args.format in ['docx', 'both']:
-            if args.output and args.format != 'both':
-                output_path = Path(args.output)
-            else:
-                suffix = '_modernized' if version_name == 'modernized' else ''
-                output_path = Path(f'build/restored_kjv_bible{suffix}.docx')
-            
-            success = generate_docx(version_data, output_path, include_toc=include_toc, subtitle_text=subtitle) and success
+                output_path = Path(f'build/restored_kjv_bible{suffix}.{fmt}')
+            artifacts.append((version_name, fmt, output_path, subtitle))
+
+    options = {
+        'include_toc': include_toc,
+        'parallel': args.parallel,
+        'workers': args.workers,
+        'docx_engine': args.docx_engine,
+        'cache_dir': None if args.no_cache else args.cache_dir,
+        'selection': selection,
+    }
+    needs_modernized = any(version_data is None for _name, version_data, _subtitle in versions)
+    if needs_modernized and modernize_bible is None:
+        print("Error: modernize_language module not available")
+        return 1
+
+    results = run_render_graph(str(input_path), bible_data, artifacts, options, args.jobs)
+    success = all(ok for _label, _path, _seconds, ok in results)
+
+    print("\nRender summary:")
+    for label, path, seconds, ok in results:
+        print(f"  {'✓' if ok else '✗'} {label:<36} {seconds:7.1f}s  {path}")
+    print(f"  {'total (wall)':<38} {time.perf_counter() - start:7.1f}s with {args.jobs} job(s)")
     
     if args.all_versions:
         print("\n✓ Generated both original and modernized versions")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Merge extras (Book of Enoch, Apocrypha) into the canonical translation at build time
+
+Takes the restored canon plus any number of extras files and writes:
+  - <out_dir>/<translation>.json   full corpus in declared book order
+  - <out_dir>/<book>.json          one file per book, extras included
+  - <out_dir>/books.json           declared book order and extras registry
+
+The app then loads extras like any other book instead of fetching and
+merging <translation>.extras.json at runtime.
+
+Usage:
+  python merge_extras.py build/restored_kjv.json \
+      --extras ../frontend/public/translations/restored_kjv.extras.json \
+      --out_dir ../frontend/public/translations/
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+from collections import OrderedDict
+from typing import List, Sequence, Tuple
+
+from corpus import BOOKS_MANIFEST, open_corpus
+from split_bible import SCHEMAS, dump_schema, to_schema, write_book_files
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+def count_verses(chapters: dict) -> int:
+    return sum(len(verses) for verses in chapters.values())
+
+
+def merge_corpus(canon, extras_files: Sequence[str], allow_override: bool = False) -> Tuple[OrderedDict, List[dict]]:
+    """
+    Append extras books after the canon in the order the files are given.
+
+    Returns the merged corpus and the extras registry. An extras book that
+    reuses a canonical or earlier extras name is an error unless
+    allow_override is set, in which case the later definition wins in place.
+    """
+    merged: OrderedDict = OrderedDict()
+    for book, chapters in canon.items():
+        merged[book] = chapters
+
+    registry: List[dict] = []
+    for extras_path in extras_files:
+        extras = open_corpus(extras_path)
+        source = os.path.basename(extras_path)
+        for book, chapters in extras.items():
+            if book in merged and not allow_override:
+                raise ValueError(f"{source}: book '{book}' is already defined (use --allow-override)")
+            merged[book] = chapters
+            registry = [entry for entry in registry if entry["book"] != book]
+            registry.append({
+                "book": book,
+                "source": source,
+                "chapters": len(chapters),
+                "verses": count_verses(chapters),
+            })
+
+    return merged, registry
+
+
+def build_manifest(translation: str, merged: OrderedDict, registry: List[dict]) -> dict:
+    extras_books = {entry["book"] for entry in registry}
+    return {
+        "translation": translation,
+        "books": list(merged.keys()),
+        "canon": [book for book in merged.keys() if book not in extras_books],
+        "extras": registry,
+    }
+
+
+def write_merged(out_dir: str, translation: str, merged: OrderedDict, registry: List[dict],
+                 schema: str = "object") -> dict:
+    os.makedirs(out_dir, exist_ok=True)
+
+    full_path = os.path.join(out_dir, f"{translation}.json")
+    print(f"Writing merged corpus to {full_path} ({schema} schema)...")
+    with io.open(full_path, "w", encoding="utf-8") as f:
+        dump_schema({book: to_schema(chapters, schema) for book, chapters in merged.items()}, f, schema)
+
+    print(f"Writing per-book files in {out_dir}...")
+    write_book_files(merged, out_dir, schema)
+
+    manifest = build_manifest(translation, merged, registry)
+    manifest_path = os.path.join(out_dir, BOOKS_MANIFEST)
+    with io.open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    print(f"Wrote {manifest_path}")
+    return manifest
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Merge extras books into the canonical translation")
+    parser.add_argument("canon", help="Restored canon JSON file or per-book translation directory")
+    parser.add_argument("--extras", nargs="*", default=[], help="Extras JSON files, merged in the order given")
+    parser.add_argument("--out_dir", default="../frontend/public/translations/", help="Output translation directory")
+    parser.add_argument("--translation", default="restored_kjv", help="Translation id for the full corpus file")
+    parser.add_argument("--allow-override", action="store_true", help="Let extras replace books with the same name")
+    parser.add_argument("--schema", choices=SCHEMAS, default="object", help="Output schema (default: object)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.canon):
+        print(f"Error: Canon {args.canon} not found!")
+        return 1
+
+    missing = [path for path in args.extras if not os.path.exists(path)]
+    for path in missing:
+        print(f"  ✗ Skipping missing extras file: {path}")
+    extras_files = [path for path in args.extras if path not in missing]
+
+    try:
+        canon = open_corpus(args.canon)
+        merged, registry = merge_corpus(canon, extras_files, allow_override=args.allow_override)
+        manifest = write_merged(args.out_dir, args.translation, merged, registry, args.schema)
+    except (ValueError, json.JSONDecodeError) as e:
+        print(f"\n✗ Error: {e}")
+        return 1
+
+    print("\nMerge complete!")
+    print(f"Canonical books: {len(manifest['canon'])}")
+    for entry in registry:
+        print(f"Extras: {entry['book']} ({entry['chapters']} chapters, {entry['verses']} verses) from {entry['source']}")
+    print(f"Total books: {len(manifest['books'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
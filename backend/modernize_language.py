@@ -8,6 +8,8 @@ import io
 import sys
 import os
 
+from corpus import open_corpus
+
 # Fix Windows console encoding issues
 if sys.platform == 'win32':
     try:
@@ -202,7 +204,7 @@ def main():
     ]
     
     print(f"Loading {source_file}...")
-    bible_json = load_json(source_file)
+    bible_json = open_corpus(source_file)
     
     print("Applying modernization replacements...")
     modernized_bible = modernize_bible(bible_json, replacements)
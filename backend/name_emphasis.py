@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Restored-name emphasis shared by the PDF and DOCX renderers
+
+Verse text is split into (text, is_name) segments in one pass of a single
+compiled pattern. Names are tried longest first at each position and must
+stand between word boundaries, so "El" is not emphasized inside "Elohiym",
+"Elijah" or "Bethel", and "Yah" is not emphasized inside "Yahuah".
+
+Usage:
+  python name_emphasis.py "And Elohiym said, Let there be light"
+"""
+
+import argparse
+import re
+import sys
+from typing import Iterable, Iterator, List, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+# Names emphasized in the printed editions (case-sensitive)
+EMPHASIS_NAMES = (
+    "Yahuah", "Elohiym", "Yahusha", "Mashiach", "Ruach",
+    "Qodesh", "Shaddai", "Elyon", "Adonai", "El",
+    "Yahweh", "YHWH", "Yah", "Ha'Qodesh", "Ha'Mashiach",
+)
+
+Segment = Tuple[str, bool]
+
+
+def trie_pattern(names: Iterable[str]) -> str:
+    """
+    Regex alternation over names folded into a prefix trie, so the engine
+    branches once per character instead of retrying every name. Longer
+    continuations are tried first, giving the longest match at a position.
+    """
+    trie: dict = {}
+    for name in names:
+        node = trie
+        for ch in name:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def branch(node: dict) -> str:
+        alternatives = [re.escape(ch) + branch(child) for ch, child in sorted(node.items()) if ch]
+        if not alternatives:
+            return ""
+        if len(alternatives) == 1:
+            body = alternatives[0]
+            return f"(?:{body})?" if "" in node else body
+        body = f"(?:{'|'.join(alternatives)})"
+        return body + "?" if "" in node else body
+
+    # Each name starts with a literal, so the engine can skip ahead to
+    # candidate first letters; the left word boundary is checked after it.
+    heads = [re.escape(ch) + r"(?<!\w.)" + branch(child) for ch, child in sorted(trie.items())]
+    return rf"({'|'.join(heads)})(?!\w)"
+
+
+class NameTokenizer:
+    """Splits text into name and non-name segments"""
+
+    def __init__(self, names: Iterable[str] = EMPHASIS_NAMES):
+        self.names: List[str] = sorted(set(names), key=len, reverse=True)
+        self.pattern = re.compile(trie_pattern(self.names))
+
+    def segments(self, text: str) -> Iterator[Segment]:
+        """(text, is_name) pieces that concatenate back to text"""
+        # split() with one capturing group alternates text, name, text, ...
+        for i, piece in enumerate(self.pattern.split(text)):
+            if piece:
+                yield piece, bool(i & 1)
+
+    def markup(self, text: str, open_tag: str = "<b>", close_tag: str = "</b>") -> str:
+        """XML-escaped text with each name wrapped once in open_tag/close_tag"""
+        # Names contain no &, < or >, and escaping adds no word characters
+        # next to a name, so escaping first leaves the matches unchanged.
+        parts = self.pattern.split(escape(text))
+        if len(parts) == 1:
+            return parts[0]
+        parts[1::2] = [open_tag + name + close_tag for name in parts[1::2]]
+        return "".join(parts)
+
+
+_default_tokenizer = NameTokenizer()
+
+
+def name_segments(text: str) -> Iterator[Segment]:
+    """(text, is_name) segments of text for the printed-edition names"""
+    return _default_tokenizer.segments(text)
+
+
+def bold_names(text: str) -> str:
+    """Reportlab paragraph markup with the printed-edition names in <b>"""
+    return _default_tokenizer.markup(text)
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Split verse text into restored-name segments")
+    parser.add_argument("text", nargs="+", help="Text to segment")
+    args = parser.parse_args(argv)
+
+    for text in args.text:
+        print(bold_names(text))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Build the restored-name occurrence index from the Hebrew names lexicon
+
+The "names" search filter, nameHighlighter.ts and NamePopover rescan verse
+text for every lexicon label at runtime. This stage finds every occurrence
+once, with the highlighter's rules: labels are tried longest first,
+case-insensitively between word boundaries, and text already claimed by a
+longer name is not matched again ("Yahuah" inside "Yahuah Elohiym").
+
+Output (in --out_dir):
+  index.json    {"version", "verses", "names": {id: {"label", "category",
+                 "total", "verse_count", "books": {book: count}}}}
+  verses.json   ordinal <-> book/chapter/verse map (see ordinals.py)
+  <id>.json     {"id", "label", "verses": [...], "offsets": [[...], ...]}
+
+"verses" are delta-encoded verse ordinals (first value absolute) and
+"offsets" the character offsets of each occurrence in the matching verse;
+an occurrence spans len(label) characters.
+
+Usage:
+  python name_index.py ../frontend/public/translations/ --out_dir ../frontend/public/translations/names/
+  python name_index.py ../frontend/public/translations/ --lookup yahuah-elohiym
+"""
+
+import argparse
+import io
+import json
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+from corpus import load_json, open_corpus
+from ordinals import VerseMap, iter_verses
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+def compile_names(names: List[dict]) -> List[Tuple[dict, "re.Pattern"]]:
+    """Lexicon entries with their label pattern, longest label first"""
+    ordered = sorted(names, key=lambda name: len(name["label"]), reverse=True)
+    # ASCII \b like the JavaScript RegExp in nameHighlighter.ts
+    return [
+        (name, re.compile(rf"\b{re.escape(name['label'])}\b", re.IGNORECASE | re.ASCII))
+        for name in ordered
+    ]
+
+
+def find_names(text: str, patterns) -> List[Tuple[str, int]]:
+    """[(name id, offset), ...] for text, in offset order"""
+    claimed: List[Tuple[int, int]] = []
+    found = []
+    for name, pattern in patterns:
+        for m in pattern.finditer(text):
+            start, end = m.span()
+            if any(start < c_end and c_start < end for c_start, c_end in claimed):
+                continue
+            claimed.append((start, end))
+            found.append((name["id"], start))
+    found.sort(key=lambda item: item[1])
+    return found
+
+
+class NameStats:
+    __slots__ = ("verses", "offsets", "books")
+
+    def __init__(self):
+        self.verses: List[int] = []
+        self.offsets: List[List[int]] = []
+        self.books: Dict[str, int] = {}
+
+    def add(self, ordinal: int, book: str, offset: int) -> None:
+        if not self.verses or self.verses[-1] != ordinal:
+            self.verses.append(ordinal)
+            self.offsets.append([])
+        self.offsets[-1].append(offset)
+        self.books[book] = self.books.get(book, 0) + 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.books.values())
+
+
+def build_name_index(corpus, names: List[dict]) -> Tuple[Dict[str, NameStats], VerseMap]:
+    patterns = compile_names(names)
+    stats: Dict[str, NameStats] = defaultdict(NameStats)
+    for ordinal, book, _chapter, _verse, text in iter_verses(corpus):
+        for name_id, offset in find_names(text, patterns):
+            stats[name_id].add(ordinal, book, offset)
+    return stats, VerseMap.from_corpus(corpus)
+
+
+def write_name_index(stats: Dict[str, NameStats], names: List[dict], verse_map: VerseMap, out_dir: str) -> dict:
+    os.makedirs(out_dir, exist_ok=True)
+
+    summary = {}
+    for name in names:
+        entry = stats.get(name["id"], NameStats())
+        deltas = []
+        previous = 0
+        for ordinal in entry.verses:
+            deltas.append(ordinal - previous)
+            previous = ordinal
+        with io.open(os.path.join(out_dir, f"{name['id']}.json"), "w", encoding="utf-8") as f:
+            json.dump({"id": name["id"], "label": name["label"], "verses": deltas, "offsets": entry.offsets},
+                      f, ensure_ascii=False, separators=(",", ":"))
+        summary[name["id"]] = {
+            "label": name["label"],
+            "category": name.get("category", ""),
+            "total": entry.total,
+            "verse_count": len(entry.verses),
+            "books": entry.books,
+        }
+
+    verse_map.save(os.path.join(out_dir, "verses.json"))
+
+    manifest = {"version": 1, "verses": verse_map.total, "names": summary}
+    with io.open(os.path.join(out_dir, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+
+def lookup(out_dir: str, name_id: str) -> List[Tuple[int, List[int]]]:
+    """Reference lookup: [(verse ordinal, [offsets]), ...] for a lexicon id"""
+    path = os.path.join(out_dir, f"{name_id}.json")
+    if not os.path.exists(path):
+        return []
+    with io.open(path, "r", encoding="utf-8") as f:
+        entry = json.load(f)
+    occurrences = []
+    ordinal = 0
+    for delta, offsets in zip(entry["verses"], entry["offsets"]):
+        ordinal += delta
+        occurrences.append((ordinal, offsets))
+    return occurrences
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the restored-name occurrence index")
+    parser.add_argument("corpus", help="Translation directory or full-Bible JSON")
+    parser.add_argument("--lexicon", default="../frontend/public/lexicons/hebrew_names.json", help="Hebrew names lexicon")
+    parser.add_argument("--out_dir", default="../frontend/public/translations/names/", help="Output directory")
+    parser.add_argument("--lookup", help="Print the first occurrences of a lexicon id after building")
+    args = parser.parse_args(argv)
+
+    for path in (args.corpus, args.lexicon):
+        if not os.path.exists(path):
+            print(f"Error: {path} not found!")
+            return 1
+
+    start = time.perf_counter()
+    names = load_json(args.lexicon)["names"]
+    corpus = open_corpus(args.corpus)
+    stats, verse_map = build_name_index(corpus, names)
+    manifest = write_name_index(stats, names, verse_map, args.out_dir)
+    print(f"✓ Name index: {len(names)} names, "
+          f"{sum(entry['total'] for entry in manifest['names'].values())} occurrences "
+          f"in {time.perf_counter() - start:.2f}s")
+    for name_id, entry in sorted(manifest["names"].items(), key=lambda kv: -kv[1]["total"]):
+        print(f"  {entry['label']:<22} {entry['total']:>6} in {entry['verse_count']} verses, {len(entry['books'])} books")
+
+    if args.lookup:
+        label = manifest["names"].get(args.lookup, {}).get("label", args.lookup)
+        occurrences = lookup(args.out_dir, args.lookup)
+        print(f"\n{args.lookup}: {len(occurrences)} verses")
+        for ordinal, offsets in occurrences[:5]:
+            book, chapter, verse = verse_map.ref(ordinal)
+            text = corpus[book][chapter][verse]
+            snippets = ", ".join(repr(text[o:o + len(label)]) for o in offsets)
+            print(f"  {verse_map.ref_string(ordinal)} @ {offsets}: {snippets}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Build a one-download offline bundle of a translation for the PWA
+
+Going offline currently means cacheManager.ts prefetching books three at a
+time into the Workbox translations-cache: 66+ requests, and a half-filled
+cache if the connection drops early. This stage packs everything a
+translation needs offline (the corpus, its extras and the published
+indexes) into one compressed, versioned file with an integrity hash.
+
+The bundle is a gzip-compressed ustar archive, so the app can fetch it
+once and unpack it as it streams (DecompressionStream("gzip") and 512-byte
+tar headers), storing each entry under /translations/<path>, the URL the
+same file is served from. Entries are written in a fixed order with fixed
+metadata, so the same inputs always give the same bytes and hash.
+
+Output (in --out_dir):
+  <id>.<version>.tar.gz   the bundle; bundle.json is its first entry:
+                          {"format", "translation", "version",
+                           "files": [{"path", "bytes"}]}
+  <id>.json               manifest: {"format", "translation", "version",
+                          "file", "bytes", "uncompressed_bytes", "files",
+                          "sha256", "integrity" (SRI, for fetch()),
+                          "contents", "built_at", "seconds"}
+
+The default --out_dir is public/offline/ rather than public/translations/,
+so the manifest is not served from the long-lived CacheFirst
+translations-cache and the app sees new versions.
+
+The version is a hash of the bundled files, so it changes exactly when
+the content does; an unchanged bundle is not rebuilt, and bundles of
+older versions are removed.
+
+The published indexes are built from the translation directory, so they
+are bundled by default only with that directory. A full-Bible JSON next to
+it (kjv.json) is another translation and gets no indexes unless --indexes
+names them.
+
+Usage:
+  python offline_bundle.py ../frontend/public/translations/ --out_dir ../frontend/public/offline/
+  python offline_bundle.py ../frontend/public/translations/kjv.json --translation kjv
+  python offline_bundle.py --verify ../frontend/public/offline/restored_kjv.json
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+import sys
+import tarfile
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from corpus import BOOKS_MANIFEST, open_corpus
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+BUNDLE_FORMAT = 1
+BUNDLE_INDEX = "bundle.json"
+DEFAULT_TRANSLATION = "restored_kjv"
+
+# Published index directories (README publish steps), relative to the translation directory
+INDEX_DIRS = ("index", "concordance", "phrase", "names", "graph")
+
+CHUNK_SIZE = 1 << 20
+
+# (path inside the bundle, file on disk)
+Entry = Tuple[str, str]
+
+
+def collect_entries(corpus_path: str, translation: str, extras_path: str = None,
+                    index_dirs: Optional[Sequence[str]] = None) -> Tuple[List[Entry], dict]:
+    """
+    Files to bundle, with their paths relative to /translations/, and a
+    summary of what was found. index_dirs defaults to INDEX_DIRS for a
+    translation directory and to none for a full-Bible JSON, whose
+    neighbouring indexes belong to the directory. Index directories that
+    do not exist are skipped.
+    """
+    corpus = open_corpus(corpus_path)
+    if index_dirs is None:
+        index_dirs = INDEX_DIRS if corpus.is_lazy() else ()
+    if corpus.is_lazy():
+        base = corpus_path
+        entries = [(os.path.basename(path), path) for path in corpus.book_files().values()]
+        manifest_path = os.path.join(base, BOOKS_MANIFEST)
+        if os.path.isfile(manifest_path):
+            entries.insert(0, (BOOKS_MANIFEST, manifest_path))
+    else:
+        base = os.path.dirname(corpus_path)
+        entries = [(os.path.basename(corpus_path), corpus_path)]
+
+    if extras_path is None:
+        extras_path = os.path.join(base, f"{translation}.extras.json")
+    has_extras = os.path.isfile(extras_path)
+    if has_extras:
+        entries.append((os.path.basename(extras_path), extras_path))
+
+    indexes = []
+    for name in index_dirs:
+        directory = os.path.join(base, name)
+        if not os.path.isdir(directory):
+            continue
+        indexes.append(name)
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for file_name in sorted(files):
+                path = os.path.join(root, file_name)
+                entries.append((os.path.relpath(path, base).replace(os.sep, "/"), path))
+
+    contents = {"books": len(corpus.book_names()), "extras": has_extras, "indexes": indexes}
+    return entries, contents
+
+
+def content_version(entries: Sequence[Entry]) -> str:
+    """Short hash of the bundled paths and bytes"""
+    digest = hashlib.sha256(f"bundle-format-{BUNDLE_FORMAT}".encode("utf-8"))
+    for arcname, path in entries:
+        digest.update(arcname.encode("utf-8") + b"\0")
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def _tar_info(arcname: str, size: int) -> tarfile.TarInfo:
+    # Fixed metadata so the archive bytes depend only on the content
+    info = tarfile.TarInfo(arcname)
+    info.size = size
+    info.mtime = 0
+    info.mode = 0o644
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    return info
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_bundle(entries: Sequence[Entry], bundle_path: str, translation: str, version: str,
+                 compresslevel: int = 9) -> int:
+    """Stream the entries into a gzip-compressed tar, returning the uncompressed byte count"""
+    index = {
+        "format": BUNDLE_FORMAT,
+        "translation": translation,
+        "version": version,
+        "files": [{"path": arcname, "bytes": os.path.getsize(path)} for arcname, path in entries],
+    }
+    index_data = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    tmp_path = f"{bundle_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as raw, \
+            gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=compresslevel, mtime=0) as gz, \
+            tarfile.open(fileobj=gz, mode="w|", format=tarfile.USTAR_FORMAT) as tar:
+        tar.addfile(_tar_info(BUNDLE_INDEX, len(index_data)), io.BytesIO(index_data))
+        for arcname, path in entries:
+            with open(path, "rb") as f:
+                tar.addfile(_tar_info(arcname, os.path.getsize(path)), f)
+    os.replace(tmp_path, bundle_path)
+    return len(index_data) + sum(item["bytes"] for item in index["files"])
+
+
+def build_bundle(corpus_path: str, out_dir: str, translation: str = DEFAULT_TRANSLATION,
+                 extras_path: str = None, index_dirs: Optional[Sequence[str]] = None,
+                 force: bool = False) -> Tuple[dict, bool]:
+    """Write the bundle and manifest for a translation; returns (manifest, rebuilt)"""
+    start = time.perf_counter()
+    entries, contents = collect_entries(corpus_path, translation, extras_path, index_dirs)
+    version = content_version(entries)
+    bundle_name = f"{translation}.{version}.tar.gz"
+    bundle_path = os.path.join(out_dir, bundle_name)
+    manifest_path = os.path.join(out_dir, f"{translation}.json")
+
+    if not force and os.path.exists(bundle_path) and os.path.exists(manifest_path):
+        with io.open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == version:
+            return manifest, False
+
+    os.makedirs(out_dir, exist_ok=True)
+    uncompressed = write_bundle(entries, bundle_path, translation, version)
+    sha256 = file_sha256(bundle_path)
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "translation": translation,
+        "version": version,
+        "file": bundle_name,
+        "bytes": os.path.getsize(bundle_path),
+        "uncompressed_bytes": uncompressed,
+        "files": len(entries),
+        "sha256": sha256,
+        "integrity": "sha256-" + base64.b64encode(bytes.fromhex(sha256)).decode("ascii"),
+        "contents": contents,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+    tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with io.open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, manifest_path)
+
+    # Bundles of earlier versions of this translation
+    for name in os.listdir(out_dir):
+        if name.startswith(f"{translation}.") and name.endswith(".tar.gz") and name != bundle_name:
+            rest = name[len(translation) + 1:-len(".tar.gz")]
+            if "." not in rest:
+                os.remove(os.path.join(out_dir, name))
+    return manifest, True
+
+
+def verify_bundle(manifest_path: str) -> List[str]:
+    """
+    Check a bundle the way the app reads it: hash, then unpack as a stream.
+    Returns a list of problems (empty when the bundle is sound).
+    """
+    with io.open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    bundle_path = os.path.join(os.path.dirname(manifest_path), manifest["file"])
+    if not os.path.exists(bundle_path):
+        return [f"{bundle_path} not found"]
+    problems = []
+    if file_sha256(bundle_path) != manifest["sha256"]:
+        problems.append(f"sha256 of {manifest['file']} does not match the manifest")
+
+    index = None
+    seen = 0
+    with tarfile.open(bundle_path, mode="r|gz") as tar:
+        for member in tar:
+            data = tar.extractfile(member).read()
+            if index is None:
+                if member.name != BUNDLE_INDEX:
+                    problems.append(f"first entry is {member.name}, expected {BUNDLE_INDEX}")
+                    break
+                index = json.loads(data)
+                expected = iter(index["files"])
+                continue
+            item = next(expected, None)
+            if item is None or item["path"] != member.name or item["bytes"] != len(data):
+                problems.append(f"unexpected entry {member.name} ({len(data)} bytes)")
+            seen += 1
+    if index is not None:
+        if index.get("version") != manifest["version"]:
+            problems.append(f"bundle version {index.get('version')} != manifest version {manifest['version']}")
+        if seen != manifest["files"]:
+            problems.append(f"{seen} files in the bundle, manifest lists {manifest['files']}")
+    return problems
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build a one-download offline bundle of a translation")
+    parser.add_argument("corpus", nargs="?", help="Translation directory or full-Bible JSON")
+    parser.add_argument("--out_dir", default="../frontend/public/offline/", help="Bundle output directory")
+    parser.add_argument("--translation", default=DEFAULT_TRANSLATION, help="Translation id (default: restored_kjv)")
+    parser.add_argument("--extras", default=None, help="Extras JSON (default: <id>.extras.json next to the corpus, if present)")
+    parser.add_argument("--indexes", nargs="*", default=None,
+                        help=f"Index directories next to the corpus to include (default: {' '.join(INDEX_DIRS)} "
+                             f"for a translation directory, none for a full-Bible JSON; none with no values)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even when the content is unchanged")
+    parser.add_argument("--verify", metavar="MANIFEST", help="Check a built bundle against its manifest and exit")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        if not os.path.exists(args.verify):
+            print(f"Error: {args.verify} not found!")
+            return 1
+        problems = verify_bundle(args.verify)
+        for problem in problems:
+            print(f"  ✗ {problem}")
+        if problems:
+            return 1
+        print(f"✓ {args.verify}: bundle matches its manifest")
+        return 0
+
+    if not args.corpus:
+        parser.error("corpus is required unless --verify is given")
+    if not os.path.exists(args.corpus):
+        print(f"Error: {args.corpus} not found!")
+        return 1
+
+    manifest, rebuilt = build_bundle(args.corpus, args.out_dir, args.translation, args.extras, args.indexes, args.force)
+    contents = manifest["contents"]
+    status = "Built" if rebuilt else "Up to date:"
+    print(f"✓ {status} {os.path.join(args.out_dir, manifest['file'])} (version {manifest['version']})")
+    print(f"  {manifest['files']} files: {contents['books']} books"
+          f"{', extras' if contents['extras'] else ''}"
+          f"{', ' + ', '.join(contents['indexes']) if contents['indexes'] else ''}")
+    print(f"  Size: {manifest['bytes'] / 1024:.0f} KB compressed from {manifest['uncompressed_bytes'] / 1024:.0f} KB "
+          f"({manifest['bytes'] / max(1, manifest['uncompressed_bytes']):.0%}), build time: {manifest['seconds']:.2f}s")
+    print(f"  Integrity: {manifest['integrity']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Verse ordinals: a dense 0-based number for every verse in declared book order
+
+Index artifacts (search postings, concordance, name occurrences, cross
+references) store ordinals instead of "Book C:V" strings. The VerseMap
+built here converts between the two and is published as verses.json next
+to those artifacts:
+
+  {"books": [{"name": "Genesis", "start": 0, "chapters": [31, 25, ...]}, ...]}
+
+A chapter entry is a verse count when the chapter is numbered 1..n, or the
+explicit list of verse numbers when it has gaps (e.g. padded Enoch
+chapters). Chapters are numbered 1..len(chapters).
+"""
+
+import bisect
+import io
+import json
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from corpus import BOOKS_ORDER, OT_BOOKS
+
+# (ordinal, book, chapter, verse, text)
+VerseRow = Tuple[int, str, str, str, str]
+
+ChapterEntry = Union[int, List[int]]
+
+
+def chapter_entry(verse_numbers: List[int]) -> ChapterEntry:
+    if verse_numbers == list(range(1, len(verse_numbers) + 1)):
+        return len(verse_numbers)
+    return verse_numbers
+
+
+def entry_verses(entry: ChapterEntry) -> List[int]:
+    return list(range(1, entry + 1)) if isinstance(entry, int) else list(entry)
+
+
+def book_entry(book: str, chapters: dict, start: int) -> dict:
+    """verses.json entry for one book whose first verse has ordinal start"""
+    entries: List[ChapterEntry] = []
+    for chapter_num in range(1, max((int(c) for c in chapters), default=0) + 1):
+        numbers = sorted(int(v) for v in chapters.get(str(chapter_num), {}))
+        entries.append(chapter_entry(numbers))
+    return {"name": book, "start": start, "chapters": entries}
+
+
+def book_verse_count(entry: dict) -> int:
+    return sum(len(entry_verses(e)) for e in entry["chapters"])
+
+
+def iter_verses(corpus) -> Iterator[VerseRow]:
+    """Yield every verse with its ordinal, in declared book order"""
+    ordinal = 0
+    for book, chapters in corpus.items():
+        for chapter_num in sorted(chapters.keys(), key=int):
+            verses = chapters[chapter_num]
+            for verse_num in sorted(verses.keys(), key=int):
+                yield ordinal, book, chapter_num, verse_num, verses[verse_num]
+                ordinal += 1
+
+
+def testament_of(book: str) -> str:
+    """'ot', 'nt' or 'extras' (books outside the 66-book canon)"""
+    if book in OT_BOOKS:
+        return "ot"
+    if book in BOOKS_ORDER:
+        return "nt"
+    return "extras"
+
+
+class VerseMap:
+    """Bidirectional ordinal <-> (book, chapter, verse) lookup"""
+
+    def __init__(self, books: List[dict]):
+        self.books = books
+        self._book_index: Dict[str, int] = {b["name"]: i for i, b in enumerate(books)}
+        self._book_starts: List[int] = [b["start"] for b in books]
+        # Per book: chapter start ordinals and verse number lists
+        self._chapter_starts: List[List[int]] = []
+        self._chapter_verses: List[List[List[int]]] = []
+        for b in books:
+            starts, verses = [], []
+            ordinal = b["start"]
+            for entry in b["chapters"]:
+                numbers = entry_verses(entry)
+                starts.append(ordinal)
+                verses.append(numbers)
+                ordinal += len(numbers)
+            self._chapter_starts.append(starts)
+            self._chapter_verses.append(verses)
+        self.total = sum(len(v) for verses in self._chapter_verses for v in verses)
+
+    @classmethod
+    def from_corpus(cls, corpus) -> "VerseMap":
+        books = []
+        ordinal = 0
+        for book, chapters in corpus.items():
+            entry = book_entry(book, chapters, ordinal)
+            books.append(entry)
+            ordinal += book_verse_count(entry)
+        return cls(books)
+
+    @classmethod
+    def load(cls, path: str) -> "VerseMap":
+        with io.open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f)["books"])
+
+    def to_json(self) -> dict:
+        return {"total": self.total, "books": self.books}
+
+    def save(self, path: str) -> None:
+        with io.open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f, ensure_ascii=False, separators=(",", ":"))
+
+    def book_names(self) -> List[str]:
+        return [b["name"] for b in self.books]
+
+    def __contains__(self, book: str) -> bool:
+        return book in self._book_index
+
+    def ordinal(self, book: str, chapter, verse) -> Optional[int]:
+        """Ordinal of book chapter:verse, or None if it does not exist"""
+        bi = self._book_index.get(book)
+        if bi is None:
+            return None
+        ci = int(chapter) - 1
+        if ci < 0 or ci >= len(self._chapter_verses[bi]):
+            return None
+        numbers = self._chapter_verses[bi][ci]
+        vi = bisect.bisect_left(numbers, int(verse))
+        if vi == len(numbers) or numbers[vi] != int(verse):
+            return None
+        return self._chapter_starts[bi][ci] + vi
+
+    def ref(self, ordinal: int) -> Tuple[str, str, str]:
+        """(book, chapter, verse) for an ordinal"""
+        if ordinal < 0 or ordinal >= self.total:
+            raise IndexError(ordinal)
+        # bisect_right lands on the last book/chapter starting at or before the
+        # ordinal, which skips empty ones that share its start
+        bi = bisect.bisect_right(self._book_starts, ordinal) - 1
+        starts = self._chapter_starts[bi]
+        ci = bisect.bisect_right(starts, ordinal) - 1
+        verse = self._chapter_verses[bi][ci][ordinal - starts[ci]]
+        return self.books[bi]["name"], str(ci + 1), str(verse)
+
+    def ref_string(self, ordinal: int) -> str:
+        book, chapter, verse = self.ref(ordinal)
+        return f"{book} {chapter}:{verse}"
+
+    def book_range(self, book: str) -> Tuple[int, int]:
+        """Half-open ordinal range [start, end) of a book"""
+        bi = self._book_index[book]
+        start = self.books[bi]["start"]
+        end = start + sum(len(v) for v in self._chapter_verses[bi])
+        return start, end
+
+    def chapter_range(self, book: str, chapter) -> Tuple[int, int]:
+        """Half-open ordinal range [start, end) of a chapter (empty if missing)"""
+        bi = self._book_index[book]
+        ci = int(chapter) - 1
+        if ci < 0 or ci >= len(self._chapter_verses[bi]):
+            return 0, 0
+        start = self._chapter_starts[bi][ci]
+        return start, start + len(self._chapter_verses[bi][ci])
+
+    def chapter_count(self, book: str) -> int:
+        return len(self._chapter_verses[self._book_index[book]])
+
+    def verse_numbers(self, book: str, chapter) -> List[int]:
+        bi = self._book_index[book]
+        ci = int(chapter) - 1
+        if ci < 0 or ci >= len(self._chapter_verses[bi]):
+            return []
+        return self._chapter_verses[bi][ci]
+
+    def testament_range(self, testament: str) -> List[Tuple[int, int]]:
+        """Ordinal ranges of the books in a testament ('ot', 'nt' or 'extras')"""
+        return [self.book_range(b["name"]) for b in self.books if testament_of(b["name"]) == testament]
@@ -223,11 +223,8 @@ def main() -> int:
     print()
     print("Next steps:")
     print(f"  1. python backend/process_extras_preserve_structure.py {out_path}")
-    print("  2. Reload Bible data in the app")
-    print()
-    print("To merge with Book of Enoch:")
-    print("  - Manually combine with restored_kjv.extras.json")
-    print("  - Or keep as separate file (app auto-loads *.extras.json)")
+    print(f"  2. cd backend && python merge_extras.py build/restored_kjv.json --extras ../frontend/public/translations/restored_kjv.extras.json {os.path.relpath(out_path, 'backend')}")
+    print("  3. Reload Bible data in the app")
     
     return 0
 
@@ -3,6 +3,8 @@ import json
 import re
 from pathlib import Path
 
+from references import ReferenceParser
+
 try:
     import pdfplumber  # type: ignore
 except Exception as exc:  # pragma: no cover
@@ -46,6 +48,7 @@ def parse_pdf(
     verse_line_pattern: str | None,
 ) -> dict:
     chapter_pat, verse_pat = compile_patterns(chapter_header_pattern, verse_line_pattern)
+    book_names = ReferenceParser(books_order)
 
     bible: dict[str, dict[str, dict[str, str]]] = {}
     current_book: str | None = None
@@ -65,13 +68,11 @@ def parse_pdf(
                     book = normalize_spaces(m_ch.group("book"))
                     chap = m_ch.group("chapter").lstrip("0") or "1"
 
-                    # Heuristic: prefer canonical names if this matches one; otherwise accept as-is
-                    if book.upper() in {b.upper() for b in books_order}:
-                        # Map to canonical casing
-                        for b in books_order:
-                            if b.upper() == book.upper():
-                                book = b
-                                break
+                    # Prefer the canonical name when the header is one of the books or
+                    # an abbreviation of it ("PSALM", "I KINGS"); otherwise accept as-is
+                    canonical, end = book_names.match_book(book)
+                    if canonical is not None and end == len(book):
+                        book = canonical
 
                     if book not in bible:
                         bible[book] = {}
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Positional index (term -> verse ordinal -> token positions) for exact phrase
+and proximity search
+
+Fuse matching is fuzzy and the concordance only matches single words, so
+"In the beginning" or "Ruach Ha'Qodesh" cannot be searched exactly. Here
+both are answered by intersecting postings and comparing token positions.
+
+Output (in --out_dir): index.json, verses.json and one <prefix>.idx shard
+per term prefix, in the search_index.py shard layout with magic b"BRPX1"
+and postings of
+
+  df × (ordinal_delta position_count position_delta...)
+
+where positions are token offsets within the verse, delta-encoded from 0.
+
+Usage:
+  python phrase_index.py ../frontend/public/translations/ --out_dir ../frontend/public/translations/phrase/
+  python phrase_index.py --query "Ruach Ha'Qodesh" --out_dir ../frontend/public/translations/phrase/
+  python phrase_index.py --query "faith love" --near 5 --out_dir ../frontend/public/translations/phrase/
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from corpus import open_corpus
+from ordinals import VerseMap, iter_verses
+from search_index import (
+    MANIFEST_FILE, VERSES_FILE, ShardedIndex, decode_varint, encode_shard,
+    encode_varint, shard_key, tokenize,
+)
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+POSITIONAL_MAGIC = b"BRPX1"
+DEFAULT_PREFIX_LEN = 2
+
+# term -> [(ordinal, [positions...]), ...] in ordinal order
+PositionalPostings = Dict[str, List[Tuple[int, List[int]]]]
+
+
+def encode_positional(postings: Sequence[Tuple[int, List[int]]]) -> bytes:
+    out = bytearray()
+    previous = 0
+    for ordinal, positions in postings:
+        encode_varint(ordinal - previous, out)
+        encode_varint(len(positions), out)
+        last = 0
+        for position in positions:
+            encode_varint(position - last, out)
+            last = position
+        previous = ordinal
+    return bytes(out)
+
+
+def decode_positional(buf, offset: int, df: int) -> List[Tuple[int, List[int]]]:
+    postings = []
+    ordinal = 0
+    pos = offset
+    for _ in range(df):
+        delta, pos = decode_varint(buf, pos)
+        count, pos = decode_varint(buf, pos)
+        ordinal += delta
+        positions = []
+        position = 0
+        for _ in range(count):
+            gap, pos = decode_varint(buf, pos)
+            position += gap
+            positions.append(position)
+        postings.append((ordinal, positions))
+    return postings
+
+
+def build_positional(corpus) -> Tuple[PositionalPostings, VerseMap]:
+    postings: PositionalPostings = defaultdict(list)
+    for ordinal, _book, _chapter, _verse, text in iter_verses(corpus):
+        positions: Dict[str, List[int]] = {}
+        for position, term in enumerate(tokenize(text)):
+            positions.setdefault(term, []).append(position)
+        for term, plist in positions.items():
+            postings[term].append((ordinal, plist))
+    return postings, VerseMap.from_corpus(corpus)
+
+
+def write_positional(postings: PositionalPostings, verse_map: VerseMap, out_dir: str,
+                     prefix_len: int = DEFAULT_PREFIX_LEN) -> dict:
+    os.makedirs(out_dir, exist_ok=True)
+
+    shards: Dict[str, PositionalPostings] = defaultdict(dict)
+    for term, plist in postings.items():
+        shards[shard_key(term, prefix_len)][term] = plist
+
+    shard_info = {}
+    for key in sorted(shards):
+        data = encode_shard(shards[key], encode_positional, POSITIONAL_MAGIC)
+        with open(os.path.join(out_dir, f"{key}.idx"), "wb") as f:
+            f.write(data)
+        shard_info[key] = {"terms": len(shards[key]), "bytes": len(data)}
+
+    verse_map.save(os.path.join(out_dir, VERSES_FILE))
+
+    manifest = {
+        "version": 1,
+        "positional": True,
+        "prefix_len": prefix_len,
+        "documents": verse_map.total,
+        "terms": len(postings),
+        "bytes": sum(info["bytes"] for info in shard_info.values()),
+        "shards": shard_info,
+    }
+    with io.open(os.path.join(out_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+
+class PositionalIndex(ShardedIndex):
+    """Reader for a phrase_index.py directory; postings carry token positions"""
+
+    MAGIC = POSITIONAL_MAGIC
+    decode = staticmethod(decode_positional)
+
+
+def _terms_postings(index: PositionalIndex, terms: Sequence[str]) -> Optional[List[Dict[int, List[int]]]]:
+    """Per term {ordinal: positions}, restricted to verses containing every term"""
+    lists = [dict(index.postings(term)) for term in terms]
+    if not lists or any(not plist for plist in lists):
+        return None
+    common = set(min(lists, key=len))
+    for plist in lists:
+        common &= plist.keys()
+    return [{ordinal: plist[ordinal] for ordinal in common} for plist in lists]
+
+
+def phrase_search(index: PositionalIndex, phrase: str) -> List[Tuple[int, List[int]]]:
+    """
+    Verses containing phrase as consecutive tokens.
+
+    Returns [(ordinal, [start positions]), ...] in ordinal order.
+    """
+    terms = tokenize(phrase)
+    postings = _terms_postings(index, terms)
+    if postings is None:
+        return []
+
+    results = []
+    for ordinal in sorted(postings[0]):
+        following = [set(plist[ordinal]) for plist in postings[1:]]
+        starts = [
+            start for start in postings[0][ordinal]
+            if all(start + i + 1 in positions for i, positions in enumerate(following))
+        ]
+        if starts:
+            results.append((ordinal, starts))
+    return results
+
+
+def proximity_search(index: PositionalIndex, query: str, window: int) -> List[Tuple[int, int]]:
+    """
+    Verses where every query term occurs within window tokens of each other,
+    in any order.
+
+    Returns [(ordinal, smallest span in tokens), ...] in ordinal order.
+    """
+    terms = list(dict.fromkeys(tokenize(query)))
+    postings = _terms_postings(index, terms)
+    if postings is None:
+        return []
+
+    results = []
+    for ordinal in sorted(postings[0]):
+        merged = sorted(
+            (position, term_idx)
+            for term_idx, plist in enumerate(postings)
+            for position in plist[ordinal]
+        )
+        # Smallest window covering every term (two-pointer sweep)
+        seen: Dict[int, int] = {}
+        best = None
+        left = 0
+        for right, (position, term_idx) in enumerate(merged):
+            seen[term_idx] = seen.get(term_idx, 0) + 1
+            while len(seen) == len(terms):
+                span = position - merged[left][0]
+                best = span if best is None else min(best, span)
+                left_term = merged[left][1]
+                seen[left_term] -= 1
+                if not seen[left_term]:
+                    del seen[left_term]
+                left += 1
+        if best is not None and best <= window:
+            results.append((ordinal, best))
+    return results
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build or query the positional phrase index")
+    parser.add_argument("corpus", nargs="?", help="Translation directory or full-Bible JSON to index")
+    parser.add_argument("--out_dir", default="../frontend/public/translations/phrase/", help="Index directory")
+    parser.add_argument("--prefix-len", type=int, default=DEFAULT_PREFIX_LEN, help="Term prefix length per shard (default: 2)")
+    parser.add_argument("--query", help="Phrase to look up in an existing index")
+    parser.add_argument("--near", type=int, help="Proximity search: terms within this many tokens, any order")
+    parser.add_argument("--limit", type=int, default=10, help="Results to print (default: 10)")
+    args = parser.parse_args(argv)
+
+    if args.corpus:
+        if not os.path.exists(args.corpus):
+            print(f"Error: {args.corpus} not found!")
+            return 1
+        start = time.perf_counter()
+        postings, verse_map = build_positional(open_corpus(args.corpus))
+        manifest = write_positional(postings, verse_map, args.out_dir, args.prefix_len)
+        print(f"✓ Positional index: {manifest['terms']} terms, {len(manifest['shards'])} shards, "
+              f"{manifest['bytes'] / 1024:.0f} KB in {time.perf_counter() - start:.2f}s")
+
+    if args.query:
+        index = PositionalIndex(args.out_dir)
+        start = time.perf_counter()
+        if args.near is not None:
+            hits = [ordinal for ordinal, _span in proximity_search(index, args.query, args.near)]
+        else:
+            hits = [ordinal for ordinal, _starts in phrase_search(index, args.query)]
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"'{args.query}': {len(hits)} verses ({elapsed:.2f} ms)")
+        for ordinal in hits[:args.limit]:
+            print(f"  {index.verse_map.ref_string(ordinal)}")
+
+    if not args.corpus and not args.query:
+        parser.print_usage()
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
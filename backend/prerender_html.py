@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Prerender every chapter of a translation to a static HTML fragment
+
+Reader routes otherwise show nothing until the book JSON is downloaded and
+rendered client-side. This stage writes each chapter as a small fragment
+the app can insert before hydration (and crawlers can read), with the
+restored names emphasized as in the printed editions (name_emphasis.py)
+and an anchor per verse:
+
+  <article class="chapter" data-book="Genesis" data-chapter="1">
+  <h1>Genesis 1</h1>
+  <p class="verse" id="v1"><a class="verse-number" href="#v1">1</a> In the beginning
+  <strong class="name-token">Elohiym</strong> created ...</p>
+  ...
+  <nav class="chapter-nav"><a rel="next" href="/restored_kjv/Genesis/2">Genesis 2</a></nav>
+  </article>
+
+Output (in --out_dir):
+  <Book>/<chapter>.html   one fragment per chapter (book names as in books.json)
+  index.html              links to every fragment, by book
+  index.json              {"version", "translation", "generator", "books":
+                           [{"book", "chapters", "fingerprint", "bytes",
+                           "gzip_bytes"}], "build": {...}}
+
+Books are rendered in a process pool. The build is incremental: a book
+whose fingerprint (its text, its neighbouring chapters and the renderer
+code) matches index.json is left as it is.
+
+Usage:
+  python prerender_html.py ../frontend/public/translations/ --out_dir ../frontend/public/translations/html/
+  python prerender_html.py ../frontend/public/translations/ --jobs 4 --force
+"""
+
+import argparse
+import gzip
+import html
+import io
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+from corpus import open_corpus
+from name_emphasis import NameTokenizer
+from render_cache import book_fingerprint, fingerprint, generator_fingerprint
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+PRERENDER_VERSION = 1
+INDEX_FILE = "index.json"
+INDEX_HTML = "index.html"
+DEFAULT_TRANSLATION = "restored_kjv"
+
+# Modules whose code changes the fragments
+RENDERER_MODULES = ("prerender_html.py", "name_emphasis.py")
+
+Ref = Tuple[str, str]  # (book, chapter)
+
+_tokenizer = NameTokenizer()
+
+
+def route(translation: str, ref: Ref) -> str:
+    """Reader route of a chapter, as in App.tsx (/:translation/:book/:chapter)"""
+    book, chapter = ref
+    return f"/{quote(translation)}/{quote(book)}/{chapter}"
+
+
+def fragment_path(book: str, chapter: str) -> str:
+    """Fragment path relative to the output directory"""
+    return f"{book}/{chapter}.html"
+
+
+def chapter_html(book: str, chapter: str, verses: dict, translation: str = DEFAULT_TRANSLATION,
+                 prev_ref: Optional[Ref] = None, next_ref: Optional[Ref] = None) -> str:
+    """One chapter as an HTML fragment"""
+    lines = [
+        f'<article class="chapter" data-book="{html.escape(book)}" data-chapter="{chapter}">',
+        f"<h1>{html.escape(book)} {chapter}</h1>",
+    ]
+    for verse_num in sorted(verses.keys(), key=int):
+        text = _tokenizer.markup(verses[verse_num], '<strong class="name-token">', "</strong>")
+        lines.append(f'<p class="verse" id="v{verse_num}"><a class="verse-number" href="#v{verse_num}">{verse_num}</a> {text}</p>')
+    links = []
+    if prev_ref:
+        links.append(f'<a rel="prev" href="{route(translation, prev_ref)}">{html.escape(prev_ref[0])} {prev_ref[1]}</a>')
+    if next_ref:
+        links.append(f'<a rel="next" href="{route(translation, next_ref)}">{html.escape(next_ref[0])} {next_ref[1]}</a>')
+    if links:
+        lines.append(f'<nav class="chapter-nav">{" ".join(links)}</nav>')
+    lines.append("</article>")
+    return "\n".join(lines) + "\n"
+
+
+def render_book(task) -> Tuple[str, int, int, int]:
+    """
+    Process-pool worker: write one book's fragments, removing chapters the
+    book no longer has. Returns (book, chapters, bytes, gzip bytes).
+    """
+    book, chapters, out_dir, translation, prev_ref, next_ref = task
+    book_dir = os.path.join(out_dir, book)
+    os.makedirs(book_dir, exist_ok=True)
+
+    chapter_nums = sorted(chapters.keys(), key=int)
+    size = gzip_size = 0
+    for idx, chapter in enumerate(chapter_nums):
+        prev_chapter = (book, chapter_nums[idx - 1]) if idx > 0 else prev_ref
+        next_chapter = (book, chapter_nums[idx + 1]) if idx + 1 < len(chapter_nums) else next_ref
+        data = chapter_html(book, chapter, chapters[chapter], translation, prev_chapter, next_chapter).encode("utf-8")
+        with open(os.path.join(book_dir, f"{chapter}.html"), "wb") as f:
+            f.write(data)
+        size += len(data)
+        gzip_size += len(gzip.compress(data, 6))
+
+    expected = {f"{chapter}.html" for chapter in chapter_nums}
+    for name in os.listdir(book_dir):
+        if name.endswith(".html") and name not in expected:
+            os.remove(os.path.join(book_dir, name))
+    return book, len(chapter_nums), size, gzip_size
+
+
+def index_html(chapter_lists: Dict[str, List[str]], translation: str) -> str:
+    """Links to every fragment, one list per book (book -> chapters in order)"""
+    lines = [
+        "<!doctype html>",
+        '<html lang="en">',
+        '<meta charset="utf-8">',
+        f"<title>{html.escape(translation)}: chapters</title>",
+    ]
+    for book, chapters in chapter_lists.items():
+        links = " ".join(f'<a href="{quote(fragment_path(book, chapter))}">{chapter}</a>' for chapter in chapters)
+        lines.append(f"<h2>{html.escape(book)}</h2>\n<p>{links}</p>")
+    lines.append("</html>")
+    return "\n".join(lines) + "\n"
+
+
+def load_index(out_dir: str) -> dict:
+    path = os.path.join(out_dir, INDEX_FILE)
+    if not os.path.exists(path):
+        return {}
+    with io.open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def prerender(corpus_path: str, out_dir: str, translation: str = DEFAULT_TRANSLATION,
+              jobs: int = None, force: bool = False) -> dict:
+    """Render changed books to out_dir and write the index; returns index.json"""
+    start = time.perf_counter()
+    corpus = open_corpus(corpus_path)
+    os.makedirs(out_dir, exist_ok=True)
+    generator = generator_fingerprint(RENDERER_MODULES)
+    # Read even with force: it lists the book directories to remove
+    previous = {entry["book"]: entry for entry in load_index(out_dir).get("books", [])}
+
+    # Chapter lists first, so each book knows the chapters on either side of it
+    books = corpus.book_names()
+    chapter_lists = {book: sorted(corpus[book].keys(), key=int) for book in books}
+    books = [book for book in books if chapter_lists[book]]
+
+    entries = {}
+    pending = []
+    for idx, book in enumerate(books):
+        prev_ref = (books[idx - 1], chapter_lists[books[idx - 1]][-1]) if idx > 0 else None
+        next_ref = (books[idx + 1], chapter_lists[books[idx + 1]][0]) if idx + 1 < len(books) else None
+        chapters = corpus[book]
+        book_fp = fingerprint(PRERENDER_VERSION, generator, translation, prev_ref, next_ref,
+                              book_fingerprint(chapters))
+        old = previous.get(book)
+        if (not force and old and old["fingerprint"] == book_fp
+                and all(os.path.exists(os.path.join(out_dir, fragment_path(book, c))) for c in chapter_lists[book])):
+            entries[book] = old
+            continue
+        entries[book] = {"book": book, "chapters": len(chapter_lists[book]), "fingerprint": book_fp}
+        pending.append((book, chapters, out_dir, translation, prev_ref, next_ref))
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(pending) <= 1:
+        results = [render_book(task) for task in pending]
+    else:
+        # Longest books first so a long book does not start last
+        pending.sort(key=lambda task: -sum(len(verses) for verses in task[1].values()))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(render_book, pending))
+    for book, _chapters, size, gzip_size in results:
+        entries[book].update(bytes=size, gzip_bytes=gzip_size)
+
+    # Books that are gone from the corpus
+    for book in previous:
+        if book not in entries and os.path.isdir(os.path.join(out_dir, book)):
+            shutil.rmtree(os.path.join(out_dir, book))
+
+    book_entries = [entries[book] for book in books]
+    with io.open(os.path.join(out_dir, INDEX_HTML), "w", encoding="utf-8", newline="\n") as f:
+        f.write(index_html({book: chapter_lists[book] for book in books}, translation))
+
+    index = {
+        "version": PRERENDER_VERSION,
+        "translation": translation,
+        "generator": generator,
+        "books": book_entries,
+        "build": {
+            "built_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "seconds": round(time.perf_counter() - start, 3),
+            "chapters": sum(entry["chapters"] for entry in book_entries),
+            "rendered": len(pending),
+            "skipped": len(book_entries) - len(pending),
+            "bytes": sum(entry["bytes"] for entry in book_entries),
+            "gzip_bytes": sum(entry["gzip_bytes"] for entry in book_entries),
+            "jobs": jobs,
+        },
+    }
+    with io.open(os.path.join(out_dir, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    return index
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Prerender every chapter to a static HTML fragment")
+    parser.add_argument("corpus", help="Translation directory or full-Bible JSON")
+    parser.add_argument("--out_dir", default="../frontend/public/translations/html/", help="Fragment output directory")
+    parser.add_argument("--translation", default=DEFAULT_TRANSLATION, help="Translation id used in reader links (default: restored_kjv)")
+    parser.add_argument("--jobs", type=int, default=None, help="Books rendered concurrently (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Render every book, even when unchanged")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.corpus):
+        print(f"Error: {args.corpus} not found!")
+        return 1
+
+    index = prerender(args.corpus, args.out_dir, args.translation, args.jobs, args.force)
+    build = index["build"]
+    print(f"✓ Prerendered {build['chapters']} chapters of {len(index['books'])} books into {args.out_dir} "
+          f"({build['rendered']} rendered, {build['skipped']} unchanged)")
+    print(f"  Size: {build['bytes'] / 1024:.0f} KB ({build['gzip_bytes'] / 1024:.0f} KB gzipped), "
+          f"build time: {build['seconds']:.2f}s with {build['jobs']} job(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,7 @@ from typing import Tuple
 # Local imports from sibling scripts
 from restore_names import load_json as rn_load_json, process_bible_json
 from modernize_language import modernize_bible
+from corpus import open_corpus
 
 
 def save_json(path: str, data: dict) -> None:
@@ -94,7 +95,7 @@ def main() -> int:
         return 2
 
     print(f"Loading extras: {extras_path}")
-    extras = load_json(extras_path)
+    extras = open_corpus(extras_path)
 
     # Sacred names pass
     cfg = rn_load_json(os.path.join("backend", "config", "restored_names_config.json")) if os.path.exists(os.path.join("backend", "config", "restored_names_config.json")) else rn_load_json(os.path.join("config", "restored_names_config.json"))
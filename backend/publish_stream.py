@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Write a progressive NDJSON stream of a translation for incremental rendering
+
+One JSON object per line, priority books (Genesis, Matthew, as in
+preloadPriorityBooks) first and the rest in declared book order:
+
+  {"book": "Genesis", "chapters": {...}}                   --unit book
+  {"book": "Genesis", "chapter": "1", "verses": {...}}     --unit chapter
+
+Books are read one at a time through the corpus loader and each line is
+written as soon as it is encoded, so the whole corpus is never held in
+memory or built as one string.
+
+Usage:
+  python publish_stream.py ../frontend/public/translations/ ../frontend/public/translations/restored_kjv.ndjson
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+from typing import Iterator, List, Sequence
+
+from corpus import open_corpus, to_array_chapter
+from split_bible import SCHEMAS, to_schema
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+PRIORITY_BOOKS = ["Genesis", "Matthew"]
+
+UNITS = ("book", "chapter")
+
+
+def stream_order(book_names: Sequence[str], priority: Sequence[str] = PRIORITY_BOOKS) -> List[str]:
+    """Priority books first (if present), then the remaining books in order"""
+    first = [book for book in priority if book in book_names]
+    return first + [book for book in book_names if book not in first]
+
+
+def iter_records(corpus, unit: str = "book", schema: str = "object",
+                 priority: Sequence[str] = PRIORITY_BOOKS) -> Iterator[dict]:
+    for book in stream_order(corpus.book_names(), priority):
+        chapters = corpus[book]
+        if unit == "book":
+            yield {"book": book, "chapters": to_schema(chapters, schema)}
+            continue
+        for chapter_num in sorted(chapters.keys(), key=int):
+            verses = chapters[chapter_num]
+            if schema == "array":
+                verses = to_array_chapter(verses)
+            yield {"book": book, "chapter": chapter_num, "verses": verses}
+
+
+def write_stream(corpus, output_path: str, unit: str = "book", schema: str = "object",
+                 priority: Sequence[str] = PRIORITY_BOOKS) -> int:
+    """Write one record per line to output_path, returning the number of lines"""
+    lines = 0
+    with io.open(output_path, "w", encoding="utf-8", newline="\n") as f:
+        for record in iter_records(corpus, unit, schema, priority):
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+            lines += 1
+    return lines
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Write a progressive NDJSON stream of a translation")
+    parser.add_argument("corpus", help="Translation directory or full-Bible JSON")
+    parser.add_argument("output", help="Output .ndjson path")
+    parser.add_argument("--unit", choices=UNITS, default="book", help="One line per book or per chapter (default: book)")
+    parser.add_argument("--schema", choices=SCHEMAS, default="object", help="Chapter schema inside each line (default: object)")
+    parser.add_argument("--priority", nargs="*", default=PRIORITY_BOOKS, help="Books to emit first (default: Genesis Matthew)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.corpus):
+        print(f"Error: {args.corpus} not found!")
+        return 1
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    corpus = open_corpus(args.corpus)
+    lines = write_stream(corpus, args.output, args.unit, args.schema, args.priority)
+
+    size = os.path.getsize(args.output) / (1024 * 1024)
+    print(f"✓ Wrote {lines} {args.unit} lines to {args.output} ({size:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
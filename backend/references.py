@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Scripture reference parser shared by the override engine, the cross
+reference compiler and search
+
+Book names are matched with a character trie built once over the canonical
+names, common abbreviations ("Gen", "Ps", "1 Cor", "Song") and extras
+books, so "Psalm 33:6", "ps 33.6" and "Psalms 33:6" all resolve to the
+same verse. Matching is case-insensitive, ignores periods and extra
+spaces, and takes the longest alias that ends at a word boundary.
+
+Accepted forms after the book name:
+  Genesis                 whole book
+  Genesis 1               chapter
+  Genesis 1-3             chapter range
+  Genesis 1:1             verse
+  Genesis 1:1-5           verse range within a chapter
+  Genesis 1:31-2:3        verse range across chapters
+  Genesis 1-2:3           chapter 1 through verse 2:3
+  Jude 3                  verse, for books with a single chapter
+
+With a VerseMap, references resolve to half-open verse ordinal ranges.
+
+Usage:
+  python references.py "Ps 23" "1 Cor 13:4-7" "Gen 1-2:3" --corpus ../frontend/public/translations/
+"""
+
+import argparse
+import re
+import sys
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from corpus import BOOKS_ORDER, NT_BOOKS, OT_BOOKS, CorpusSlice, Span
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+# Abbreviations and alternate names per book; numbered books get "1Cor",
+# "I Cor", "1st Cor" and "First Cor" variants automatically
+BOOK_ALIASES: Dict[str, List[str]] = {
+    "Genesis": ["Gen", "Ge", "Gn"],
+    "Exodus": ["Exod", "Exo", "Ex"],
+    "Leviticus": ["Lev", "Le", "Lv"],
+    "Numbers": ["Num", "Nu", "Nm", "Nb"],
+    "Deuteronomy": ["Deut", "De", "Dt"],
+    "Joshua": ["Josh", "Jos", "Jsh"],
+    "Judges": ["Judg", "Jdg", "Jg", "Jdgs"],
+    "Ruth": ["Rth", "Ru"],
+    "1 Samuel": ["1 Sam", "1 Sa", "1 Sm"],
+    "2 Samuel": ["2 Sam", "2 Sa", "2 Sm"],
+    "1 Kings": ["1 Kgs", "1 Ki", "1 Kin"],
+    "2 Kings": ["2 Kgs", "2 Ki", "2 Kin"],
+    "1 Chronicles": ["1 Chron", "1 Chr", "1 Ch"],
+    "2 Chronicles": ["2 Chron", "2 Chr", "2 Ch"],
+    "Ezra": ["Ezr"],
+    "Nehemiah": ["Neh", "Ne"],
+    "Esther": ["Esth", "Est", "Es"],
+    "Job": ["Jb"],
+    "Psalms": ["Psalm", "Pss", "Psa", "Psm", "Ps"],
+    "Proverbs": ["Prov", "Pro", "Prv", "Pr"],
+    "Ecclesiastes": ["Eccles", "Eccl", "Ecc", "Ec", "Qoh"],
+    "Song of Solomon": ["Song of Songs", "Song", "SOS", "So", "Canticles", "Cant"],
+    "Isaiah": ["Isa", "Is"],
+    "Jeremiah": ["Jer", "Je", "Jr"],
+    "Lamentations": ["Lam", "La"],
+    "Ezekiel": ["Ezek", "Eze", "Ezk"],
+    "Daniel": ["Dan", "Da", "Dn"],
+    "Hosea": ["Hos", "Ho"],
+    "Joel": ["Jl"],
+    "Amos": ["Am"],
+    "Obadiah": ["Obad", "Ob"],
+    "Jonah": ["Jon", "Jnh"],
+    "Micah": ["Mic", "Mc"],
+    "Nahum": ["Nah", "Na"],
+    "Habakkuk": ["Hab", "Hb"],
+    "Zephaniah": ["Zeph", "Zep", "Zp"],
+    "Haggai": ["Hag", "Hg"],
+    "Zechariah": ["Zech", "Zec", "Zc"],
+    "Malachi": ["Mal", "Ml"],
+    "Matthew": ["Matt", "Mat", "Mt"],
+    "Mark": ["Mrk", "Mar", "Mk", "Mr"],
+    "Luke": ["Luk", "Lk"],
+    "John": ["Jhn", "Jn"],
+    "Acts": ["Act", "Ac"],
+    "Romans": ["Rom", "Ro", "Rm"],
+    "1 Corinthians": ["1 Cor", "1 Co"],
+    "2 Corinthians": ["2 Cor", "2 Co"],
+    "Galatians": ["Gal", "Ga"],
+    "Ephesians": ["Eph", "Ephes"],
+    "Philippians": ["Phil", "Php", "Pp"],
+    "Colossians": ["Col"],
+    "1 Thessalonians": ["1 Thess", "1 Thes", "1 Th"],
+    "2 Thessalonians": ["2 Thess", "2 Thes", "2 Th"],
+    "1 Timothy": ["1 Tim", "1 Ti"],
+    "2 Timothy": ["2 Tim", "2 Ti"],
+    "Titus": ["Tit", "Ti"],
+    "Philemon": ["Philem", "Phm", "Pm"],
+    "Hebrews": ["Heb"],
+    "James": ["Jas", "Jm"],
+    "1 Peter": ["1 Pet", "1 Pe", "1 Pt", "1 P"],
+    "2 Peter": ["2 Pet", "2 Pe", "2 Pt", "2 P"],
+    "1 John": ["1 Jn", "1 Jhn", "1 Jo"],
+    "2 John": ["2 Jn", "2 Jhn", "2 Jo"],
+    "3 John": ["3 Jn", "3 Jhn", "3 Jo"],
+    "Jude": ["Jud", "Jd"],
+    "Revelation": ["Revelations", "Rev", "Re", "Rv", "Apocalypse"],
+    # Extras
+    "Book of Enoch": ["Enoch", "1 Enoch", "1 En"],
+}
+
+# "Jude 3" means verse 3: these books have a single chapter
+SINGLE_CHAPTER_BOOKS = {"Obadiah", "Philemon", "2 John", "3 John", "Jude"}
+
+NUMBER_PREFIXES = {
+    "1": ["1", "i", "1st", "first"],
+    "2": ["2", "ii", "2nd", "second"],
+    "3": ["3", "iii", "3rd", "third"],
+}
+
+# Chapter/verse tail after the book name (":" or "." between chapter and verse)
+TAIL_RE = re.compile(
+    r"\s*(\d+)(?:\s*[:.]\s*(\d+))?(?:\s*[-–—]\s*(\d+)(?:\s*[:.]\s*(\d+))?)?"
+)
+
+# Named groups accepted by parse_selection
+SELECTION_GROUPS = {
+    "ot": OT_BOOKS,
+    "old testament": OT_BOOKS,
+    "nt": NT_BOOKS,
+    "new testament": NT_BOOKS,
+}
+
+# Verse bound meaning "to the end of the chapter"
+LAST_VERSE = 10 ** 6
+
+VERSE_ID_RE = re.compile(r"\s+(\d+):(\d+)\b")
+
+_END = ""
+
+
+class Reference(NamedTuple):
+    """A parsed reference; chapter/verse fields are None when not given"""
+    book: str
+    chapter: Optional[int] = None
+    verse: Optional[int] = None
+    end_chapter: Optional[int] = None
+    end_verse: Optional[int] = None
+
+    def __str__(self) -> str:
+        if self.chapter is None:
+            return self.book
+        text = f"{self.book} {self.chapter}"
+        if self.verse is not None:
+            text += f":{self.verse}"
+        if self.end_chapter is not None and self.end_chapter != self.chapter:
+            text += f"-{self.end_chapter}"
+            if self.end_verse is not None:
+                text += f":{self.end_verse}"
+        elif self.end_verse is not None and self.end_verse != self.verse:
+            text += f"-{self.end_verse}"
+        return text
+
+
+def normalize_alias(alias: str) -> str:
+    return " ".join(alias.lower().replace(".", " ").split())
+
+
+def alias_variants(book: str, alias: str) -> List[str]:
+    """alias plus its numbered-book spellings ("1 Cor" -> "1cor", "i cor", ...)"""
+    key = normalize_alias(alias)
+    number, _, rest = key.partition(" ")
+    if number not in NUMBER_PREFIXES or not rest:
+        return [key]
+    variants = []
+    for prefix in NUMBER_PREFIXES[number]:
+        variants.append(f"{prefix} {rest}")
+        if prefix.isdigit():
+            variants.append(f"{prefix}{rest}")
+    return variants
+
+
+class ReferenceParser:
+    """Parses references against a fixed set of book names"""
+
+    def __init__(self, books: Iterable[str] = BOOKS_ORDER, verse_map=None):
+        self.verse_map = verse_map
+        self.books: List[str] = list(books)
+        self._trie: dict = {}
+        for book in self.books:
+            for alias in [book] + BOOK_ALIASES.get(book, []):
+                for key in alias_variants(book, alias):
+                    self._add(key, book)
+
+    @classmethod
+    def from_verse_map(cls, verse_map) -> "ReferenceParser":
+        """Parser over the books of a VerseMap (canon and extras) that resolves ordinals"""
+        return cls(verse_map.book_names(), verse_map)
+
+    def _add(self, key: str, book: str) -> None:
+        node = self._trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+        # Canonical names win over an abbreviation that happens to spell another book
+        node.setdefault(_END, book)
+
+    def match_book(self, text: str, pos: int = 0) -> Tuple[Optional[str], int]:
+        """
+        Longest book name or alias at text[pos:], as (book, end position);
+        (None, pos) when there is none. The match must end at a word boundary.
+        """
+        node = self._trie
+        best: Tuple[Optional[str], int] = (None, pos)
+        i = pos
+        length = len(text)
+        while i < length:
+            ch = text[i].lower()
+            if ch == "." or (ch == " " and i > pos and text[i - 1] in " ."):
+                i += 1
+                if _END in node and (i == length or not text[i].isalpha()):
+                    best = (node[_END], i)
+                continue
+            node = node.get(ch)
+            if node is None:
+                break
+            i += 1
+            if _END in node and (i == length or not text[i].isalpha()):
+                best = (node[_END], i)
+        return best
+
+    def parse_prefix(self, text: str, pos: int = 0) -> Tuple[Optional[Reference], int]:
+        """Reference at the start of text[pos:] and the position after it"""
+        book, end = self.match_book(text, pos)
+        if book is None:
+            return None, pos
+        m = TAIL_RE.match(text, end)
+        if not m:
+            return Reference(book), end
+        chapter, verse, end_a, end_b = m.groups()
+        chapter = int(chapter)
+        if verse is None and book in SINGLE_CHAPTER_BOOKS:
+            verse, chapter = chapter, 1
+        if verse is None and end_b is not None:
+            # "1-2:3": from the start of chapter 1 to 2:3
+            return Reference(book, chapter, 1, int(end_a), int(end_b)), m.end()
+        if verse is None:
+            # "1" or "1-3": chapters
+            return Reference(book, chapter, None, int(end_a) if end_a else chapter, None), m.end()
+        verse = int(verse)
+        if end_a is None:
+            return Reference(book, chapter, verse, chapter, verse), m.end()
+        if end_b is None:
+            # "1:1-5": verses in the same chapter
+            return Reference(book, chapter, verse, chapter, int(end_a)), m.end()
+        return Reference(book, chapter, verse, int(end_a), int(end_b)), m.end()
+
+    def parse_verse_id(self, text: str) -> Tuple[Optional[Reference], int]:
+        """
+        Strict "Book C:V" at the start of text (no ranges), as used by the
+        "Book C:V text" lines of restore_names.py; (None, 0) otherwise.
+        """
+        book, end = self.match_book(text)
+        if book is None:
+            return None, 0
+        m = VERSE_ID_RE.match(text, end)
+        if not m:
+            return None, 0
+        chapter, verse = int(m.group(1)), int(m.group(2))
+        return Reference(book, chapter, verse, chapter, verse), m.end()
+
+    def parse(self, text: str) -> Optional[Reference]:
+        """Parse a whole string as one reference, or None"""
+        ref, end = self.parse_prefix(text.strip())
+        if ref is None or end != len(text.strip()):
+            return None
+        return ref
+
+    def resolve(self, ref) -> Optional[Tuple[int, int]]:
+        """Half-open ordinal range of a Reference or reference string, None if not in the corpus"""
+        if self.verse_map is None:
+            raise ValueError("resolve() needs a parser built with a VerseMap")
+        if isinstance(ref, str):
+            ref = self.parse(ref)
+            if ref is None:
+                return None
+        vm = self.verse_map
+        if ref.book not in vm:
+            return None
+        if ref.chapter is None:
+            start, end = vm.book_range(ref.book)
+        elif ref.verse is None:
+            start, _ = vm.chapter_range(ref.book, ref.chapter)
+            last_start, end = vm.chapter_range(ref.book, ref.end_chapter)
+            if not vm.verse_numbers(ref.book, ref.chapter) or last_start == end:
+                return None
+        else:
+            start = vm.ordinal(ref.book, ref.chapter, ref.verse)
+            last = vm.ordinal(ref.book, ref.end_chapter, ref.end_verse)
+            if start is None or last is None:
+                return None
+            end = last + 1
+        return (start, end) if start < end else None
+
+
+_default_parser: Optional[ReferenceParser] = None
+
+
+def default_parser() -> ReferenceParser:
+    """Shared parser over the canonical books and known extras"""
+    global _default_parser
+    if _default_parser is None:
+        _default_parser = ReferenceParser(list(BOOKS_ORDER) + ["Book of Enoch"])
+    return _default_parser
+
+
+def parse_reference(text: str) -> Optional[Reference]:
+    return default_parser().parse(text)
+
+
+def parse_selection(specs: Iterable[str], parser: ReferenceParser = None) -> Dict[str, Optional[List[Span]]]:
+    """
+    Spans for CorpusSlice from book and range specs such as "Genesis 1-3",
+    "Psalms", "John 3:16-21" or "NT". A spec may list several, separated
+    by commas or semicolons. Raises ValueError for anything unrecognized.
+    """
+    parser = parser or default_parser()
+    spans: Dict[str, Optional[List[Span]]] = {}
+    for spec in specs:
+        for part in re.split(r"[,;]", spec):
+            part = part.strip()
+            if not part:
+                continue
+            group = SELECTION_GROUPS.get(part.lower())
+            if group is not None:
+                spans.update((book, None) for book in group)
+                continue
+            ref = parser.parse(part)
+            if ref is None:
+                raise ValueError(f"Unrecognized book or range '{part}'")
+            if ref.chapter is None:
+                spans[ref.book] = None
+            elif spans.get(ref.book, []) is not None:
+                first = (ref.chapter, ref.verse or 0)
+                last = (ref.end_chapter, ref.end_verse or LAST_VERSE)
+                spans.setdefault(ref.book, []).append((first, last))
+    return spans
+
+
+def select_corpus(corpus, specs: Iterable[str]) -> CorpusSlice:
+    """View of corpus limited to the books and ranges in specs (see parse_selection)"""
+    return CorpusSlice(corpus, parse_selection(specs, ReferenceParser(list(corpus))))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Parse scripture references")
+    parser.add_argument("refs", nargs="+", help="References to parse")
+    parser.add_argument("--corpus", help="Translation directory or full-Bible JSON, to resolve ordinals")
+    parser.add_argument("--bench", type=int, default=0, help="Also time this many parses")
+    args = parser.parse_args(argv)
+
+    if args.corpus:
+        from corpus import open_corpus
+        from ordinals import VerseMap
+        ref_parser = ReferenceParser.from_verse_map(VerseMap.from_corpus(open_corpus(args.corpus)))
+    else:
+        ref_parser = default_parser()
+
+    for text in args.refs:
+        ref = ref_parser.parse(text)
+        if ref is None:
+            print(f"  {text!r}: not a reference")
+        elif ref_parser.verse_map is not None:
+            span = ref_parser.resolve(ref)
+            print(f"  {text!r}: {ref} -> {span if span else 'not in corpus'}")
+        else:
+            print(f"  {text!r}: {ref}")
+
+    if args.bench:
+        start = time.perf_counter()
+        for i in range(args.bench):
+            ref_parser.parse(args.refs[i % len(args.refs)])
+        elapsed = time.perf_counter() - start
+        print(f"{args.bench} parses in {elapsed * 1000:.1f} ms ({args.bench / elapsed:,.0f}/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
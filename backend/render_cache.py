@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Fingerprint cache for generate_pdf.py renders
+
+An artifact (build/restored_kjv_bible*.pdf/.docx) is fingerprinted from
+the text of every book, the render options (format, TOC, subtitle,
+engine), the style definitions and the generator itself (the source of
+the rendering modules). When the fingerprint matches the one recorded for
+the existing output, the render is skipped.
+
+Per-book fragments (book PDFs of the --parallel renderer, document.xml
+runs of the streaming DOCX writer) are cached under their own
+fingerprints, so after a one-book edit only that book is rendered again
+before the artifact is assembled.
+
+Each output has its own record, so renders running in parallel (--jobs)
+never rewrite a shared file. A record lists the fragments the output was
+assembled from; prune() deletes fragments no record refers to.
+
+Layout (in --cache-dir, default build/.render_cache/):
+  artifacts/<sha256 of output path>.json
+                          {"output", "fingerprint", "fragments": [[kind, fingerprint], ...]}
+  <kind>/<fingerprint>.*  fragments
+
+Usage:
+  python render_cache.py --cache-dir build/.render_cache/ --prune
+  python render_cache.py --cache-dir build/.render_cache/ --clear
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence, Set, Tuple
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+DEFAULT_CACHE_DIR = "build/.render_cache"
+ARTIFACTS_DIR = "artifacts"
+
+# Modules whose code changes the rendered output
+GENERATOR_MODULES = ("generate_pdf.py", "docx_stream.py", "name_emphasis.py", "modernize_language.py")
+
+
+def fingerprint(*parts) -> str:
+    """sha256 of JSON-serializable parts"""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def book_fingerprint(chapters: dict) -> str:
+    """Fingerprint of one book's text (chapter -> verse -> text)"""
+    return fingerprint(chapters)
+
+
+_generator_fingerprints: Dict[Tuple[str, ...], str] = {}
+
+
+def generator_fingerprint(modules: Iterable[str] = GENERATOR_MODULES) -> str:
+    """Fingerprint of the rendering code (backend modules), read once per process"""
+    modules = tuple(modules)
+    if modules not in _generator_fingerprints:
+        digest = hashlib.sha256()
+        base = os.path.dirname(os.path.abspath(__file__))
+        for name in modules:
+            path = os.path.join(base, name)
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    digest.update(name.encode("utf-8") + b"\0" + f.read())
+        _generator_fingerprints[modules] = digest.hexdigest()
+    return _generator_fingerprints[modules]
+
+
+class RenderCache:
+    """
+    Artifact fingerprints and per-book fragment files under one directory.
+
+    Use one RenderCache per artifact render: the fragments it hands out are
+    the ones record() lists for the output.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self._fragments: Set[Tuple[str, str]] = set()
+
+    def _record_path(self, output_path) -> Path:
+        name = hashlib.sha256(str(output_path).encode("utf-8")).hexdigest()
+        return self.cache_dir / ARTIFACTS_DIR / f"{name}.json"
+
+    def _load_record(self, path: Path) -> Optional[dict]:
+        try:
+            with io.open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _load_records(self) -> Dict[Path, dict]:
+        directory = self.cache_dir / ARTIFACTS_DIR
+        if not directory.exists():
+            return {}
+        records = {}
+        for path in sorted(directory.glob("*.json")):
+            record = self._load_record(path)
+            if record is not None:
+                records[path] = record
+        return records
+
+    def _load_artifacts(self) -> Dict[str, str]:
+        """{output path: fingerprint} of every recorded artifact"""
+        return {record["output"]: record["fingerprint"] for record in self._load_records().values()}
+
+    def artifact_fingerprint(self, kind: str, bible_data, options: dict, styles: str = "") -> str:
+        """Fingerprint of an artifact: generator, styles, options and every book's text"""
+        books = [(book, book_fingerprint(bible_data[book])) for book in bible_data.keys()]
+        return fingerprint(kind, generator_fingerprint(), styles, options, books)
+
+    def is_fresh(self, output_path, artifact_fp: str) -> bool:
+        """True when output_path exists and was rendered from artifact_fp"""
+        if not Path(output_path).exists():
+            return False
+        record = self._load_record(self._record_path(output_path))
+        return record is not None and record["fingerprint"] == artifact_fp
+
+    def record(self, output_path, artifact_fp: str) -> None:
+        """Remember the fingerprint output_path was rendered from and the fragments it used"""
+        path = self._record_path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            "output": str(output_path),
+            "fingerprint": artifact_fp,
+            "fragments": sorted(self._fragments),
+        }
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with io.open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def prune(self) -> Tuple[int, int]:
+        """
+        Drop records of outputs that no longer exist and delete fragments
+        no remaining record refers to. Run it only when no render is in
+        progress: fragments of an unfinished render are not recorded yet.
+        Returns (records, fragment files) removed.
+        """
+        keep: Set[Tuple[str, str]] = set()
+        records_removed = 0
+        for path, record in self._load_records().items():
+            if Path(record["output"]).exists():
+                keep.update((kind, fragment_fp) for kind, fragment_fp in record.get("fragments", []))
+            else:
+                path.unlink()
+                records_removed += 1
+
+        files_removed = 0
+        if self.cache_dir.exists():
+            for directory in self.cache_dir.iterdir():
+                if not directory.is_dir() or directory.name == ARTIFACTS_DIR:
+                    continue
+                for path in directory.iterdir():
+                    if (directory.name, path.name.split(".", 1)[0]) not in keep:
+                        path.unlink()
+                        files_removed += 1
+        return records_removed, files_removed
+
+    def fragment_path(self, kind: str, fragment_fp: str, suffix: str) -> Path:
+        """Where the fragment with this fingerprint lives (it may not exist yet)"""
+        self._fragments.add((kind, fragment_fp))
+        directory = self.cache_dir / kind
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory / f"{fragment_fp}{suffix}"
+
+    def load_meta(self, kind: str, fragment_fp: str) -> Optional[dict]:
+        """Metadata stored with a fragment, or None when it is not cached"""
+        path = self.fragment_path(kind, fragment_fp, ".json")
+        if not path.exists():
+            return None
+        with io.open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def store_meta(self, kind: str, fragment_fp: str, meta: dict) -> None:
+        """Write a fragment's metadata last, marking the fragment complete"""
+        path = self.fragment_path(kind, fragment_fp, ".json")
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with io.open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, path)
+
+    def clear(self) -> None:
+        if self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir)
+
+    def size(self) -> int:
+        return sum(p.stat().st_size for p in self.cache_dir.rglob("*") if p.is_file()) if self.cache_dir.exists() else 0
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect or clear the generate_pdf.py render cache")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Cache directory")
+    parser.add_argument("--clear", action="store_true", help="Delete every cached artifact fingerprint and fragment")
+    parser.add_argument("--prune", action="store_true", help="Delete fragments no recorded artifact was built from")
+    args = parser.parse_args(argv)
+
+    cache = RenderCache(args.cache_dir)
+    if args.clear:
+        cache.clear()
+        print(f"✓ Cleared {args.cache_dir}")
+        return 0
+    if args.prune:
+        records, files = cache.prune()
+        print(f"✓ Pruned {files} fragment files and {records} records of deleted outputs")
+    artifacts = cache._load_artifacts()
+    print(f"✓ {len(artifacts)} artifacts, {cache.size() / 1024 / 1024:.1f} MB in {args.cache_dir}")
+    for path, artifact_fp in sorted(artifacts.items()):
+        print(f"  {artifact_fp[:12]}  {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
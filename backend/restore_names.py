@@ -11,7 +11,9 @@ import logging
 import os
 import re
 import sys
-from typing import Dict, Iterable, List, Sequence, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from references import VERSE_ID_RE, default_parser
 
 # Fix Windows console encoding issues
 if sys.platform == 'win32':
@@ -68,6 +70,14 @@ def apply_rules(text: str, rules: Sequence[Rule]) -> Tuple[str, List[Tuple[str,
 
 
 def parse_verse_id(line: str) -> str:
+    """
+    Canonical "Book C:V" id at the start of line ("Ps 68:4" → "Psalms 68:4"),
+    or "" when there is none. Books the reference parser does not know keep
+    their spelling.
+    """
+    ref, _end = default_parser().parse_verse_id(line)
+    if ref is not None:
+        return f"{ref.book} {ref.chapter}:{ref.verse}"
     m = re.match(r"^([1-3]?\s?[A-Za-z ]+)\s+(\d+):(\d+)\b", line)
     if not m:
         return ""
@@ -77,6 +87,19 @@ def parse_verse_id(line: str) -> str:
     return f"{book} {chap}:{verse}"
 
 
+def split_verse_line(line: str) -> Optional[Tuple[str, str, str, str]]:
+    """(book, chapter, verse, text) of a "Book C:V text" line, or None"""
+    book, end = default_parser().match_book(line)
+    m = VERSE_ID_RE.match(line, end) if book is not None else None
+    if m and line[m.end():m.end() + 1].isspace():
+        book = re.sub(r"\s+", " ", line[:end].strip())
+        return book, m.group(1), m.group(2), line[m.end():].lstrip()
+    m = re.match(r"^([1-3]?\s?[A-Za-z ]+)\s+(\d+):(\d+)\s+(.*)$", line)
+    if not m:
+        return None
+    return re.sub(r"\s+", " ", m.group(1).strip()), m.group(2), m.group(3), m.group(4)
+
+
 def apply_overrides_line(line: str, overrides_map: Dict[str, List[dict]]) -> str:
     vid = parse_verse_id(line)
     if not vid:
@@ -97,7 +120,8 @@ def apply_overrides_line(line: str, overrides_map: Dict[str, List[dict]]) -> str
 def build_overrides_map(overrides_json: dict) -> Dict[str, List[dict]]:
     overrides_map: Dict[str, List[dict]] = {}
     for entry in overrides_json.get("overrides", []):
-        overrides_map.setdefault(entry["id"], []).extend(entry.get("actions", []))
+        vid = parse_verse_id(entry["id"]) or entry["id"]
+        overrides_map.setdefault(vid, []).extend(entry.get("actions", []))
     return overrides_map
 
 
@@ -113,13 +137,9 @@ def bible_json_to_lines(bible_json: dict) -> List[str]:
 def lines_to_bible_json(lines: List[str]) -> dict:
     bible = {}
     for line in lines:
-        m = re.match(r"^([1-3]?\s?[A-Za-z ]+)\s+(\d+):(\d+)\s+(.*)$", line)
-        if m:
-            book = re.sub(r"\s+", " ", m.group(1).strip())
-            chapter = m.group(2)
-            verse = m.group(3)
-            text = m.group(4)
-            
+        parts = split_verse_line(line)
+        if parts:
+            book, chapter, verse, text = parts
             if book not in bible:
                 bible[book] = {}
             if chapter not in bible[book]:
@@ -0,0 +1,11 @@
+"""
+Ranked search over the prebuilt inverted index (see search_index.py)
+
+Usage:
+  python -m search "faith hope charity"
+  python -m search "Yahuah" --category old-testament --scope book --book Psalms
+"""
+
+from search.engine import CATEGORIES, NAME_TERMS, SCOPES, MappedIndex, SearchEngine
+
+__all__ = ["CATEGORIES", "NAME_TERMS", "SCOPES", "MappedIndex", "SearchEngine"]
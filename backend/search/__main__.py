@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Query the search index from the command line
+
+Usage:
+  python -m search "in the beginning"
+  python -m search "Ruach" --category new-testament --limit 5 --corpus ../frontend/public/translations/
+  python -m search "light" --scope chapter --book Genesis --chapter 1
+  python -m search "Ps 23:1-3" --corpus ../frontend/public/translations/
+"""
+
+import argparse
+import sys
+import time
+from typing import Sequence
+
+from corpus import open_corpus
+from search.engine import CATEGORIES, SCOPES, SearchEngine
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m search", description="BM25 search over the prebuilt index")
+    parser.add_argument("query", nargs="+", help="Query text (several arguments run as separate queries)")
+    parser.add_argument("--index", default="../frontend/public/translations/index/", help="search_index.py directory")
+    parser.add_argument("--corpus", help="Translation directory or full-Bible JSON, to print verse text")
+    parser.add_argument("--category", choices=CATEGORIES, default="all", help="Search.tsx category filter")
+    parser.add_argument("--scope", choices=SCOPES, default="all", help="Search.tsx scope filter")
+    parser.add_argument("--book", help="Book for --scope book/chapter")
+    parser.add_argument("--chapter", help="Chapter for --scope chapter")
+    parser.add_argument("--all-terms", action="store_true", help="Only verses containing every query term")
+    parser.add_argument("--limit", type=int, default=10, help="Results to print (default: 10)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        engine = SearchEngine(args.index)
+        engine.norms
+    except FileNotFoundError:
+        print(f"Error: no index in {args.index}! Run search_index.py first.")
+        return 1
+    print(f"Loaded index ({engine.documents} verses) in {(time.perf_counter() - start) * 1000:.1f} ms")
+    corpus = open_corpus(args.corpus) if args.corpus else None
+
+    for query in args.query:
+        start = time.perf_counter()
+        span = engine.reference(query)
+        if span is not None:
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"\n'{query}': reference, {span[1] - span[0]} verses ({elapsed:.2f} ms)")
+            for ordinal in range(span[0], min(span[1], span[0] + args.limit)):
+                book, chapter, verse = engine.verse_map.ref(ordinal)
+                line = f"  {book} {chapter}:{verse}"
+                if corpus is not None:
+                    line += f"  {corpus[book][chapter][verse]}"
+                print(line)
+            continue
+        try:
+            hits = engine.search(query, args.category, args.scope, args.book, args.chapter,
+                                 args.limit, args.all_terms)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        elapsed = (time.perf_counter() - start) * 1000
+
+        print(f"\n'{query}': {len(hits)} results ({elapsed:.2f} ms)")
+        for ordinal, score in hits:
+            book, chapter, verse = engine.verse_map.ref(ordinal)
+            line = f"  {score:6.2f}  {book} {chapter}:{verse}"
+            if corpus is not None:
+                line += f"  {corpus[book][chapter][verse]}"
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
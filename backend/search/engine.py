@@ -0,0 +1,342 @@
+"""
+BM25 ranking over a search_index.py directory
+
+Shards are memory-mapped and each term's decoded postings are kept in a
+small LRU, so repeated and type-ahead queries only pay for terms they have
+not seen. Per-verse BM25 contributions are computed only for the terms a
+query scans in full; common terms that MaxScore just probes ("the", "and")
+are scored for the candidate verses alone.
+Queries that are scripture references ("Ps 23:1-3") can be resolved to
+ordinal ranges with SearchEngine.reference before falling back to BM25.
+Filters follow the Search.tsx controls: a category (all, old-testament,
+new-testament, names) and a scope (all, book, chapter). Book and chapter
+filters become ordinal ranges, which postings (sorted by ordinal) are
+sliced to with bisect instead of filtering every hit.
+"""
+
+import bisect
+import heapq
+import itertools
+import math
+import mmap
+import os
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from ordinals import VerseMap
+from references import ReferenceParser
+from search_index import ShardedIndex, read_shard_terms, shard_key, tokenize
+
+CATEGORIES = ("all", "old-testament", "new-testament", "names")
+SCOPES = ("all", "book", "chapter")
+
+# The "names" category of Search.tsx, matched as index terms
+NAME_TERMS = (
+    "yahuah", "elohiym", "yah", "yahusha", "mashiach", "ruach", "qodesh",
+    "shaddai", "elyon", "adonai", "el", "yahweh", "yhwh",
+)
+
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+DEFAULT_CACHE_SIZE = 256
+
+Range = Tuple[int, int]
+
+# A run of varint continuation bytes (the terminating byte follows it)
+_CONTINUED = re.compile(rb"[\x80-\xff]+")
+
+
+class MappedIndex(ShardedIndex):
+    """ShardedIndex that memory-maps shard files instead of reading them"""
+
+    def __init__(self, index_dir: str):
+        super().__init__(index_dir)
+        self._ends: Dict[str, Dict[str, int]] = {}
+
+    def _shard(self, key: str):
+        if key not in self._shards:
+            path = os.path.join(self.index_dir, f"{key}.idx")
+            if not os.path.exists(path) or not os.path.getsize(path):
+                self._shards[key] = (b"", {}, 0)
+            else:
+                with open(path, "rb") as f:
+                    buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                terms, base = read_shard_terms(buf, self.MAGIC)
+                self._shards[key] = (buf, terms, base)
+        return self._shards[key]
+
+    def _postings_end(self, key: str, term: str) -> int:
+        """Offset just past a term's postings (the next term's start)"""
+        if key not in self._ends:
+            buf, terms, base = self._shard(key)
+            ordered = sorted(terms, key=lambda t: terms[t][0])
+            offsets = [terms[t][0] for t in ordered[1:]] + [len(buf) - base]
+            self._ends[key] = dict(zip(ordered, offsets))
+        return self._ends[key].get(term, 0)
+
+    def postings_arrays(self, term: str) -> Tuple[List[int], Sequence[int]]:
+        """
+        (ordinals, term frequencies) of a normalized term.
+
+        Postings are sliced out of the shard as bytes; when every varint is
+        a single byte (common terms, whose ordinal gaps are small) those
+        already are the values.
+        """
+        key = shard_key(term, self.prefix_len)
+        buf, terms, base = self._shard(key)
+        if term not in terms:
+            return [], []
+        offset, df = terms[term]
+        values = buf[base + offset:base + self._postings_end(key, term)]
+        if len(values) != 2 * df:
+            values = _merge_varints(values)
+        return list(itertools.accumulate(values[0::2])), values[1::2]
+
+    def load_shards(self) -> None:
+        """Map every shard and parse its term table up front"""
+        for key in self.manifest["shards"]:
+            self._postings_end(key, "")
+
+
+def _merge_varints(data: bytes) -> List[int]:
+    """
+    Decode LEB128 varints from bytes.
+
+    Single-byte varints are copied over in bulk; only the runs of
+    continuation bytes (large ordinal gaps) are decoded one by one.
+    """
+    values: List[int] = []
+    pos = 0
+    for run in _CONTINUED.finditer(data):
+        start, end = run.span()
+        values.extend(data[pos:start])
+        value = 0
+        for shift, byte in enumerate(data[start:end]):
+            value |= (byte & 0x7F) << (7 * shift)
+        values.append(value | (data[end] << (7 * (end - start))))
+        pos = end + 1
+    values.extend(data[pos:])
+    return values
+
+
+class SearchEngine:
+    """BM25 queries with Search.tsx category and scope filters"""
+
+    def __init__(self, index_dir: str, k1: float = DEFAULT_K1, b: float = DEFAULT_B,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
+        self.index = MappedIndex(index_dir)
+        self.k1 = k1
+        self.b = b
+        self.cache_size = cache_size
+        self.documents: int = self.index.manifest["documents"]
+        self.avg_doc_length: float = self.index.manifest["avg_doc_length"] or 1.0
+        self._cache: "OrderedDict[str, list]" = OrderedDict()
+        self._norms: Optional[List[float]] = None
+        self._min_norm = 0.0
+        self._name_verses: Optional[Set[int]] = None
+        self._references: Optional[ReferenceParser] = None
+
+    @property
+    def verse_map(self) -> VerseMap:
+        return self.index.verse_map
+
+    @property
+    def norms(self) -> List[float]:
+        """Per verse k1 × (1 - b + b × length / avg length), the BM25 length norm"""
+        if self._norms is None:
+            k1, b, avg = self.k1, self.b, self.avg_doc_length
+            self._norms = [k1 * (1 - b + b * length / avg) for length in self.index.doc_lengths]
+            self._min_norm = min(self._norms, default=0.0)
+        return self._norms
+
+    def _entry(self, term: str) -> list:
+        """
+        Cached [ordinals, tfs, weight, bound, impacts] of a normalized term.
+
+        weight × tf / (tf + norm) is the term's contribution to a verse and
+        bound the largest it can be (its highest tf in the shortest verse).
+        impacts stays None until the term is scanned in full.
+        """
+        entry = self._cache.get(term)
+        if entry is not None:
+            self._cache.move_to_end(term)
+            return entry
+        ordinals, tfs = self.index.postings_arrays(term)
+        self.norms
+        weight = self.idf(len(ordinals)) * (self.k1 + 1)
+        top_tf = max(tfs, default=0)
+        bound = weight * top_tf / (top_tf + self._min_norm) if top_tf else 0.0
+        entry = [ordinals, tfs, weight, bound, None]
+        self._cache[term] = entry
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return entry
+
+    def impacts(self, term: str) -> Tuple[List[int], List[float], float]:
+        """
+        (ordinals, BM25 contributions, largest contribution) of a normalized term.
+
+        A term's contribution to a verse does not depend on the rest of the
+        query, so it is computed once and kept with the postings.
+        """
+        entry = self._entry(term)
+        impacts = self._impacts(entry)
+        return entry[0], impacts, max(impacts, default=0.0)
+
+    def _impacts(self, entry: list) -> List[float]:
+        """Contribution to each verse of a cached term, computed on first use"""
+        ordinals, tfs, weight, _bound, impacts = entry
+        if impacts is None:
+            norms = self.norms
+            impacts = entry[4] = [weight * tf / (tf + norms[o]) for o, tf in zip(ordinals, tfs)]
+        return impacts
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def idf(self, df: int) -> float:
+        return math.log(1 + (self.documents - df + 0.5) / (df + 0.5))
+
+    def ranges(self, category: str = "all", scope: str = "all", book: str = None,
+               chapter=None) -> Optional[List[Range]]:
+        """Ordinal ranges a query is restricted to, or None for the whole corpus"""
+        if category not in CATEGORIES:
+            raise ValueError(f"Unknown category '{category}' (expected one of {', '.join(CATEGORIES)})")
+        if scope not in SCOPES:
+            raise ValueError(f"Unknown scope '{scope}' (expected one of {', '.join(SCOPES)})")
+
+        ranges: Optional[List[Range]] = None
+        if category == "old-testament":
+            ranges = self.verse_map.testament_range("ot")
+        elif category == "new-testament":
+            ranges = self.verse_map.testament_range("nt")
+
+        if scope != "all":
+            if not book:
+                raise ValueError(f"Scope '{scope}' needs a book")
+            if book not in self.verse_map:
+                raise ValueError(f"Unknown book '{book}'")
+            if scope == "book":
+                scoped = self.verse_map.book_range(book)
+            else:
+                if chapter is None:
+                    raise ValueError("Scope 'chapter' needs a chapter")
+                scoped = self.verse_map.chapter_range(book, chapter)
+            ranges = [scoped] if ranges is None else _intersect(ranges, scoped)
+        return ranges
+
+    def name_verses(self) -> Set[int]:
+        """Verses containing any of the names category terms"""
+        if self._name_verses is None:
+            verses: Set[int] = set()
+            for term in NAME_TERMS:
+                verses.update(self.index.postings_arrays(term)[0])
+            self._name_verses = verses
+        return self._name_verses
+
+    def reference(self, query: str) -> Optional[Range]:
+        """
+        Ordinal range when the whole query is a scripture reference
+        ("Ps 23", "John 3:16-18"), None otherwise. A bare book name is not
+        a reference here: "Job", "Mark" and "Acts" are also words people
+        search for.
+        """
+        if self._references is None:
+            self._references = ReferenceParser.from_verse_map(self.verse_map)
+        ref = self._references.parse(query)
+        if ref is None or ref.chapter is None:
+            return None
+        return self._references.resolve(ref)
+
+    def search(self, query: str, category: str = "all", scope: str = "all", book: str = None,
+               chapter=None, limit: int = 20, require_all: bool = False) -> List[Tuple[int, float]]:
+        """
+        Top verses for query by BM25, as [(ordinal, score), ...] best first.
+
+        Verses matching any query term are scored unless require_all is set.
+        """
+        ranges = self.ranges(category, scope, book, chapter)
+        if ranges is None:
+            ranges = [(0, self.documents)]
+
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        entries = [self._entry(term) for term in terms]
+        if len(entries) == 1 and len(ranges) == 1 and category != "names":
+            ordinals = entries[0][0]
+            impacts = self._impacts(entries[0])
+            lo, hi = ranges[0]
+            hits = range(bisect.bisect_left(ordinals, lo), bisect.bisect_left(ordinals, hi))
+            return [(ordinals[k], impacts[k]) for k in heapq.nlargest(limit, hits, key=impacts.__getitem__)]
+        if require_all and not all(entry[0] for entry in entries):
+            return []
+        # MaxScore: rarest (highest-bound) terms first; once no verse outside
+        # the candidates can reach the current top results, the remaining
+        # terms are only looked up for the existing candidates.
+        entries.sort(key=lambda entry: entry[3], reverse=True)
+        names = self.name_verses() if category == "names" else None
+
+        scores: Dict[int, float] = {}
+        matched: Dict[int, int] = {}
+        for i, entry in enumerate(entries):
+            if names is not None:
+                scores = {o: s for o, s in scores.items() if o in names}
+            if i and len(scores) >= limit:
+                kth = heapq.nlargest(limit, scores.values())[-1]
+                if kth > sum(rest[3] for rest in entries[i:]):
+                    # With require_all, kth may come from verses the filter
+                    # drops later, so it cannot rule candidates out
+                    self._probe(entries[i:], scores, None if require_all else kth, matched if require_all else None)
+                    break
+            ordinals = entry[0]
+            impacts = self._impacts(entry)
+            for lo, hi in ranges:
+                start = bisect.bisect_left(ordinals, lo)
+                end = bisect.bisect_left(ordinals, hi)
+                if not scores:
+                    scores.update(zip(ordinals[start:end], impacts[start:end]))
+                else:
+                    get = scores.get
+                    for ordinal, impact in zip(ordinals[start:end], impacts[start:end]):
+                        scores[ordinal] = get(ordinal, 0.0) + impact
+                if require_all:
+                    for ordinal in ordinals[start:end]:
+                        matched[ordinal] = matched.get(ordinal, 0) + 1
+
+        if require_all:
+            scores = {o: s for o, s in scores.items() if matched[o] == len(terms)}
+        if names is not None:
+            scores = {o: s for o, s in scores.items() if o in names}
+        # Ties keep ordinal (canonical) order: nlargest is stable like sorted()
+        return [(o, scores[o]) for o in heapq.nlargest(limit, scores, key=scores.__getitem__)]
+
+    def _probe(self, entries: List[list], scores: Dict[int, float], kth: Optional[float],
+               matched: Optional[Dict[int, int]]) -> None:
+        """
+        Add the contributions of the remaining terms to the existing
+        candidates only. With kth (the current top results' lowest score),
+        candidates that can no longer reach it are dropped before each term.
+        """
+        norms = self.norms
+        rest = sum(entry[3] for entry in entries)
+        for ordinals, tfs, weight, bound, _impacts in entries:
+            if kth is not None:
+                for ordinal in [o for o, score in scores.items() if score + rest < kth]:
+                    del scores[ordinal]
+            rest -= bound
+            size = len(ordinals)
+            for ordinal in scores:
+                k = bisect.bisect_left(ordinals, ordinal)
+                if k < size and ordinals[k] == ordinal:
+                    tf = tfs[k]
+                    scores[ordinal] += weight * tf / (tf + norms[ordinal])
+                    if matched is not None:
+                        matched[ordinal] = matched.get(ordinal, 0) + 1
+
+
+def _intersect(ranges: Sequence[Range], scoped: Range) -> List[Range]:
+    lo, hi = scoped
+    return [(max(a, lo), min(b, hi)) for a, b in ranges if max(a, lo) < min(b, hi)]
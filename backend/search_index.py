@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Build a sharded inverted index (term -> verse ordinals) of a translation
+
+Replaces building a Fuse index over every verse in the browser: the search
+page fetches index.json, then only the shards for the terms it needs.
+
+Output (in --out_dir):
+  index.json      manifest: shards, corpus stats, build time and size
+  verses.json     ordinal <-> book/chapter/verse map (see ordinals.py)
+  doclens.bin     varint token count of every verse, in ordinal order
+  <prefix>.idx    one shard per term prefix
+
+Shard layout (all integers are unsigned LEB128 varints):
+  b"BRIX1" term_count
+  term_count × (term_len term_utf8 postings_offset df)
+  postings: per term, df × (ordinal_delta tf), offsets relative to the
+  start of the postings area and ordinals delta-encoded from 0
+
+Usage:
+  python search_index.py ../frontend/public/translations/ --out_dir ../frontend/public/translations/index/
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from corpus import open_corpus
+from ordinals import VerseMap, iter_verses
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+INDEX_VERSION = 1
+SHARD_MAGIC = b"BRIX1"
+DEFAULT_PREFIX_LEN = 1
+
+MANIFEST_FILE = "index.json"
+VERSES_FILE = "verses.json"
+DOCLENS_FILE = "doclens.bin"
+HISTORY_FILE = "index_history.csv"
+
+WORD_RE = re.compile(r"[^\W_]+")
+APOSTROPHES = "'’"
+
+# term -> [(ordinal, tf), ...] in ordinal order
+Postings = Dict[str, List[Tuple[int, int]]]
+
+
+# ---------------------------------------------------------------------------
+# Tokenizer
+# ---------------------------------------------------------------------------
+
+def normalize_word(word: str) -> str:
+    """Lowercase and strip diacritics/niqqud so transliterations match plain input"""
+    decomposed = unicodedata.normalize("NFD", word.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def iter_tokens(text: str) -> Iterator[Tuple[str, int, int]]:
+    """
+    Yield (term, start, end) for each word in text.
+
+    Words are runs of letters/digits in any script (Latin and Hebrew), so
+    "Ha'Qodesh" yields "ha", "qodesh" and a query tokenized the same way
+    matches it as a phrase. A possessive "'s" is dropped ("Yahuah's" ->
+    "yahuah"); "{...}" annotation braces are ignored like other punctuation.
+    """
+    for m in WORD_RE.finditer(text):
+        start = m.start()
+        word = m.group()
+        if word in ("s", "S") and start > 0 and text[start - 1] in APOSTROPHES:
+            continue
+        yield normalize_word(word), start, m.end()
+
+
+def tokenize(text: str) -> List[str]:
+    return [term for term, _start, _end in iter_tokens(text)]
+
+
+# ---------------------------------------------------------------------------
+# Varint codec
+# ---------------------------------------------------------------------------
+
+def encode_varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(buf, pos: int) -> Tuple[int, int]:
+    """Decode one varint at buf[pos], returning (value, next_pos)"""
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def encode_varints(values: Iterable[int]) -> bytes:
+    out = bytearray()
+    for value in values:
+        encode_varint(value, out)
+    return bytes(out)
+
+
+def decode_varints(buf, count: int, pos: int = 0) -> Tuple[List[int], int]:
+    values = []
+    for _ in range(count):
+        value, pos = decode_varint(buf, pos)
+        values.append(value)
+    return values, pos
+
+
+# ---------------------------------------------------------------------------
+# Shards
+# ---------------------------------------------------------------------------
+
+def shard_key(term: str, prefix_len: int = DEFAULT_PREFIX_LEN) -> str:
+    """File-safe shard name: the term's first characters, '_' for non a-z/0-9"""
+    prefix = term[:prefix_len]
+    return "".join(ch if ("a" <= ch <= "z" or "0" <= ch <= "9") else "_" for ch in prefix)
+
+
+def encode_postings(postings: Sequence[Tuple[int, int]]) -> bytes:
+    out = bytearray()
+    previous = 0
+    for ordinal, tf in postings:
+        encode_varint(ordinal - previous, out)
+        encode_varint(tf, out)
+        previous = ordinal
+    return bytes(out)
+
+
+def decode_postings(buf, offset: int, df: int) -> List[Tuple[int, int]]:
+    postings = []
+    ordinal = 0
+    pos = offset
+    for _ in range(df):
+        delta, pos = decode_varint(buf, pos)
+        tf, pos = decode_varint(buf, pos)
+        ordinal += delta
+        postings.append((ordinal, tf))
+    return postings
+
+
+def encode_shard(terms: Dict[str, list], encode=encode_postings, magic: bytes = SHARD_MAGIC) -> bytes:
+    header = bytearray(magic)
+    body = bytearray()
+    encode_varint(len(terms), header)
+    for term in sorted(terms):
+        raw = term.encode("utf-8")
+        encode_varint(len(raw), header)
+        header.extend(raw)
+        encode_varint(len(body), header)
+        encode_varint(len(terms[term]), header)
+        body.extend(encode(terms[term]))
+    return bytes(header + body)
+
+
+def read_shard_terms(buf, magic: bytes = SHARD_MAGIC) -> Tuple[Dict[str, Tuple[int, int]], int]:
+    """Parse a shard header into {term: (postings_offset, df)} and the postings base"""
+    if bytes(buf[:len(magic)]) != magic:
+        raise ValueError("Not a search index shard")
+    count, pos = decode_varint(buf, len(magic))
+    terms = {}
+    for _ in range(count):
+        length, pos = decode_varint(buf, pos)
+        term = bytes(buf[pos:pos + length]).decode("utf-8")
+        pos += length
+        offset, pos = decode_varint(buf, pos)
+        df, pos = decode_varint(buf, pos)
+        terms[term] = (offset, df)
+    return terms, pos
+
+
+# ---------------------------------------------------------------------------
+# Builder
+# ---------------------------------------------------------------------------
+
+def build_postings(corpus) -> Tuple[Postings, List[int], VerseMap]:
+    """Tokenize every verse into term postings and per-verse token counts"""
+    postings: Postings = defaultdict(list)
+    doc_lengths: List[int] = []
+    for ordinal, _book, _chapter, _verse, text in iter_verses(corpus):
+        counts: Dict[str, int] = {}
+        for term in tokenize(text):
+            counts[term] = counts.get(term, 0) + 1
+        for term, tf in counts.items():
+            postings[term].append((ordinal, tf))
+        doc_lengths.append(sum(counts.values()))
+    return postings, doc_lengths, VerseMap.from_corpus(corpus)
+
+
+def write_index(postings: Postings, doc_lengths: List[int], verse_map: VerseMap,
+                out_dir: str, prefix_len: int = DEFAULT_PREFIX_LEN) -> dict:
+    os.makedirs(out_dir, exist_ok=True)
+
+    shards: Dict[str, Dict[str, List[Tuple[int, int]]]] = defaultdict(dict)
+    for term, plist in postings.items():
+        shards[shard_key(term, prefix_len)][term] = plist
+
+    shard_info = {}
+    for key in sorted(shards):
+        data = encode_shard(shards[key])
+        with open(os.path.join(out_dir, f"{key}.idx"), "wb") as f:
+            f.write(data)
+        shard_info[key] = {"terms": len(shards[key]), "bytes": len(data)}
+
+    with open(os.path.join(out_dir, DOCLENS_FILE), "wb") as f:
+        f.write(encode_varints(doc_lengths))
+    verse_map.save(os.path.join(out_dir, VERSES_FILE))
+
+    total_tokens = sum(doc_lengths)
+    return {
+        "version": INDEX_VERSION,
+        "prefix_len": prefix_len,
+        "documents": len(doc_lengths),
+        "terms": len(postings),
+        "tokens": total_tokens,
+        "avg_doc_length": round(total_tokens / len(doc_lengths), 4) if doc_lengths else 0,
+        "shards": shard_info,
+    }
+
+
+def index_size(out_dir: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(out_dir, name))
+        for name in os.listdir(out_dir)
+        if name.endswith(".idx") or name in (DOCLENS_FILE, VERSES_FILE)
+    )
+
+
+def append_history(history_path: str, row: dict) -> None:
+    exists = os.path.exists(history_path)
+    with io.open(history_path, "a", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=list(row.keys()))
+        if not exists:
+            w.writeheader()
+        w.writerow(row)
+
+
+def build_index(corpus_path: str, out_dir: str, prefix_len: int = DEFAULT_PREFIX_LEN,
+                release: str = "", history_path: str = None) -> dict:
+    start = time.perf_counter()
+    corpus = open_corpus(corpus_path)
+    postings, doc_lengths, verse_map = build_postings(corpus)
+    manifest = write_index(postings, doc_lengths, verse_map, out_dir, prefix_len)
+    build_seconds = time.perf_counter() - start
+
+    manifest["build"] = {
+        "release": release,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "seconds": round(build_seconds, 3),
+        "bytes": index_size(out_dir),
+    }
+    with io.open(os.path.join(out_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    if history_path:
+        append_history(history_path, {
+            "release": release,
+            "built_at": manifest["build"]["built_at"],
+            "documents": manifest["documents"],
+            "terms": manifest["terms"],
+            "shards": len(manifest["shards"]),
+            "bytes": manifest["build"]["bytes"],
+            "seconds": manifest["build"]["seconds"],
+        })
+    return manifest
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+class ShardedIndex:
+    """Reads a built index directory, loading each shard on first use"""
+
+    MAGIC = SHARD_MAGIC
+    decode = staticmethod(decode_postings)
+
+    def __init__(self, index_dir: str):
+        self.index_dir = index_dir
+        with io.open(os.path.join(index_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.prefix_len = self.manifest["prefix_len"]
+        self._shards: Dict[str, Tuple[bytes, Dict[str, Tuple[int, int]], int]] = {}
+        self._verse_map = None
+        self._doc_lengths = None
+
+    @property
+    def verse_map(self) -> VerseMap:
+        if self._verse_map is None:
+            self._verse_map = VerseMap.load(os.path.join(self.index_dir, VERSES_FILE))
+        return self._verse_map
+
+    @property
+    def doc_lengths(self) -> List[int]:
+        if self._doc_lengths is None:
+            with open(os.path.join(self.index_dir, DOCLENS_FILE), "rb") as f:
+                self._doc_lengths, _ = decode_varints(f.read(), self.manifest["documents"])
+        return self._doc_lengths
+
+    def _shard(self, key: str):
+        if key not in self._shards:
+            path = os.path.join(self.index_dir, f"{key}.idx")
+            if not os.path.exists(path):
+                self._shards[key] = (b"", {}, 0)
+            else:
+                with open(path, "rb") as f:
+                    buf = f.read()
+                terms, base = read_shard_terms(buf, self.MAGIC)
+                self._shards[key] = (buf, terms, base)
+        return self._shards[key]
+
+    def df(self, term: str) -> int:
+        _buf, terms, _base = self._shard(shard_key(term, self.prefix_len))
+        return terms.get(term, (0, 0))[1]
+
+    def postings(self, term: str) -> List[Tuple[int, int]]:
+        """[(ordinal, tf), ...] for a normalized term"""
+        buf, terms, base = self._shard(shard_key(term, self.prefix_len))
+        if term not in terms:
+            return []
+        offset, df = terms[term]
+        return self.decode(buf, base + offset, df)
+
+    def ordinals(self, term: str) -> List[int]:
+        return [ordinal for ordinal, _tf in self.postings(term)]
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build a sharded inverted search index")
+    parser.add_argument("corpus", help="Translation directory or full-Bible JSON")
+    parser.add_argument("--out_dir", default="../frontend/public/translations/index/", help="Index output directory")
+    parser.add_argument("--prefix-len", type=int, default=DEFAULT_PREFIX_LEN, help="Term prefix length per shard (default: 1)")
+    parser.add_argument("--release", default="", help="Release label recorded in the build history")
+    parser.add_argument("--history", default=os.path.join("build", HISTORY_FILE), help="CSV to append build time and size to ('' to skip)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.corpus):
+        print(f"Error: {args.corpus} not found!")
+        return 1
+
+    if args.history:
+        os.makedirs(os.path.dirname(args.history) or ".", exist_ok=True)
+    manifest = build_index(args.corpus, args.out_dir, args.prefix_len, args.release, args.history or None)
+
+    build = manifest["build"]
+    print(f"✓ Indexed {manifest['documents']} verses, {manifest['terms']} terms "
+          f"into {len(manifest['shards'])} shards in {args.out_dir}")
+    print(f"  Size: {build['bytes'] / 1024:.0f} KB, build time: {build['seconds']:.2f}s")
+    largest = max(manifest["shards"].items(), key=lambda kv: kv[1]["bytes"])
+    print(f"  Largest shard: {largest[0]}.idx ({largest[1]['bytes'] / 1024:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
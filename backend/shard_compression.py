@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Dictionary-compressed chapter shards for offline storage
+
+Per-chapter JSON is too small to compress well on its own, but the corpus
+is highly repetitive ("And it came to pass", "Yahuah Elohiym"). This trains
+one shared dictionary on all chapter shards and compresses every shard
+against it, then compares size and decode time with gzip/brotli per shard.
+
+Codecs for the trained dictionary:
+  zstd     zstandard.train_dictionary (pip install zstandard)
+  deflate  zlib preset dictionary built from frequent word n-grams (stdlib)
+
+Output (under <output_dir>/shards/):
+  dictionary.<codec>.bin
+  <book>/<chapter>.json.zst (or .json.zlib for deflate)
+  compression_report.json
+
+Usage:
+  python shard_compression.py ../frontend/public/translations/ ../frontend/public/translations/
+"""
+
+import argparse
+import gzip
+import io
+import json
+import os
+import sys
+import time
+import zlib
+from collections import Counter
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from corpus import open_corpus, to_array_chapter
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Fix Windows console encoding issues
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+# Deflate can only reference the last 32 KB, so a larger preset dictionary is wasted
+DEFLATE_DICT_SIZE = 32 * 1024
+ZSTD_DICT_SIZE = 64 * 1024
+
+DICT_CODECS = ("auto", "zstd", "deflate")
+SHARD_EXTENSIONS = {"zstd": "zst", "deflate": "zlib"}
+
+Shard = Tuple[str, str, bytes]
+
+
+def encode_chapter(verses: dict, schema: str = "object") -> bytes:
+    data = to_array_chapter(verses) if schema == "array" else verses
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def iter_chapter_shards(corpus, schema: str = "object") -> Iterator[Shard]:
+    """Yield (book, chapter, compact JSON bytes) in book order"""
+    for book, chapters in corpus.items():
+        for chapter_num in sorted(chapters.keys(), key=int):
+            yield book, chapter_num, encode_chapter(chapters[chapter_num], schema)
+
+
+def resolve_codec(codec: str) -> str:
+    if codec == "auto":
+        return "zstd" if zstandard is not None else "deflate"
+    if codec == "zstd" and zstandard is None:
+        raise RuntimeError("zstandard not installed. Run: pip install zstandard")
+    return codec
+
+
+def build_ngram_dictionary(samples: Sequence[bytes], size: int = DEFLATE_DICT_SIZE,
+                           min_n: int = 2, max_n: int = 6) -> bytes:
+    """
+    Preset dictionary from the most valuable word n-grams across samples.
+
+    Each n-gram is scored by count × length (bytes it could save). The best
+    ones are placed at the end, where deflate back-references are cheapest.
+    """
+    counts: Counter = Counter()
+    for sample in samples:
+        words = sample.split(b" ")
+        for n in range(min_n, max_n + 1):
+            counts.update(map(b" ".join, zip(*(words[k:] for k in range(n)))))
+
+    ranked = sorted(
+        (gram for gram, count in counts.items() if count > 1),
+        key=lambda gram: counts[gram] * len(gram),
+        reverse=True,
+    )
+
+    chosen: List[bytes] = []
+    covered = b""
+    total = 0
+    for gram in ranked:
+        piece = gram + b" "
+        if total + len(piece) > size or gram in covered:
+            continue
+        chosen.append(piece)
+        covered += b"\0" + piece
+        total += len(piece)
+        if total >= size - 8:
+            break
+
+    return b"".join(reversed(chosen))
+
+
+def train_dictionary(samples: Sequence[bytes], codec: str, size: Optional[int] = None) -> bytes:
+    if codec == "zstd":
+        return zstandard.train_dictionary(size or ZSTD_DICT_SIZE, list(samples)).as_bytes()
+    return build_ngram_dictionary(samples, size or DEFLATE_DICT_SIZE)
+
+
+def dict_compressor(codec: str, dictionary: bytes) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    """(compress, decompress) functions for a trained dictionary"""
+    if codec == "zstd":
+        zdict = zstandard.ZstdCompressionDict(dictionary)
+        cctx = zstandard.ZstdCompressor(level=19, dict_data=zdict)
+        dctx = zstandard.ZstdDecompressor(dict_data=zdict)
+        return cctx.compress, dctx.decompress
+
+    def compress(data: bytes) -> bytes:
+        c = zlib.compressobj(9, zlib.DEFLATED, 15, 9, zlib.Z_DEFAULT_STRATEGY, dictionary)
+        return c.compress(data) + c.flush()
+
+    def decompress(data: bytes) -> bytes:
+        d = zlib.decompressobj(15, dictionary)
+        return d.decompress(data) + d.flush()
+
+    return compress, decompress
+
+
+def baseline_codecs() -> Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]]:
+    """Per-shard codecs without a shared dictionary"""
+    codecs = {
+        "gzip": (lambda data: gzip.compress(data, 9, mtime=0), gzip.decompress),
+    }
+    if brotli is not None:
+        codecs["brotli"] = (lambda data: brotli.compress(data, quality=11), brotli.decompress)
+    if zstandard is not None:
+        cctx = zstandard.ZstdCompressor(level=19)
+        dctx = zstandard.ZstdDecompressor()
+        codecs["zstd"] = (cctx.compress, dctx.decompress)
+    return codecs
+
+
+def measure_decode(decompress: Callable[[bytes], bytes], blobs: Sequence[bytes]) -> float:
+    start = time.perf_counter()
+    for blob in blobs:
+        decompress(blob)
+    return time.perf_counter() - start
+
+
+def compress_shards(corpus, output_dir: str, schema: str = "object", codec: str = "auto",
+                    dict_size: Optional[int] = None) -> dict:
+    """Train a dictionary, write compressed shards and return the comparison report"""
+    codec = resolve_codec(codec)
+    shards = list(iter_chapter_shards(corpus, schema))
+    samples = [data for _book, _chapter, data in shards]
+
+    start = time.perf_counter()
+    dictionary = train_dictionary(samples, codec, dict_size)
+    train_time = time.perf_counter() - start
+
+    shard_dir = os.path.join(output_dir, "shards")
+    os.makedirs(shard_dir, exist_ok=True)
+    dict_path = os.path.join(shard_dir, f"dictionary.{codec}.bin")
+    with open(dict_path, "wb") as f:
+        f.write(dictionary)
+
+    codecs = baseline_codecs()
+    codecs[f"{codec}+dict"] = dict_compressor(codec, dictionary)
+
+    ext = SHARD_EXTENSIONS[codec]
+    per_shard: List[dict] = []
+    blobs: Dict[str, List[bytes]] = {name: [] for name in codecs}
+    for book, chapter, data in shards:
+        row = {"book": book, "chapter": chapter, "raw": len(data)}
+        for name, (compress, _decompress) in codecs.items():
+            blob = compress(data)
+            blobs[name].append(blob)
+            row[name] = len(blob)
+        per_shard.append(row)
+
+        book_dir = os.path.join(shard_dir, book)
+        os.makedirs(book_dir, exist_ok=True)
+        with open(os.path.join(book_dir, f"{chapter}.json.{ext}"), "wb") as f:
+            f.write(blobs[f"{codec}+dict"][-1])
+
+    totals = {"raw": sum(len(data) for data in samples)}
+    decode_us = {}
+    for name, (_compress, decompress) in codecs.items():
+        totals[name] = sum(len(blob) for blob in blobs[name])
+        decode_us[name] = measure_decode(decompress, blobs[name]) / len(shards) * 1e6
+
+    report = {
+        "codec": codec,
+        "schema": schema,
+        "shards": len(shards),
+        "dictionary_bytes": len(dictionary),
+        "dictionary_train_seconds": round(train_time, 3),
+        "totals": totals,
+        "decode_us_per_shard": {name: round(us, 2) for name, us in decode_us.items()},
+        "per_shard": per_shard,
+    }
+    with io.open(os.path.join(shard_dir, "compression_report.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return report
+
+
+def print_report(report: dict) -> None:
+    totals = report["totals"]
+    raw = totals["raw"]
+    print(f"\nShards: {report['shards']} ({report['schema']} schema), "
+          f"dictionary: {report['dictionary_bytes'] / 1024:.0f} KB "
+          f"trained in {report['dictionary_train_seconds']:.1f}s")
+    print(f"{'codec':<14}{'total':>10}{'ratio':>8}{'avg/shard':>11}{'decode/shard':>14}")
+    print(f"{'raw':<14}{raw / 1024:>8.0f}KB{1:>8.2f}{raw / report['shards']:>10.0f}B{'':>14}")
+    for name, decode in report["decode_us_per_shard"].items():
+        size = totals[name]
+        print(f"{name:<14}{size / 1024:>8.0f}KB{raw / size:>8.2f}"
+              f"{size / report['shards']:>10.0f}B{decode:>12.1f}us")
+    if brotli is None:
+        print("(brotli not installed - pip install brotli to include it)")
+    if zstandard is None:
+        print("(zstandard not installed - pip install zstandard for zstd and zstd+dict)")
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Write dictionary-compressed chapter shards")
+    parser.add_argument("corpus", help="Translation directory or full-Bible JSON")
+    parser.add_argument("output_dir", help="Directory to write shards/ into")
+    parser.add_argument("--codec", choices=DICT_CODECS, default="auto", help="Dictionary codec (default: zstd if installed, else deflate)")
+    parser.add_argument("--schema", choices=("object", "array"), default="object", help="Chapter schema inside each shard")
+    parser.add_argument("--dict-size", type=int, default=None, help="Dictionary size in bytes")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.corpus):
+        print(f"Error: {args.corpus} not found!")
+        return 1
+
+    try:
+        report = compress_shards(open_corpus(args.corpus), args.output_dir, args.schema, args.codec, args.dict_size)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+
+    print_report(report)
+    print(f"\n✓ Wrote shards to {os.path.join(args.output_dir, 'shards')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,12 +3,25 @@
 """
 Split Bible JSON into per-book files
 Reads restored_kjv.json and creates individual book files
+
+Schemas:
+  object  {chapter: {verse: text}} (default, what the app reads today)
+  array   [[verse text, ...], ...] with null for missing verses/chapters
+
+--dict-compress additionally writes dictionary-compressed chapter shards
+(see shard_compression.py).
 """
 
+import argparse
 import json
 import os
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+from corpus import normalize_book, to_array_book
+from shard_compression import compress_shards, print_report
+
+SCHEMAS = ('object', 'array')
 
 # Fix Windows console encoding issues
 if sys.platform == 'win32':
@@ -17,7 +30,41 @@ if sys.platform == 'win32':
     except Exception:
         pass
 
-def split_bible_json(input_file: str, output_dir: str) -> None:
+def dump_schema(data: Any, f, schema: str = 'object') -> None:
+    """Write JSON in the layout for the schema (array output is compact)"""
+    if schema == 'array':
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    else:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+def to_schema(book_data: Dict[str, Any], schema: str = 'object') -> Any:
+    return to_array_book(book_data) if schema == 'array' else book_data
+
+def write_book_files(bible_data: Dict[str, Any], output_dir: str, schema: str = 'object') -> Tuple[int, int]:
+    """Write one <book>.json per book, returning (books, verses) written"""
+    books_processed = 0
+    total_verses = 0
+    
+    for book_name, book_data in bible_data.items():
+        book_data = normalize_book(book_data)
+        
+        # Create book file
+        book_file = os.path.join(output_dir, f"{book_name}.json")
+        
+        with open(book_file, 'w', encoding='utf-8') as f:
+            dump_schema(to_schema(book_data, schema), f, schema)
+        
+        # Count verses in this book
+        book_verses = sum(len(chapter) for chapter in book_data.values())
+        total_verses += book_verses
+        
+        print(f"  ✓ {book_name}: {len(book_data)} chapters, {book_verses} verses")
+        books_processed += 1
+    
+    return books_processed, total_verses
+
+def split_bible_json(input_file: str, output_dir: str, schema: str = 'object',
+                     dict_codec: Optional[str] = None) -> None:
     """Split Bible JSON into per-book files"""
     
     # Read the full Bible JSON
@@ -30,28 +77,23 @@ def split_bible_json(input_file: str, output_dir: str) -> None:
     
     # Also copy the full file to the output directory
     full_output_path = os.path.join(output_dir, 'restored_kjv.json')
-    print(f"Copying full Bible to {full_output_path}...")
+    print(f"Copying full Bible to {full_output_path} ({schema} schema)...")
     with open(full_output_path, 'w', encoding='utf-8') as f:
-        json.dump(bible_data, f, indent=2, ensure_ascii=False)
+        full_data = {
+            book_name: to_schema(normalize_book(book_data), schema)
+            for book_name, book_data in bible_data.items()
+        }
+        dump_schema(full_data, f, schema)
     
     # Split into individual books
     print(f"Splitting into per-book files in {output_dir}...")
-    books_processed = 0
-    total_verses = 0
+    books_processed, total_verses = write_book_files(bible_data, output_dir, schema)
     
-    for book_name, book_data in bible_data.items():
-        # Create book file
-        book_file = os.path.join(output_dir, f"{book_name}.json")
-        
-        with open(book_file, 'w', encoding='utf-8') as f:
-            json.dump(book_data, f, indent=2, ensure_ascii=False)
-        
-        # Count verses in this book
-        book_verses = sum(len(chapter) for chapter in book_data.values())
-        total_verses += book_verses
-        
-        print(f"  ✓ {book_name}: {len(book_data)} chapters, {book_verses} verses")
-        books_processed += 1
+    # Optionally train a shared dictionary and write compressed chapter shards
+    if dict_codec:
+        print(f"\nCompressing chapter shards with a trained dictionary ({dict_codec})...")
+        normalized = {name: normalize_book(book) for name, book in bible_data.items()}
+        print_report(compress_shards(normalized, output_dir, schema, dict_codec))
     
     # Summary
     file_size = os.path.getsize(full_output_path) / (1024 * 1024)  # MB
@@ -63,20 +105,28 @@ def split_bible_json(input_file: str, output_dir: str) -> None:
 
 def main():
     """Main function"""
-    if len(sys.argv) != 3:
-        print("Usage: python split_bible.py <input.json> <output_dir>")
-        print("Example: python split_bible.py build/restored_kjv.json ../frontend/public/translations/")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Split Bible JSON into per-book files",
+        epilog="Example: python split_bible.py build/restored_kjv.json ../frontend/public/translations/",
+    )
+    parser.add_argument("input_file", help="Full Bible JSON (either schema)")
+    parser.add_argument("output_dir", help="Translation directory to write")
+    parser.add_argument("--schema", choices=SCHEMAS, default="object",
+                        help="Output schema (default: object)")
+    parser.add_argument("--dict-compress", nargs="?", const="auto", default=None,
+                        choices=("auto", "zstd", "deflate"), metavar="CODEC",
+                        help="Also write dictionary-compressed chapter shards (auto, zstd or deflate)")
+    args = parser.parse_args()
     
-    input_file = sys.argv[1]
-    output_dir = sys.argv[2]
+    input_file = args.input_file
+    output_dir = args.output_dir
     
     if not os.path.exists(input_file):
         print(f"Error: Input file {input_file} not found!")
         sys.exit(1)
     
     try:
-        split_bible_json(input_file, output_dir)
+        split_bible_json(input_file, output_dir, args.schema, args.dict_compress)
         print("\n✓ Bible splitting completed successfully!")
         return 0
     except Exception as e:
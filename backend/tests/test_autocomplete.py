@@ -0,0 +1,86 @@
+from autocomplete import Autocomplete, build_autocomplete, front_code
+
+KEYS = sorted([
+    "a", "aaron", "aaronic", "abase", "abased", "abel", "abide", "abiding",
+    "abraham", "abram", "yah", "yahuah", "yahuah elohiym", "yahusha", "yea", "year",
+])
+
+
+def autocomplete_for(keys, block_size=4):
+    return Autocomplete({
+        "block_size": block_size,
+        "blocks": front_code(keys, block_size),
+        "freq": [1] * len(keys),
+        "names": [],
+        "display": {},
+        "alias": {},
+        "top": {},
+    })
+
+
+def test_front_coding_round_trip():
+    blocks = front_code(KEYS, 4)
+    assert [block[0] for block in blocks] == KEYS[::4]
+    assert blocks[0][1:] == [[1, "aron"], [5, "ic"], [1, "base"]]
+
+    autocomplete = autocomplete_for(KEYS)
+    assert [autocomplete.key(i) for i in range(len(KEYS))] == KEYS
+
+
+def test_prefix_range_across_blocks():
+    autocomplete = autocomplete_for(KEYS)
+    # "ab..." starts in the first block and runs through the third
+    expected = [i for i, key in enumerate(KEYS) if key.startswith("ab")]
+    assert expected[0] // 4 != expected[-1] // 4
+    assert autocomplete.prefix_range("ab") == expected
+    # A prefix sorting before its block's head is found from the previous block
+    assert autocomplete.prefix_range("abr") == [KEYS.index("abraham"), KEYS.index("abram")]
+    assert autocomplete.prefix_range("yahuah") == [KEYS.index("yahuah"), KEYS.index("yahuah elohiym")]
+    assert autocomplete.prefix_range("a") == list(range(KEYS.index("abram") + 1))
+
+
+def build(verses, names=None, aliases=None, block_size=4):
+    corpus = {"Genesis": {"1": {str(i): text for i, text in enumerate(verses, 1)}}}
+    return Autocomplete(build_autocomplete(corpus, names or {}, aliases or {}, block_size))
+
+
+VERSES = ["year year year yea yea", "yahuah elohiym", "yarn yarn yarn yarn yarn", "yard"]
+NAMES = {"yahuah elohiym": {"label": "Yahuah Elohiym", "id": "yahuah-elohiym"}}
+
+
+def test_top_k_ordering():
+    autocomplete = build(VERSES, NAMES)
+    # Frequency first, names (and their words) count NAME_BOOST times,
+    # ties keep key order. 1-2 character prefixes use the precomputed top
+    # lists, longer ones the front-coded keys.
+    assert [s["key"] for s in autocomplete.suggest("y")] == [
+        "yarn", "yahuah", "yahuah elohiym", "year", "yea", "yard"]
+    assert [s["key"] for s in autocomplete.suggest("y", limit=2)] == ["yarn", "yahuah"]
+    assert [s["key"] for s in autocomplete.suggest("ya")] == ["yarn", "yahuah", "yahuah elohiym", "yard"]
+    assert [s["key"] for s in autocomplete.suggest("yea")] == ["year", "yea"]
+    assert [s["text"] for s in autocomplete.suggest("Yah")] == ["Yahuah", "Yahuah Elohiym"]
+    # A trailing space asks for the next word
+    assert [s["key"] for s in autocomplete.suggest("yahuah ")] == ["yahuah elohiym"]
+
+
+def test_empty_or_missing_prefix():
+    autocomplete = build(VERSES, NAMES)
+    assert autocomplete.suggest("") == []
+    assert autocomplete.suggest("   ") == []
+    assert autocomplete.suggest("?!") == []
+    assert autocomplete.suggest("q") == []
+    assert autocomplete.suggest("zzz") == []
+    assert autocomplete.prefix_range("zzz") == []
+    assert autocomplete.prefix_range("aaa") == []
+
+
+def test_lexicon_names_missing_from_corpus():
+    names = dict(NAMES)
+    names["adonai"] = {"label": "Adonai", "id": "adonai"}
+    names["el shaddai"] = {"label": "El Shaddai", "id": "el-shaddai"}
+    autocomplete = build(["In the beginning Yahuah Elohiym"], names)
+    # Names are entries even at zero occurrences; their words only when they occur
+    assert [(s["text"], s["freq"]) for s in autocomplete.suggest("ado")] == [("Adonai", 0)]
+    assert [s["key"] for s in autocomplete.suggest("el s")] == ["el shaddai"]
+    assert autocomplete.suggest("shad") == []
+    assert [s["text"] for s in autocomplete.suggest("yah")] == ["Yahuah", "Yahuah Elohiym"]
@@ -0,0 +1,45 @@
+import pytest
+
+from corpus import CorpusSlice
+from references import LAST_VERSE, Reference, parse_reference, parse_selection
+
+
+def test_chapter_range():
+    assert parse_reference("Genesis 1-3") == Reference("Genesis", 1, None, 3, None)
+
+
+def test_verse_range_across_chapters():
+    assert parse_reference("Gen 1:31-2:3") == Reference("Genesis", 1, 31, 2, 3)
+
+
+def test_chapter_to_verse_end_keeps_the_verse():
+    # "1-2:3" used to come back as "1-2", dropping ":3"
+    ref = parse_reference("Genesis 1-2:3")
+    assert ref == Reference("Genesis", 1, 1, 2, 3)
+    assert str(ref) == "Genesis 1:1-2:3"
+
+
+def test_single_chapter_book_number_is_a_verse():
+    assert parse_reference("Jude 3") == Reference("Jude", 1, 3, 1, 3)
+
+
+def test_selection_spans():
+    spans = parse_selection(["Genesis 1-2:3, Psalms", "Ruth 2"])
+    assert spans["Genesis"] == [((1, 1), (2, 3))]
+    assert spans["Psalms"] is None
+    assert spans["Ruth"] == [((2, 0), (2, LAST_VERSE))]
+
+
+def test_selection_slices_chapter_to_verse_end():
+    corpus = {"Genesis": {
+        "1": {"1": "a", "2": "b"},
+        "2": {"1": "c", "2": "d", "3": "e", "4": "f"},
+        "3": {"1": "g"},
+    }}
+    selected = CorpusSlice(corpus, parse_selection(["Genesis 1-2:3"]))
+    assert selected["Genesis"] == {"1": {"1": "a", "2": "b"}, "2": {"1": "c", "2": "d", "3": "e"}}
+
+
+def test_unrecognized_selection():
+    with pytest.raises(ValueError):
+        parse_selection(["Foo 1"])
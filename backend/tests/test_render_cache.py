@@ -0,0 +1,31 @@
+from render_cache import RenderCache
+
+
+def render(cache_dir, output, fragment_fp, artifact_fp):
+    cache = RenderCache(cache_dir)
+    cache.fragment_path("pdf", fragment_fp, ".pdf").write_bytes(b"part")
+    output.write_bytes(b"artifact")
+    cache.record(output, artifact_fp)
+
+
+def test_records_are_per_output(tmp_path):
+    cache_dir = tmp_path / "cache"
+    render(cache_dir, tmp_path / "a.pdf", "p1", "fp-a")
+    render(cache_dir, tmp_path / "b.pdf", "p2", "fp-b")
+
+    cache = RenderCache(cache_dir)
+    assert cache.is_fresh(tmp_path / "a.pdf", "fp-a")
+    assert cache.is_fresh(tmp_path / "b.pdf", "fp-b")
+    assert not cache.is_fresh(tmp_path / "a.pdf", "fp-b")
+    assert cache._load_artifacts() == {str(tmp_path / "a.pdf"): "fp-a", str(tmp_path / "b.pdf"): "fp-b"}
+
+
+def test_prune_keeps_recorded_fragments(tmp_path):
+    cache_dir = tmp_path / "cache"
+    render(cache_dir, tmp_path / "a.pdf", "old", "fp-1")
+    render(cache_dir, tmp_path / "a.pdf", "new", "fp-2")
+    render(cache_dir, tmp_path / "b.pdf", "gone", "fp-3")
+    (tmp_path / "b.pdf").unlink()
+
+    assert RenderCache(cache_dir).prune() == (1, 2)
+    assert sorted(p.name for p in (cache_dir / "pdf").iterdir()) == ["new.pdf"]
@@ -0,0 +1,45 @@
+import heapq
+import json
+
+import pytest
+
+from search import SearchEngine
+from search_index import build_index, tokenize
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # A rare term in a few short verses and one long verse with every term:
+    # the short verses set a high kth that the full match cannot reach
+    verses = ["alpha", "alpha", "alpha", "alpha beta gamma delta epsilon zeta eta theta"]
+    verses += ["beta filler"] * 40 + ["other words here"] * 40
+    corpus = tmp_path / "corpus.json"
+    corpus.write_text(json.dumps({"Genesis": {"1": {str(i): t for i, t in enumerate(verses, 1)}}}))
+    build_index(str(corpus), str(tmp_path / "index"), history_path=None)
+    return SearchEngine(str(tmp_path / "index"))
+
+
+def unpruned(engine, query, limit, require_all):
+    """BM25 over every posting of every term, without MaxScore"""
+    terms = list(dict.fromkeys(tokenize(query)))
+    scores, matched = {}, {}
+    for term in terms:
+        ordinals, impacts, _top = engine.impacts(term)
+        for ordinal, impact in zip(ordinals, impacts):
+            scores[ordinal] = scores.get(ordinal, 0.0) + impact
+            matched[ordinal] = matched.get(ordinal, 0) + 1
+    if require_all:
+        scores = {o: s for o, s in scores.items() if matched[o] == len(terms)}
+    return [o for o in heapq.nlargest(limit, sorted(scores), key=scores.__getitem__)]
+
+
+@pytest.mark.parametrize("require_all", [False, True])
+@pytest.mark.parametrize("limit", [1, 2, 20])
+def test_pruned_matches_unpruned(engine, require_all, limit):
+    for query in ("alpha beta", "beta alpha gamma", "alpha other"):
+        hits = [o for o, _score in engine.search(query, limit=limit, require_all=require_all)]
+        assert hits == unpruned(engine, query, limit, require_all)
+
+
+def test_all_terms_keeps_full_match(engine):
+    assert [o for o, _score in engine.search("alpha beta", limit=2, require_all=True)] == [3]
@@ -2,6 +2,7 @@ import { useState, useEffect } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { X, Copy, Check } from 'lucide-react';
 import { useBibleStore } from '../store/bibleStore';
+import { loadTranslation } from '../lib/data';
 
 interface ComparisonWidgetProps {
   verseRef: string; // e.g., "John 3:16"
@@ -48,13 +49,7 @@ export default function ComparisonWidget({ verseRef, onClose }: ComparisonWidget
 
     for (const translationId of selectedTranslations) {
       try {
-        const response = await fetch(`/translations/${translationId}.json`);
-        if (!response.ok) {
-          console.error(`Failed to load ${translationId}`);
-          continue;
-        }
-
-        const data = await response.json();
+        const data = await loadTranslation(translationId);
         const verseText = data[book]?.[chapter]?.[verseNum];
 
         if (verseText) {
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react';
 import { useBibleStore } from '../store/bibleStore';
+import { type BibleData, loadTranslation } from '../lib/data';
 import { loadHebrewLexicon } from '../lib/nameHighlighter';
 import Verse from './Verse';
 import LoadingSpinner from './LoadingSpinner';
@@ -12,8 +13,8 @@ interface ParallelViewProps {
 
 export default function ParallelView({ book, chapter, verse }: ParallelViewProps) {
   const { } = useBibleStore();
-  const [kjvData, setKjvData] = useState<any>(null);
-  const [restoredData, setRestoredData] = useState<any>(null);
+  const [kjvData, setKjvData] = useState<BibleData | null>(null);
+  const [restoredData, setRestoredData] = useState<BibleData | null>(null);
   const [loading, setLoading] = useState(true);
   const [highlightedVerse, setHighlightedVerse] = useState<string | null>(verse || null);
 
@@ -22,14 +23,10 @@ export default function ParallelView({ book, chapter, verse }: ParallelViewProps
       setLoading(true);
       try {
         // Load KJV
-        const kjvResponse = await fetch('/translations/kjv.json');
-        const kjv = await kjvResponse.json();
-        setKjvData(kjv);
+        setKjvData(await loadTranslation('kjv'));
 
         // Load Restored KJV
-        const restoredResponse = await fetch('/translations/restored_kjv.json');
-        const restored = await restoredResponse.json();
-        setRestoredData(restored);
+        setRestoredData(await loadTranslation('restored_kjv'));
 
         // Load Hebrew lexicon for highlighting
         await loadHebrewLexicon();
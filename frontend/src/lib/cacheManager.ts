@@ -2,6 +2,8 @@
  * Advanced cache manager for Bible data with LRU eviction and prefetching
  */
 
+import { normalizeBibleData } from './data';
+
 interface CacheEntry<T> {
   data: T;
   timestamp: number;
@@ -247,7 +249,7 @@ export async function getCachedBibleData(
       throw new Error(`Failed to load ${translation}`);
     }
     
-    const data = await response.json();
+    const data = normalizeBibleData(await response.json());
     bibleCache.set(cacheKey, data);
     return data;
   } catch (error) {
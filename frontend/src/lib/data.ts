@@ -6,6 +6,41 @@ export interface BibleData {
   };
 }
 
+// Array schema (backend/split_bible.py --schema array): a book is a list of
+// chapters and a chapter a list of verse texts, where index i holds number
+// i + 1 and null marks a missing verse or chapter.
+export type ArrayChapter = Array<string | null>;
+export type ArrayBook = (ArrayChapter | null)[];
+
+export function fromArrayChapter(chapter: ArrayChapter): BibleData[string][string] {
+  const verses: BibleData[string][string] = {};
+  chapter.forEach((text, verseIdx) => {
+    if (text !== null) verses[String(verseIdx + 1)] = text;
+  });
+  return verses;
+}
+
+export function fromArrayBook(book: ArrayBook): BibleData[string] {
+  const chapters: BibleData[string] = {};
+  book.forEach((chapter, chapterIdx) => {
+    if (chapter) chapters[String(chapterIdx + 1)] = fromArrayChapter(chapter);
+  });
+  return chapters;
+}
+
+// Accept a book in either schema and return the object shape the app uses
+export function normalizeBook(book: BibleData[string] | ArrayBook): BibleData[string] {
+  return Array.isArray(book) ? fromArrayBook(book) : book;
+}
+
+export function normalizeBibleData(data: Record<string, BibleData[string] | ArrayBook>): BibleData {
+  const result: BibleData = {};
+  for (const [bookName, book] of Object.entries(data)) {
+    result[bookName] = normalizeBook(book);
+  }
+  return result;
+}
+
 export interface Translation {
   id: string;
   label: string;
@@ -52,7 +87,7 @@ export async function loadTranslation(id: string): Promise<BibleData> {
           throw new Error(`Failed to load translation: ${response.statusText}`);
         }
         
-        const data = await response.json();
+        const data = normalizeBibleData(await response.json());
         
         // Cache the data for offline use
         await set(`bible-${id}`, data);
@@ -69,7 +104,7 @@ export async function loadTranslation(id: string): Promise<BibleData> {
         cache: 'force-cache' 
       });
       if (response.ok) {
-        const data = await response.json();
+        const data = normalizeBibleData(await response.json());
         await set(`bible-${id}`, data);
         return data;
       }
@@ -134,22 +169,6 @@ export async function loadFullBible(
     // Check cache (IndexedDB)
     const cached = await get(`bible-${id}`);
     if (cached) {
-      // Attempt to merge extras into cached data
-      try {
-        const extrasResponse = await fetch(`/translations/${id}.extras.json`, { cache: 'no-cache' });
-        if (extrasResponse.ok) {
-          const extras = await extrasResponse.json();
-          if (extras && typeof extras === 'object') {
-            const target = cached as Record<string, unknown>;
-            for (const [bookName, chapters] of Object.entries(extras)) {
-              target[bookName] = chapters as unknown;
-            }
-            await set(`bible-${id}`, cached);
-          }
-        }
-      } catch {
-        // ignore
-      }
       onProgress?.(100);
       return cached;
     }
@@ -157,6 +176,29 @@ export async function loadFullBible(
     // Fetch with progress tracking and timeout
     const controller = new AbortController();
     const timeoutId = setTimeout(() => controller.abort(), LOAD_TIMEOUT);
+
+    // Translations published as a stream (backend/publish_stream.py) are
+    // parsed book by book while they download; the rest load <id>.json
+    try {
+      const streamed = await streamBible(
+        id,
+        undefined,
+        (percent) => onProgress?.(Math.min(percent, 95)),
+        controller.signal
+      );
+      if (Object.keys(streamed).length > 0) {
+        clearTimeout(timeoutId);
+        await set(`bible-${id}`, streamed);
+        onProgress?.(100);
+        return streamed;
+      }
+    } catch (streamError) {
+      if (controller.signal.aborted) {
+        clearTimeout(timeoutId);
+        throw new Error('Loading timeout - please check your connection and try again');
+      }
+      logger.info(`No stream for ${id}, loading ${id}.json`, streamError);
+    }
     
     let response;
     try {
@@ -181,7 +223,7 @@ export async function loadFullBible(
     
     if (!reader || !contentLength) {
       // Fallback to simple load
-      const data = await response.json();
+      const data = normalizeBibleData(await response.json());
       await set(`bible-${id}`, data);
       onProgress?.(100);
       return data;
@@ -230,21 +272,10 @@ export async function loadFullBible(
       throw new Error('Bible data is empty - please try reloading');
     }
 
-    // Attempt to load optional extras file and merge if present
-    try {
-      const extrasResponse = await fetch(`/translations/${id}.extras.json`, { cache: 'no-cache' });
-      if (extrasResponse.ok) {
-        const extras = await extrasResponse.json();
-        if (extras && typeof extras === 'object') {
-          const target = data as Record<string, unknown>;
-          for (const [bookName, chapters] of Object.entries(extras)) {
-            target[bookName] = chapters as unknown;
-          }
-        }
-      }
-    } catch {
-      // Ignore if no extras available
-    }
+    data = normalizeBibleData(data);
+
+    // Extras (Enoch, Apocrypha) are merged into the translation at build
+    // time by backend/merge_extras.py, so there is nothing to fetch here.
     
     // Cache the data
     await set(`bible-${id}`, data);
@@ -258,6 +289,67 @@ export async function loadFullBible(
   }
 }
 
+// Progressive load from /translations/<id>.ndjson (backend/publish_stream.py):
+// one book (--unit book) or one chapter (--unit chapter) per line, priority
+// books first, so each book is available as soon as its lines arrive instead
+// of after the whole translation downloads. onBook receives the book's
+// chapters so far after every line; the result is in canonical book order.
+type StreamRecord =
+  | { book: string; chapters: BibleData[string] | ArrayBook }
+  | { book: string; chapter: string; verses: BibleData[string][string] | ArrayChapter };
+
+export async function streamBible(
+  id: string = 'restored_kjv',
+  onBook?: (book: string, chapters: BibleData[string]) => void,
+  onProgress?: (percent: number) => void,
+  signal?: AbortSignal
+): Promise<BibleData> {
+  const response = await fetch(`/translations/${id}.ndjson`, { signal });
+  if (!response.ok || !response.body) {
+    throw new Error(`Failed to stream translation: ${response.statusText}`);
+  }
+
+  const result: BibleData = {};
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder('utf-8');
+  const contentLength = +(response.headers.get('Content-Length') ?? 0);
+  let receivedLength = 0;
+  let buffered = '';
+
+  const handleLine = (line: string) => {
+    if (!line.trim()) return;
+    const record = JSON.parse(line) as StreamRecord;
+    if ('chapters' in record) {
+      result[record.book] = normalizeBook(record.chapters);
+    } else {
+      const verses = Array.isArray(record.verses) ? fromArrayChapter(record.verses) : record.verses;
+      result[record.book] = { ...result[record.book], [record.chapter]: verses };
+    }
+    onBook?.(record.book, result[record.book]);
+  };
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    receivedLength += value.length;
+    if (contentLength) onProgress?.(Math.round((receivedLength / contentLength) * 100));
+    buffered += decoder.decode(value, { stream: true });
+    let newline = buffered.indexOf('\n');
+    while (newline !== -1) {
+      handleLine(buffered.slice(0, newline));
+      buffered = buffered.slice(newline + 1);
+      newline = buffered.indexOf('\n');
+    }
+  }
+  handleLine(buffered + decoder.decode());
+
+  const ordered: BibleData = {};
+  for (const book of [...BOOKS_ORDER, ...Object.keys(result)]) {
+    if (book in result && !(book in ordered)) ordered[book] = result[book];
+  }
+  return ordered;
+}
+
 // Preload priority books (Genesis + Matthew)
 export async function preloadPriorityBooks(_id: string): Promise<Partial<BibleData>> {
   void _id;
@@ -270,7 +362,7 @@ export async function preloadPriorityBooks(_id: string): Promise<Partial<BibleDa
         const response = await fetch(`/translations/${book}.json`);
         if (response.ok) {
           const bookData = await response.json();
-          result[book] = bookData;
+          result[book] = normalizeBook(bookData);
           logger.info(`Preloaded ${book}`);
         }
       } catch (error) {